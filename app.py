@@ -1,5 +1,6 @@
 import logging
 import os
+import time
 import uuid
 from datetime import datetime
 
@@ -10,6 +11,7 @@ from scripts.Elevenlabs_functions import (
     fetch_voices,
     generate_audio,
     get_voice_id,
+    stream_audio,
 )
 from scripts.functions import detect_phonetic_conversion, detect_string_variables
 from scripts.openrouter_functions import (
@@ -30,6 +32,11 @@ from utils.model_capabilities import supports_audio_tags, supports_speed
 from utils.security import escape_html_content, validate_text_length
 from utils.session_manager import cleanup_old_sessions, get_session_single_dir
 
+# Streamed clips start playing once this much audio has arrived (~1s at 128 kbps)
+STREAM_PREVIEW_FIRST_BYTES = 16 * 1024
+# Each preview refresh restarts the player; the finished clip is always shown
+STREAM_PREVIEW_MAX_REFRESHES = 3
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
@@ -377,6 +384,19 @@ st.session_state["voice_settings"] = {
 if supports_speed(selected_model_id) and voice_speed is not None:
     st.session_state["voice_settings"]["speed"] = voice_speed
 
+stream_playback = st.checkbox(
+    "Stream playback",
+    help=(
+        "Start playing while the clip is still being generated, using the streaming endpoint. "
+        "This is a best-effort preview: the player reloads a few times as audio arrives, "
+        "so playback may skip or restart briefly until the finished clip is shown."
+    ),
+)
+skip_cache = st.checkbox(
+    "Regenerate (skip cache)",
+    help="Always call ElevenLabs, even if the same text and settings were generated before.",
+)
+
 # Generate audio with progress tracking
 if st.button("Generate Audio"):
     if not script_to_use:
@@ -396,7 +416,7 @@ if st.button("Generate Audio"):
             output_path = os.path.join(single_output_dir, temp_filename)
 
             progress.update(25, "Initializing audio generation")
-            success = generate_audio(
+            tts_args = (
                 st.session_state["ELEVENLABS_API_KEY"],
                 voice_stability,
                 selected_model_id,
@@ -406,8 +426,62 @@ if st.button("Generate Audio"):
                 selected_voice_id,
                 script_to_use,
                 output_path,
-                speed=voice_speed if supports_speed(selected_model_id) else None,
             )
+            tts_speed = voice_speed if supports_speed(selected_model_id) else None
+            if stream_playback:
+                stream_preview = st.empty()
+                preview = {
+                    "path": None,
+                    "size": 0,
+                    "shown": 0,
+                    "refreshes": 0,
+                    "started": None,
+                }
+
+                def show_preview(force: bool = False):
+                    # Each refresh restarts the player, so refresh a few times
+                    # at doubling sizes and resume about where playback was
+                    if not force and (
+                        preview["refreshes"] >= STREAM_PREVIEW_MAX_REFRESHES
+                        or preview["size"]
+                        < max(STREAM_PREVIEW_FIRST_BYTES, 2 * preview["shown"])
+                    ):
+                        return
+                    if preview["started"] is None:
+                        preview["started"] = time.monotonic()
+                        progress.update(50, "Playing while streaming")
+                    stream_preview.audio(
+                        preview["path"],
+                        format="audio/mp3",
+                        autoplay=True,
+                        start_time=int(time.monotonic() - preview["started"]),
+                    )
+                    preview["shown"] = preview["size"]
+                    preview["refreshes"] += 1
+
+                def receive_audio(partial_path: str, size: int):
+                    # The player reads the audio from the file being written
+                    preview["path"], preview["size"] = partial_path, size
+                    show_preview()
+
+                stream_result = stream_audio(
+                    *tts_args,
+                    speed=tts_speed,
+                    use_cache=not skip_cache,
+                    on_progress=receive_audio,
+                )
+                if preview["shown"] < stream_result["bytes"]:
+                    preview["path"] = output_path
+                    show_preview(force=True)
+                st.caption(
+                    f"First audio after {stream_result['first_audio_seconds']:.1f}s, "
+                    f"complete after {stream_result['total_seconds']:.1f}s"
+                )
+                success = True
+            else:
+                success = generate_audio(
+                    *tts_args, speed=tts_speed, use_cache=not skip_cache
+                )
 
             if success:
                 progress.complete()
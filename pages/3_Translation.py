@@ -14,10 +14,24 @@ from scripts.openrouter_functions import (
     get_openrouter_api_key,
     search_models_fuzzy,
 )
-from scripts.Translation_functions import translate_script
+from scripts.Translation_functions import translate_script, translate_to_languages
 from utils.error_handling import handle_error
 from utils.security import MAX_TEXT_LENGTH, escape_html_content, validate_text_length
 
+# Target languages offered for translation
+LANGUAGES = [
+    "Spanish",
+    "French",
+    "German",
+    "Italian",
+    "Portuguese",
+    "Dutch",
+    "Chinese",
+    "Japanese",
+    "Korean",
+    "Russian",
+]
+
 try:
     with open("custom_style.css", encoding="utf-8") as css:
         css_content = css.read()
@@ -172,20 +186,11 @@ st.divider()
 text = st.text_area("Enter text to translate", max_chars=MAX_TEXT_LENGTH)
 
 # Select language
-language = st.selectbox(
-    "Select target language",
-    [
-        "Spanish",
-        "French",
-        "German",
-        "Italian",
-        "Portuguese",
-        "Dutch",
-        "Chinese",
-        "Japanese",
-        "Korean",
-        "Russian",
-    ],
+language = st.selectbox("Select target language", LANGUAGES)
+extra_languages = st.multiselect(
+    "Also translate to",
+    [option for option in LANGUAGES if option != language],
+    help="Translations into several languages are requested at the same time.",
 )
 
 # Generate translation
@@ -215,8 +220,16 @@ if st.button("Translate") and text:
             )
 
     with st.spinner("Translating..."):
-        translation = translate_script(text, language, model=model_to_use)
-        st.write("Translation:")
+        if extra_languages:
+            translations = translate_to_languages(
+                text, [language, *extra_languages], model=model_to_use
+            )
+        else:
+            translations = {
+                language: translate_script(text, language, model=model_to_use)
+            }
+    for target, translation in translations.items():
+        st.write(f"Translation ({target}):" if extra_languages else "Translation:")
         # Escape translation content before display to prevent XSS
         safe_translation = escape_html_content(translation)
         st.write(safe_translation)
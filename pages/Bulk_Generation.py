@@ -5,34 +5,442 @@ allowing users to process CSV files with multiple text entries and generate
 audio files in batch with variable replacement support.
 """
 
+import io
 import os
 
 import pandas as pd
 import streamlit as st
 
+from scripts.bulk_planning import split_bulk_csv, split_bulk_rows
+from scripts.bulk_preprocessing import read_bulk_rows, scan_bulk_csv
 from scripts.Elevenlabs_functions import (
+    BULK_REPORT_FILENAME,
+    BULK_STATUS_OK,
+    BULK_STATUS_SKIPPED,
+    DEFAULT_BULK_WORKERS,
+    MAX_BULK_WORKERS,
     bulk_generate_audio,
+    estimate_bulk_generation,
     fetch_models,
     fetch_voices,
     get_voice_id,
 )
 from utils.api_keys import get_elevenlabs_api_key
+from utils.archive import ArchiveCache, open_download
+from utils.bulk_manifest import BulkManifest
+from utils.bulk_progress import format_bulk_progress, format_duration
 from utils.error_handling import (
+    APIError,
     ConfigurationError,
+    ProgressManager,
     handle_error,
     validate_api_key,
 )
+from utils.job_queue import (
+    ACTIVE_JOB_STATUSES,
+    JOB_QUEUED,
+    JOB_SUCCEEDED,
+    JobFunction,
+    get_job_queue,
+)
 from utils.model_capabilities import supports_speed
 from utils.security import (
-    MAX_CSV_SIZE,
-    MAX_DF_ROWS,
+    MAX_BULK_CSV_SIZE,
+    MAX_BULK_ROWS,
     sanitize_path_component,
     validate_column_name,
     validate_csv_file_size,
     validate_dataframe_rows,
     validate_path_within_base,
 )
-from utils.session_manager import cleanup_old_sessions, get_session_bulk_dir
+from utils.session_manager import (
+    cleanup_old_sessions,
+    get_session_bulk_dir,
+    get_session_id,
+)
+
+JOB_POLL_SECONDS = 2  # How often the jobs panel refreshes while a job is active
+JOBS_SHOWN = 5
+JOB_URL_PARAM = "job"  # Query parameter holding the token of the latest job
+CHUNKED_ROWS_SHOWN = 10
+
+
+def make_bulk_job(
+    api_key: str,
+    model_id: str,
+    voice_id: str,
+    csv_data: bytes,
+    output_dir: str,
+    voice_settings: dict,
+    max_workers: int,
+    resume: bool,
+    continue_on_error: bool,
+    max_characters: int | None = None,
+) -> JobFunction:
+    """Wrap a bulk generation run as a background job.
+
+    The CSV is passed as bytes because the uploaded file object belongs to
+    the script run that submitted the job.
+
+    Args:
+        api_key (str): ElevenLabs API key.
+        model_id (str): ID of the model to use.
+        voice_id (str): ID of the voice to use.
+        csv_data (bytes): Contents of the uploaded CSV.
+        output_dir (str): Bulk output directory.
+        voice_settings (dict): Voice settings for every row.
+        max_workers (int): Rows generated in parallel.
+        resume (bool): Skip rows completed by a previous run.
+        continue_on_error (bool): Keep going when a row fails.
+        max_characters (int | None): Character budget of the run, if any.
+
+    Returns:
+        JobFunction: Job for :meth:`utils.job_queue.JobQueue.submit`.
+    """
+
+    def run(progress) -> tuple[bool, str]:
+        def report(snapshot: dict) -> None:
+            progress(snapshot["rows_processed"], snapshot)
+
+        try:
+            return bulk_generate_audio(
+                api_key,
+                model_id,
+                voice_id,
+                io.BytesIO(csv_data),
+                output_dir,
+                voice_settings,
+                max_workers=max_workers,
+                use_cache=True,
+                resume=resume,
+                continue_on_error=continue_on_error,
+                progress_callback=report,
+                max_characters=max_characters,
+            )
+        except APIError as e:
+            return False, (
+                f"{e}. Rows that finished before the error were saved; "
+                "generate the file again to resume where it stopped."
+            )
+
+    return run
+
+
+def follow_job_from_url(session_id: str) -> list[str]:
+    """Follow the job whose token is in the page URL.
+
+    A refreshed page starts a new Streamlit session with a new session ID.
+    The URL carries only the token of the last job started here, so the new
+    session can keep showing that job and offer its files, but nothing else
+    from the previous session.
+
+    Args:
+        session_id (str): Current session ID.
+
+    Returns:
+        List[str]: IDs of jobs from other sessions that this session follows.
+    """
+    followed = st.session_state.setdefault("bulk_followed_jobs", [])
+    token = st.query_params.get(JOB_URL_PARAM)
+    if token:
+        job = get_job_queue().get_by_token(token)
+        if job is None:
+            del st.query_params[JOB_URL_PARAM]
+        elif job["session_id"] != session_id and job["id"] not in followed:
+            followed.append(job["id"])
+    return followed
+
+
+def list_bulk_jobs(session_id: str, followed: list[str]) -> list[dict]:
+    """List this session's jobs followed by the jobs it follows by URL.
+
+    Args:
+        session_id (str): Session whose jobs are listed.
+        followed (List[str]): Job IDs from :func:`follow_job_from_url`.
+
+    Returns:
+        List[dict]: Job rows.
+    """
+    job_queue = get_job_queue()
+    jobs = job_queue.list_jobs(session_id, limit=JOBS_SHOWN)
+    for job_id in followed:
+        job = job_queue.get(job_id)
+        if job is not None:
+            jobs.append(job)
+    return jobs
+
+
+def offer_job_files(job: dict) -> None:
+    """Offer the audio files and report of a followed job as a ZIP download.
+
+    Args:
+        job (dict): Finished job whose ``job_key`` is its output directory.
+
+    Returns:
+        None
+    """
+    output_dir = job["job_key"]
+    if not output_dir or not os.path.isdir(output_dir):
+        st.caption("Its files have been cleaned up.")
+        return
+    file_paths = [
+        os.path.join(output_dir, name)
+        for name in sorted(os.listdir(output_dir))
+        if name.endswith(".mp3") or name == BULK_REPORT_FILENAME
+    ]
+    if not st.button("Prepare ZIP", key=f"build_job_{job['id']}"):
+        return
+    # Shown on this rerun only; Streamlit reads the whole archive each time
+    archives = st.session_state.setdefault("zip_archives", ArchiveCache())
+    _, archive = archives.build(file_paths, base_dir=output_dir)
+    with open_download(archive) as data:
+        st.download_button(
+            label="⬇️ Download files",
+            data=data,
+            file_name=f"{os.path.basename(output_dir)}.zip",
+            mime="application/zip",
+            key=f"download_job_{job['id']}",
+        )
+
+
+def render_bulk_jobs(session_id: str, followed: list[str]) -> None:
+    """Show this session's background bulk jobs and the ones it follows.
+
+    When a job that was running on the previous refresh has finished, the
+    whole page is rerun so the result report and file lists pick it up.
+
+    Args:
+        session_id (str): Session whose jobs are listed.
+        followed (List[str]): Job IDs from :func:`follow_job_from_url`.
+
+    Returns:
+        None
+    """
+    job_queue = get_job_queue()
+    jobs = list_bulk_jobs(session_id, followed)
+    active = {job["id"] for job in jobs if job["status"] in ACTIVE_JOB_STATUSES}
+    finished = st.session_state.get("bulk_active_jobs", set()) - active
+    st.session_state["bulk_active_jobs"] = active
+    if finished:
+        st.rerun()
+    if not jobs:
+        return
+
+    st.markdown("#### Bulk jobs")
+    for job in jobs:
+        label = job["label"]
+        if job["status"] in ACTIVE_JOB_STATUSES:
+            if job["details"]:
+                status = format_bulk_progress(job["details"])
+            else:
+                status = f"{job['done']} of {job['total']} rows"
+            ProgressManager(total_steps=job["total"]).update(
+                job["done"], f"{label}: {job['status']}, {status}"
+            )
+            if job["status"] == JOB_QUEUED and st.button(
+                "Cancel", key=f"cancel_job_{job['id']}"
+            ):
+                job_queue.cancel(job["id"])
+                st.rerun()
+        elif job["status"] == JOB_SUCCEEDED:
+            st.success(f"{label}: Bulk generation completed!")
+            st.write(job["message"])
+            if job["details"]:
+                st.caption(format_bulk_progress(job["details"]))
+            if job["id"] in followed:
+                offer_job_files(job)
+        else:
+            st.error(f"{label}: bulk generation {job['status']}.")
+            if job["message"]:
+                st.write(job["message"])
+
+
+def scan_upload(uploaded_file) -> dict:
+    """Scan an uploaded bulk CSV once per upload.
+
+    Every widget interaction reruns the page; the scan is kept in the session
+    so the file is only parsed again when a different file is uploaded.
+
+    Args:
+        uploaded_file: The uploaded CSV.
+
+    Returns:
+        dict: Result of :func:`scripts.bulk_preprocessing.scan_bulk_csv`.
+    """
+    cached = st.session_state.get("bulk_csv_scan")
+    if cached and cached[0] == uploaded_file.file_id:
+        return cached[1]
+    scan = scan_bulk_csv(uploaded_file)
+    st.session_state["bulk_csv_scan"] = (uploaded_file.file_id, scan)
+    return scan
+
+
+def plan_upload(
+    uploaded_file,
+    output_dir: str,
+    model_id: str,
+    voice_id: str,
+    voice_settings: dict,
+    max_workers: int,
+    resume: bool,
+) -> dict:
+    """Estimate the bulk run for an upload, reusing the last estimate.
+
+    The estimate is kept in the session until the file, a setting or the
+    number of rows completed by earlier runs changes.
+
+    Args:
+        uploaded_file: The uploaded CSV.
+        output_dir (str): Bulk output directory of the uploaded CSV.
+        model_id (str): ID of the selected model.
+        voice_id (str): ID of the selected voice.
+        voice_settings (dict): Voice settings for every row.
+        max_workers (int): Rows generated in parallel.
+        resume (bool): Skip rows completed by a previous run.
+
+    Returns:
+        dict: Result of
+        :func:`scripts.Elevenlabs_functions.estimate_bulk_generation`.
+    """
+    plan_key = (
+        uploaded_file.file_id,
+        output_dir,
+        model_id,
+        voice_id,
+        tuple(sorted(voice_settings.items())),
+        max_workers,
+        resume,
+        BulkManifest(output_dir).completed_count(),
+    )
+    cached = st.session_state.get("bulk_run_plan")
+    if cached and cached[0] == plan_key:
+        return cached[1]
+    plan = estimate_bulk_generation(
+        model_id,
+        voice_id,
+        uploaded_file,
+        output_dir,
+        voice_settings,
+        max_workers=max_workers,
+        use_cache=True,
+        resume=resume,
+    )
+    st.session_state["bulk_run_plan"] = (plan_key, plan)
+    return plan
+
+
+def render_bulk_plan(plan: dict, max_workers: int) -> None:
+    """Show what a bulk run will cost before it is started.
+
+    Args:
+        plan (dict): Estimate from :func:`plan_upload`.
+        max_workers (int): Rows generated in parallel.
+
+    Returns:
+        None
+    """
+    st.markdown("#### Run estimate")
+    st.write(
+        f"{plan['rows']} rows with {plan['chars']:,} characters after filling in placeholders "
+        f"(longest row: {plan['max_row_chars']:,})."
+    )
+    savings = []
+    if plan["skipped_rows"]:
+        savings.append(f"{plan['skipped_rows']} rows already generated")
+    if plan["duplicate_rows"]:
+        savings.append(
+            f"{plan['duplicate_rows']} rows repeat another row ({plan['duplicate_chars']:,} characters)"
+        )
+    if plan["cached_rows"]:
+        savings.append(
+            f"{plan['cached_rows']} rows in the audio cache ({plan['cached_chars']:,} characters)"
+        )
+    if savings:
+        st.write("Not billed: " + "; ".join(savings) + ".")
+    st.write(
+        f"**{plan['billable_chars']:,} characters** (about {plan['credits']:,.0f} credits) "
+        f"in {plan['requests']} requests, roughly {format_duration(plan['estimated_seconds'])} "
+        f"at {max_workers} concurrent requests."
+    )
+    if plan["chunked_rows"]:
+        shown = ", ".join(str(row) for row in plan["chunked_rows"][:CHUNKED_ROWS_SHOWN])
+        st.info(
+            f"{len(plan['chunked_rows'])} rows are longer than {plan['chunk_size']:,} "
+            f"characters (rows {shown}) and will be generated in chunks joined into one file."
+        )
+    with st.expander("Characters per row"):
+        st.dataframe(plan["row_chars"].rename("characters"))
+
+
+def failed_rows_csv(uploaded_file, report_path: str, rows: list[int]) -> bytes:
+    """Get the CSV of the rows that did not complete, cached per upload and run.
+
+    Reading the rows parses the whole upload, so the result is kept in session
+    state until another file is uploaded or the report is rewritten.
+
+    Args:
+        uploaded_file: The uploaded CSV.
+        report_path (str): Result report the rows come from.
+        rows (List[int]): Row numbers that did not complete.
+
+    Returns:
+        bytes: The rows as CSV.
+    """
+    key = (uploaded_file.file_id, os.stat(report_path).st_mtime_ns)
+    cached = st.session_state.get("bulk_failed_rows")
+    if cached and cached[0] == key:
+        return cached[1]
+    failed_rows = read_bulk_rows(uploaded_file, rows)
+    data = failed_rows.to_csv(index=False).encode("utf-8")
+    st.session_state["bulk_failed_rows"] = (key, data)
+    return data
+
+
+def render_bulk_report(output_dir: str, uploaded_file) -> None:
+    """Show the result report of the last run for this CSV, if there is one.
+
+    Offers the full report and the CSV rows that did not complete as
+    downloads, so failed rows can be fixed and retried on their own.
+
+    Args:
+        output_dir (str): Bulk output directory of the uploaded CSV.
+        uploaded_file: The uploaded CSV.
+
+    Returns:
+        None
+    """
+    report_path = os.path.join(output_dir, BULK_REPORT_FILENAME)
+    if not os.path.exists(report_path):
+        return
+
+    report = pd.read_csv(report_path)
+    done = report["status"].isin([BULK_STATUS_OK, BULK_STATUS_SKIPPED])
+    st.markdown("#### Last run results")
+    st.write(
+        f"{int(done.sum())} of {len(report)} rows completed, {int((~done).sum())} did not."
+    )
+    if not done.all():
+        st.dataframe(report[~done], hide_index=True)
+
+    with open(report_path, "rb") as f:
+        st.download_button(
+            label="📥 Download result report",
+            data=f.read(),
+            file_name=f"{os.path.basename(output_dir)}_{BULK_REPORT_FILENAME}",
+            mime="text/csv",
+            key="download_bulk_report",
+        )
+    if not done.all():
+        st.download_button(
+            label="📥 Download failed rows as CSV",
+            data=failed_rows_csv(
+                uploaded_file, report_path, report.loc[~done, "row"].tolist()
+            ),
+            file_name=f"{os.path.basename(output_dir)}_failed.csv",
+            mime="text/csv",
+            key="download_failed_rows",
+            help="Fix and upload this file to retry only the rows that did not complete.",
+        )
 
 
 def main() -> None:
@@ -57,6 +465,8 @@ def main() -> None:
 
     # Cleanup old sessions on page load
     cleanup_old_sessions()
+    session_id = get_session_id()
+    followed_jobs = follow_job_from_url(session_id)
 
     with open("custom_style.css", encoding="utf-8") as css:
         st.markdown(f"<style>{css.read()}</style>", unsafe_allow_html=True)
@@ -159,6 +569,15 @@ def main() -> None:
         voice_style = st.slider("Voice style", 0.0, 1.0, 0.0)
         speaker_boost = st.checkbox("Use speaker boost")
 
+    concurrent_requests = st.slider(
+        "Concurrent requests",
+        min_value=1,
+        max_value=MAX_BULK_WORKERS,
+        value=DEFAULT_BULK_WORKERS,
+        step=1,
+        help="Maximum number of rows generated in parallel. Keep this at or below the concurrency limit of your ElevenLabs plan; it is lowered automatically while ElevenLabs reports rate limiting.",
+    )
+
     voice_settings_dict = {
         "stability": voice_stability,
         "similarity_boost": voice_similarity,
@@ -205,26 +624,28 @@ def main() -> None:
     if uploaded_file is not None:
         try:
             # Validate file size
-            if not validate_csv_file_size(uploaded_file.size):
+            if not validate_csv_file_size(uploaded_file.size, MAX_BULK_CSV_SIZE):
                 st.error(
                     f"⚠️ File size ({uploaded_file.size / (1024*1024):.2f} MB) exceeds maximum allowed size "
-                    f"({MAX_CSV_SIZE / (1024*1024):.2f} MB). Please use a smaller file."
+                    f"({MAX_BULK_CSV_SIZE / (1024*1024):.2f} MB). Please use a smaller file."
                 )
                 st.stop()
 
-            df = pd.read_csv(uploaded_file)
+            # Parsed in chunks; the rows themselves are read by the job
+            csv_scan = scan_upload(uploaded_file)
+            row_count = csv_scan["rows"]
 
             # Validate DataFrame row count
-            if not validate_dataframe_rows(len(df)):
+            if not validate_dataframe_rows(row_count, MAX_BULK_ROWS):
                 st.error(
-                    f"⚠️ CSV file contains {len(df)} rows, which exceeds the maximum allowed ({MAX_DF_ROWS} rows). "
+                    f"⚠️ CSV file contains {row_count} rows, which exceeds the maximum allowed ({MAX_BULK_ROWS} rows). "
                     f"Please split your file into smaller batches."
                 )
                 st.stop()
 
             # Validate column names
             invalid_columns = [
-                col for col in df.columns if not validate_column_name(str(col))
+                col for col in csv_scan["columns"] if not validate_column_name(str(col))
             ]
             if invalid_columns:
                 st.error(
@@ -234,51 +655,144 @@ def main() -> None:
                 st.stop()
 
             # Validate required 'text' column exists
-            if "text" not in df.columns:
+            if "text" not in csv_scan["columns"]:
                 st.error("⚠️ CSV file must contain a 'text' column.")
                 st.stop()
 
+            # Catch placeholders that no column fills before anything is generated
+            unknown = csv_scan["unknown_placeholders"]
+            if unknown:
+                st.error(
+                    "⚠️ These placeholders have no matching column: "
+                    + ", ".join(f"{{{name}}}" for name in unknown)
+                    + ". Add the columns or fix the templates."
+                )
+                st.stop()
+
             st.write("CSV file uploaded successfully. Preview:")
-            st.write(df.head())
+            st.write(csv_scan["preview"])
 
-            if st.button("Generate Bulk Audio"):
-                # Sanitize CSV filename to prevent path traversal
-                raw_filename = uploaded_file.name.split(".")[0]
-                sanitized_filename = sanitize_path_component(raw_filename)
+            # Sanitize CSV filename to prevent path traversal
+            raw_filename = uploaded_file.name.split(".")[0]
+            sanitized_filename = sanitize_path_component(raw_filename)
 
-                # Use session-based bulk directory
-                output_dir = get_session_bulk_dir(sanitized_filename)
+            # Use session-based bulk directory
+            output_dir = get_session_bulk_dir(sanitized_filename)
 
-                # Validate that output directory is within session outputs
-                outputs_base = os.path.join(os.getcwd(), "outputs")
-                if not validate_path_within_base(output_dir, outputs_base):
-                    st.error(
-                        "⚠️ Invalid output directory path. Path traversal detected."
-                    )
-                    st.stop()
-
-                success, message = bulk_generate_audio(
-                    ELEVENLABS_API_KEY,
-                    selected_model_id,
-                    selected_voice_id,
-                    uploaded_file,
-                    output_dir,
-                    voice_settings_dict,
+            # Validate that output directory is within session outputs
+            outputs_base = os.path.join(os.getcwd(), "outputs")
+            if not validate_path_within_base(output_dir, outputs_base):
+                st.error("⚠️ Invalid output directory path. Path traversal detected.")
+                st.stop()
+
+            # Offer to pick up a previous run of the same file where it stopped
+            resume_job = True
+            previous_rows = BulkManifest(output_dir).completed_count()
+            if previous_rows:
+                st.info(
+                    f"A previous run of this file already generated {previous_rows} of {row_count} rows. "
+                    "Rows with unchanged text, voice, model and settings will be skipped."
                 )
+                resume_job = st.checkbox(
+                    "Resume previous run",
+                    value=True,
+                    help="Uncheck to regenerate every row from the start.",
+                )
+
+            continue_on_error = st.checkbox(
+                "Keep going when a row fails",
+                value=True,
+                help="Generate every other row and list the failures in the result report instead of stopping at the first error.",
+            )
 
-                if success:
-                    st.success("Bulk generation completed!")
-                    st.write(message)
-                else:
-                    st.error(
-                        "Bulk generation failed or produced no results. Please check the logs for more information."
+            # Estimate characters, credits and time before anything is sent
+            character_budget = int(
+                st.number_input(
+                    "Character budget (0 for no limit)",
+                    min_value=0,
+                    value=0,
+                    step=1000,
+                    help="Refuse runs that would bill more characters than this. Files over the budget can be downloaded in parts that fit.",
+                )
+            )
+            plan = plan_upload(
+                uploaded_file,
+                output_dir,
+                selected_model_id,
+                selected_voice_id,
+                voice_settings_dict,
+                int(concurrent_requests),
+                resume_job,
+            )
+            render_bulk_plan(plan, int(concurrent_requests))
+
+            run_blocked = False
+            if character_budget and plan["billable_chars"] > character_budget:
+                run_blocked = True
+                parts = split_bulk_rows(plan["row_chars"], character_budget)
+                st.error(
+                    f"⚠️ This run needs {plan['billable_chars']:,} characters, more than "
+                    f"your budget of {character_budget:,}. Download it in {len(parts)} parts "
+                    "that each fit and generate them one at a time."
+                )
+                base_name = os.path.splitext(uploaded_file.name)[0]
+                for number, part in enumerate(
+                    split_bulk_csv(uploaded_file, parts), start=1
+                ):
+                    st.download_button(
+                        label=f"📥 Download part {number} of {len(parts)}",
+                        data=part,
+                        file_name=f"{base_name}_part{number}.csv",
+                        mime="text/csv",
+                        key=f"download_part_{number}",
                     )
+
+            job_queue = get_job_queue()
+            active_job = job_queue.find_active(output_dir)
+            if active_job:
+                st.info(
+                    f"This file is being generated in the background ({active_job['status']}). "
+                    "You can leave this page and come back; progress is shown below."
+                )
+            elif st.button("Generate Bulk Audio", disabled=run_blocked):
+                uploaded_file.seek(0)
+                job_id = job_queue.submit(
+                    session_id,
+                    uploaded_file.name,
+                    make_bulk_job(
+                        ELEVENLABS_API_KEY,
+                        selected_model_id,
+                        selected_voice_id,
+                        uploaded_file.read(),
+                        output_dir,
+                        voice_settings_dict,
+                        max_workers=int(concurrent_requests),
+                        resume=resume_job,
+                        continue_on_error=continue_on_error,
+                        max_characters=character_budget or None,
+                    ),
+                    total=row_count,
+                    job_key=output_dir,
+                )
+                st.query_params[JOB_URL_PARAM] = job_queue.get(job_id)["token"]
+                st.toast("Bulk generation started in the background.")
+
+            render_bulk_report(output_dir, uploaded_file)
         except Exception as e:
             st.error(f"An error occurred while processing the CSV file: {str(e)}")
             st.write("Error details:", str(e))
     else:
         st.info("Please upload a CSV file to begin bulk generation.")
 
+    # Jobs keep running across reruns; poll them while any is active
+    jobs = list_bulk_jobs(session_id, followed_jobs)
+    if any(job["status"] in ACTIVE_JOB_STATUSES for job in jobs):
+        st.fragment(run_every=JOB_POLL_SECONDS)(render_bulk_jobs)(
+            session_id, followed_jobs
+        )
+    else:
+        render_bulk_jobs(session_id, followed_jobs)
+
 
 if __name__ == "__main__":
     main()
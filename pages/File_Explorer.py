@@ -5,13 +5,14 @@ generated audio files, with support for both single and bulk outputs.
 Files are organized by session for privacy in multi-user deployments.
 """
 
-import io
 import os
 import re
-import zipfile
 
 import streamlit as st
 
+from utils.archive import ArchiveCache, open_download
+from utils.bulk_progress import format_duration
+from utils.mp3 import read_mp3_info
 from utils.security import escape_html_content, validate_path_within_base
 from utils.session_manager import (
     cleanup_old_sessions,
@@ -76,24 +77,97 @@ def parse_bulk_filename(filename: str) -> dict[str, str]:
     return {"filename": filename}
 
 
-def create_zip_archive(file_paths: list[str], zip_filename: str) -> bytes:
-    """Create a ZIP archive from file paths.
+def offer_zip_download(
+    label: str,
+    file_paths: list[str],
+    file_name: str,
+    key: str,
+    base_dir: str | None = None,
+) -> None:
+    """Offer files as a ZIP download, building the archive only when asked.
+
+    The page shows a button; when it is clicked the archive is built, or
+    taken from the session's :class:`utils.archive.ArchiveCache` if none of
+    the files changed since (names, modification times and sizes), and a
+    download button for it is shown on that rerun only. Other reruns do not
+    touch the archive, as Streamlit reads the whole download into memory
+    every time a download button is shown.
 
     Args:
-        file_paths (List[str]): List of file paths to include in ZIP archive.
-        zip_filename (str): Name for the ZIP file (used for internal naming).
+        label (str): Label of the button that builds the archive.
+        file_paths (List[str]): Files to include.
+        file_name (str): Name of the downloaded ZIP file.
+        key (str): Unique widget key for this download.
+        base_dir (Optional[str]): Name members relative to this directory;
+            by file name if None.
 
     Returns:
-        bytes: Binary data containing the ZIP archive file.
+        None
+
+    Raises:
+        OSError: If the archive cannot be built.
     """
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for file_path in file_paths:
-            if os.path.exists(file_path):
-                arcname = os.path.basename(file_path)
-                zip_file.write(file_path, arcname)
-    zip_buffer.seek(0)
-    return zip_buffer.read()
+    if not st.button(label, key=f"build_{key}"):
+        return
+    archives = st.session_state.setdefault("zip_archives", ArchiveCache())
+    _, archive = archives.build(file_paths, base_dir=base_dir)
+
+    size_mb = archive.seek(0, os.SEEK_END) / (1024 * 1024)
+    with open_download(archive) as data:
+        st.download_button(
+            label=f"⬇️ Save {file_name} ({size_mb:.1f} MB)",
+            data=data,
+            file_name=file_name,
+            mime="application/zip",
+            key=key,
+        )
+
+
+def get_clip_info(file_path: str) -> dict | None:
+    """Get the duration and bitrate of a clip.
+
+    Only the tags and the start of the audio are read (see
+    :func:`utils.mp3.read_mp3_info`), and results are kept in the session
+    until the file's modification time or size changes.
+
+    Args:
+        file_path (str): Path to the MP3 file.
+
+    Returns:
+        Optional[dict]: Result of :func:`utils.mp3.read_mp3_info`, or None if
+            the file cannot be read or holds no MP3 frames.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    clip_cache = st.session_state.setdefault("clip_info", {})
+    version = (stat.st_mtime, stat.st_size)
+    cached = clip_cache.get(file_path)
+    if cached and cached[0] == version:
+        return cached[1]
+    try:
+        info = read_mp3_info(file_path)
+    except OSError:
+        return None
+    if not info["frames"]:
+        info = None
+    clip_cache[file_path] = (version, info)
+    return info
+
+
+def describe_clip(info: dict | None) -> str:
+    """Describe a clip's duration and bitrate for display.
+
+    Args:
+        info (Optional[dict]): Result of :func:`get_clip_info`.
+
+    Returns:
+        str: e.g. "0:12 at 128 kbps", or "unknown" without info.
+    """
+    if not info:
+        return "unknown"
+    return f"{format_duration(info['duration'])} at {info['bitrate']} kbps"
 
 
 # --- Bulk Outputs ---
@@ -141,13 +215,13 @@ else:
 
     if all_bulk_files:
         try:
-            zip_data = create_zip_archive(all_bulk_files, f"bulk_{session_id[:8]}.zip")
-            st.download_button(
-                label="📦 Download All Bulk Files",
-                data=zip_data,
-                file_name=f"bulk_{session_id[:8]}.zip",
-                mime="application/zip",
-                key="download_all_bulk",
+            # Subfolders keep files of different CSVs with the same name apart
+            offer_zip_download(
+                "📦 Download All Bulk Files",
+                all_bulk_files,
+                f"bulk_{session_id[:8]}.zip",
+                "download_all_bulk",
+                base_dir=session_bulk_dir,
             )
         except Exception as e:
             st.warning(f"Could not create bulk download: {str(e)}")
@@ -155,20 +229,23 @@ else:
     for group_name, group_path, group_files in bulk_groups:
         # Escape group name before display
         safe_group_name = escape_html_content(group_name)
-        with st.expander(f"Bulk: {safe_group_name}"):
+        group_infos = {
+            f: get_clip_info(os.path.join(group_path, f)) for f in group_files
+        }
+        group_duration = sum(info["duration"] for info in group_infos.values() if info)
+        with st.expander(
+            f"Bulk: {safe_group_name} ({len(group_files)} files, "
+            f"{format_duration(group_duration)})"
+        ):
             # Download button for this group
             group_files_full = [os.path.join(group_path, f) for f in group_files]
             if group_files_full:
                 try:
-                    group_zip = create_zip_archive(
-                        group_files_full, f"{safe_group_name}.zip"
-                    )
-                    st.download_button(
-                        label=f"📦 Download {safe_group_name}",
-                        data=group_zip,
-                        file_name=f"{safe_group_name}.zip",
-                        mime="application/zip",
-                        key=f"bulk_dl_{group_name}",
+                    offer_zip_download(
+                        f"📦 Download {safe_group_name}",
+                        group_files_full,
+                        f"{safe_group_name}.zip",
+                        f"bulk_dl_{group_name}",
                     )
                 except Exception as e:
                     st.caption(f"Download unavailable: {str(e)}")
@@ -184,6 +261,7 @@ else:
                 with col2:
                     st.write(f"**Filename:** {safe_filename}")
                     st.write(f"**Source CSV:** {safe_group_name}")
+                    st.write(f"**Duration:** {describe_clip(group_infos[audio_file])}")
                 with col3:
                     if os.path.exists(file_path):
                         try:
@@ -223,15 +301,11 @@ else:
     all_single_paths = [os.path.join(session_single_dir, f) for f in single_files]
     if all_single_paths:
         try:
-            zip_data = create_zip_archive(
-                all_single_paths, f"single_{session_id[:8]}.zip"
-            )
-            st.download_button(
-                label="📦 Download All Single Files",
-                data=zip_data,
-                file_name=f"single_{session_id[:8]}.zip",
-                mime="application/zip",
-                key="download_all_single",
+            offer_zip_download(
+                "📦 Download All Single Files",
+                all_single_paths,
+                f"single_{session_id[:8]}.zip",
+                "download_all_single",
             )
         except Exception as e:
             st.warning(f"Could not create single files download: {str(e)}")
@@ -246,6 +320,7 @@ else:
             st.audio(file_path)
         with col2:
             st.write(f"**Filename:** {safe_filename}")
+            st.write(f"**Duration:** {describe_clip(get_clip_info(file_path))}")
             if meta:
                 st.write(f"**Language:** {escape_html_content(meta['lang'])}")
                 st.write(f"**Voice:** {escape_html_content(meta['voice'])}")
@@ -18,6 +18,7 @@ from scripts.openrouter_functions import (
     search_models_fuzzy,
 )
 from utils.api_keys import get_api_key
+from utils.audio_cache import get_audio_cache
 from utils.error_handling import (
     APIError,
     ConfigurationError,
@@ -25,6 +26,7 @@ from utils.error_handling import (
     test_api_key_actual,
     validate_api_key,
 )
+from utils.retry import get_retry_stats
 
 EXPECTED_KEYS = [
     ("ELEVENLABS_API_KEY", "ElevenLabs"),
@@ -480,6 +482,18 @@ def main() -> None:
         """
     )
 
+    cache_stats = get_audio_cache().get_stats()
+    st.caption(
+        f"Audio cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+        f"({cache_stats['hit_ratio']:.0%} hit ratio), "
+        f"{cache_stats['bytes_saved'] / (1024 * 1024):.1f} MB not re-generated"
+    )
+    retry_stats = get_retry_stats().values()
+    st.caption(
+        f"API retries: {sum(stats['retries'] for stats in retry_stats)} transient failures retried, "
+        f"{sum(stats['gave_up'] for stats in retry_stats)} gave up"
+    )
+
 
 if __name__ == "__main__":
     main()
@@ -7,6 +7,10 @@ including voice management, audio generation, and voice preview functionality.
 import json
 import logging
 import os
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, BinaryIO
 
 try:
@@ -17,13 +21,62 @@ except ImportError:
 
 import base64
 
-from utils.caching import st_cache
+from scripts.bulk_planning import plan_bulk_run
+from scripts.bulk_preprocessing import read_bulk_jobs
+from utils import http_client
+from utils.atomic_files import atomic_write
+from utils.audio_cache import get_audio_cache, make_audio_cache_key, place_file
+from utils.bulk_manifest import BulkManifest
+from utils.bulk_progress import BulkProgress
+from utils.caching import single_flight, st_cache
 from utils.error_handling import APIError, ValidationError
-from utils.model_capabilities import supports_speed
-from utils.security import sanitize_filename, validate_path_within_base
-
-
-@st_cache(ttl_minutes=60)
+from utils.model_capabilities import supports_request_stitching, supports_speed
+from utils.mp3 import concat_mp3_files, skip_id3v2_stream
+from utils.rate_limiter import AdaptiveScheduler, transient_error_from_response
+from utils.retry import send_with_retry
+from utils.security import validate_path_within_base
+from utils.text_chunking import STITCHING_CONTEXT_CHARS, get_chunk_size, split_text
+
+# Bulk generation concurrency. ElevenLabs caps concurrent requests per
+# subscription tier (2 on Free up to 15 on Scale/Business plans).
+DEFAULT_BULK_WORKERS = 1
+MAX_BULK_WORKERS = 15
+
+# Bytes read per chunk when streaming audio responses to disk
+AUDIO_CHUNK_SIZE = 64 * 1024
+
+# Text chunks of a long script generate_audio requests at once
+DEFAULT_CHUNK_WORKERS = 3
+
+# Bytes read per chunk by stream_audio; small so playback can start early
+STREAM_CHUNK_SIZE = 4 * 1024
+
+ELEVENLABS_MODELS_URL = "https://api.elevenlabs.io/v1/models"
+ELEVENLABS_VOICES_URL = "https://api.elevenlabs.io/v1/voices"
+ELEVENLABS_TTS_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+ELEVENLABS_TTS_STREAM_URL = (
+    "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
+)
+
+# Per-row bulk result report, written next to the generated files
+BULK_REPORT_FILENAME = "bulk_report.csv"
+BULK_REPORT_COLUMNS = ["row", "status", "latency", "bytes", "output_path", "error"]
+BULK_STATUS_OK = "ok"
+BULK_STATUS_FAILED = "failed"
+BULK_STATUS_SKIPPED = "skipped"
+BULK_STATUS_CANCELLED = "cancelled"
+
+# Model and voice lists older than the cache TTL are served while a background
+# refresh runs, but never once they are this far past it
+CATALOG_MAX_STALE_MINUTES = 12 * 60
+
+
+@st_cache(
+    ttl_minutes=60,
+    stale_while_revalidate=True,
+    max_stale_minutes=CATALOG_MAX_STALE_MINUTES,
+)
+@single_flight
 def fetch_models(api_key: str) -> list[tuple[str, str]]:
     """Fetch available models from ElevenLabs API.
 
@@ -36,11 +89,15 @@ def fetch_models(api_key: str) -> list[tuple[str, str]]:
     Raises:
         APIError: If the API request fails or returns an error response.
     """
-    url = "https://api.elevenlabs.io/v1/models"
+    url = ELEVENLABS_MODELS_URL
     headers = {"xi-api-key": api_key}
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = send_with_retry(
+            "fetch_models",
+            lambda: http_client.get(url, headers=headers, timeout=30),
+            idempotent=True,
+        )
         response.raise_for_status()
         models = response.json()
         return [(model["model_id"], model["name"]) for model in models]
@@ -48,7 +105,12 @@ def fetch_models(api_key: str) -> list[tuple[str, str]]:
         raise APIError("Failed to fetch models", str(e))
 
 
-@st_cache(ttl_minutes=60)
+@st_cache(
+    ttl_minutes=60,
+    stale_while_revalidate=True,
+    max_stale_minutes=CATALOG_MAX_STALE_MINUTES,
+)
+@single_flight
 def fetch_voices(api_key: str) -> list[tuple[str, str]]:
     """Fetch available voices from ElevenLabs API.
 
@@ -61,11 +123,15 @@ def fetch_voices(api_key: str) -> list[tuple[str, str]]:
     Raises:
         APIError: If the API request fails or returns an error response.
     """
-    url = "https://api.elevenlabs.io/v1/voices"
+    url = ELEVENLABS_VOICES_URL
     headers = {"xi-api-key": api_key}
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = send_with_retry(
+            "fetch_voices",
+            lambda: http_client.get(url, headers=headers, timeout=30),
+            idempotent=True,
+        )
         response.raise_for_status()
         voices = response.json()["voices"]
         return [(voice["voice_id"], voice["name"]) for voice in voices]
@@ -73,6 +139,34 @@ def fetch_voices(api_key: str) -> list[tuple[str, str]]:
         raise APIError("Failed to fetch voices", str(e))
 
 
+def _stream_response_to_file(
+    response: Any, output_path: str, chunk_size: int = AUDIO_CHUNK_SIZE
+) -> int:
+    """Write a streamed HTTP response body to disk atomically.
+
+    The body is read in ``chunk_size`` pieces through :func:`utils.atomic_files.atomic_write`,
+    so memory use stays bounded by the chunk size.
+
+    Args:
+        response (requests.Response): Response opened with ``stream=True``.
+        output_path (str): Final path of the audio file.
+        chunk_size (int, optional): Bytes read per chunk. Defaults to AUDIO_CHUNK_SIZE.
+
+    Returns:
+        int: Number of bytes written.
+    """
+    bytes_written = 0
+    try:
+        with atomic_write(output_path) as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    f.write(chunk)
+                    bytes_written += len(chunk)
+    finally:
+        response.close()
+    return bytes_written
+
+
 @st_cache(ttl_minutes=60)
 def get_voice_id(voices: list[tuple[str, str]], selected_voice_name: str) -> str | None:
     """Get voice ID for selected voice name.
@@ -90,40 +184,33 @@ def get_voice_id(voices: list[tuple[str, str]], selected_voice_name: str) -> str
     return None
 
 
-def generate_audio(
-    xi_api_key: str,
-    stability: float,
+def _build_tts_payload(
+    text_to_speak: str,
     model_id: str,
+    stability: float,
     similarity_boost: float,
     style: float,
     use_speaker_boost: bool,
-    voice_id: str,
-    text_to_speak: str,
-    output_path: str = "output.mp3",
     language_code: str | None = None,
     speed: float | None = None,
-) -> bool:
-    """Generate audio using ElevenLabs Text-to-Speech API.
+) -> dict[str, Any]:
+    """Validate text-to-speech parameters and build the request body.
 
     Args:
-        xi_api_key (str): ElevenLabs API key for authentication.
-        stability (float): Voice stability between 0 and 1.
+        text_to_speak (str): Text to convert to speech.
         model_id (str): ID of the model to use for generation.
+        stability (float): Voice stability between 0 and 1.
         similarity_boost (float): Voice similarity boost between 0 and 1.
         style (float): Voice style between 0 and 1.
         use_speaker_boost (bool): Whether to use speaker boost.
-        voice_id (str): ID of the voice to use.
-        text_to_speak (str): Text to convert to speech.
-        output_path (str, optional): Path to save the audio file. Defaults to "output.mp3".
         language_code (Optional[str], optional): Language code for multilingual models. Defaults to None.
-        speed (Optional[float], optional): Speed multiplier between 0.5 and 2.0. Available for models that support speed control (multilingual and turbo/flash v2+ models). Defaults to None.
+        speed (Optional[float], optional): Speed multiplier between 0.5 and 2.0. Defaults to None.
 
     Returns:
-        bool: Success status of the audio generation.
+        Dict[str, Any]: JSON payload for the text-to-speech endpoint.
 
     Raises:
         ValidationError: If any of the input parameters are invalid.
-        APIError: If the API request fails or returns an error response.
     """
     # Validate parameters
     if not (0 <= stability <= 1):
@@ -142,9 +229,6 @@ def generate_audio(
     if speed is not None and not (0.5 <= speed <= 2.0):
         raise ValidationError("Speed must be between 0.5 and 2.0")
 
-    tts_url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-    headers = {"xi-api-key": xi_api_key, "Content-Type": "application/json"}
-
     payload: dict[str, str | int | dict[str, float | bool]] = {
         "text": text_to_speak,
         "model_id": model_id,
@@ -160,20 +244,294 @@ def generate_audio(
         payload["voice_settings"]["speed"] = speed
     if language_code:
         payload["language_code"] = language_code
+    return payload
 
-    logging.info(
-        "Sending request to ElevenLabs API with payload: %s",
-        json.dumps(payload, indent=2),
+
+def _tts_cache_key(
+    voice_id: str, payload: dict[str, Any], language_code: str | None = None
+) -> str:
+    """Build the audio cache key for a text-to-speech payload.
+
+    Args:
+        voice_id (str): ID of the voice.
+        payload (Dict[str, Any]): Payload from :func:`_build_tts_payload`.
+        language_code (Optional[str], optional): Language code. Defaults to None.
+
+    Returns:
+        str: Key for :class:`utils.audio_cache.AudioCache`.
+    """
+    settings = dict(payload["voice_settings"])
+    speed = settings.pop("speed", None)
+    return make_audio_cache_key(
+        payload["text"],
+        voice_id,
+        payload["model_id"],
+        settings,
+        speed=speed,
+        language_code=language_code,
     )
 
+
+def _open_tts_response(
+    xi_api_key: str, tts_url: str, payload: dict[str, Any]
+) -> "requests.Response":
+    """Send one text-to-speech request and return the streamed response.
+
+    Args:
+        xi_api_key (str): ElevenLabs API key for authentication.
+        tts_url (str): Text-to-speech endpoint for the voice.
+        payload (Dict[str, Any]): Payload from :func:`_build_tts_payload`.
+
+    Returns:
+        requests.Response: Successful response opened with ``stream=True``;
+        the caller reads and closes it.
+
+    Raises:
+        TransientAPIError: If the API is rate limiting (HTTP 429) or overloaded (5xx).
+        requests.exceptions.RequestException: If the request fails.
+    """
+    headers = {"xi-api-key": xi_api_key, "Content-Type": "application/json"}
+
+    # Paid request: only retried if it never reached ElevenLabs. 429/5xx
+    # are left to the caller (the bulk scheduler adapts concurrency to them)
+    response = send_with_retry(
+        "generate_audio",
+        lambda: http_client.post(
+            tts_url, headers=headers, json=payload, timeout=30, stream=True
+        ),
+        idempotent=False,
+        retry_statuses=(),
+    )
+    throttled = transient_error_from_response(response, "Failed to generate audio")
+    if throttled:
+        response.close()
+        raise throttled
     try:
-        response = requests.post(tts_url, headers=headers, json=payload, timeout=30)
         response.raise_for_status()
+    except requests.exceptions.HTTPError:
+        response.close()
+        raise
+    return response
+
+
+def _post_tts(
+    xi_api_key: str,
+    voice_id: str,
+    payload: dict[str, Any],
+    output_path: str,
+    scheduler: AdaptiveScheduler | None = None,
+) -> int:
+    """Send one text-to-speech request and stream the audio to a file.
+
+    Args:
+        xi_api_key (str): ElevenLabs API key for authentication.
+        voice_id (str): ID of the voice to use.
+        payload (Dict[str, Any]): Payload from :func:`_build_tts_payload`.
+        output_path (str): Path to save the audio file.
+        scheduler (Optional[AdaptiveScheduler], optional): Scheduler to run
+            the request through, which reruns it if it is rejected with 429.
+            Defaults to None (sent directly).
 
-        with open(output_path, "wb") as f:
-            f.write(response.content)
+    Returns:
+        int: Number of bytes written.
 
-        logging.info("Audio generated successfully")
+    Raises:
+        TransientAPIError: If the API is rate limiting (HTTP 429) or overloaded (5xx).
+        requests.exceptions.RequestException: If the request fails.
+    """
+    if scheduler is not None:
+        return scheduler.run(_post_tts, xi_api_key, voice_id, payload, output_path)
+    response = _open_tts_response(
+        xi_api_key, ELEVENLABS_TTS_URL.format(voice_id=voice_id), payload
+    )
+    return _stream_response_to_file(response, output_path)
+
+
+def _chunk_payloads(payload: dict[str, Any], chunks: list[str]) -> list[dict[str, Any]]:
+    """Build one request payload per text chunk.
+
+    Models that support request stitching get the end of the previous chunk
+    and the start of the next one as context, so the chunks join smoothly.
+
+    Args:
+        payload (Dict[str, Any]): Payload for the whole text.
+        chunks (List[str]): Text chunks from :func:`utils.text_chunking.split_text`.
+
+    Returns:
+        List[Dict[str, Any]]: Payloads in chunk order; just ``payload`` if
+        the text fits in one chunk.
+    """
+    if len(chunks) <= 1:
+        return [payload]
+    stitching = supports_request_stitching(payload["model_id"])
+    payloads = []
+    for number, chunk in enumerate(chunks):
+        chunk_payload = {**payload, "text": chunk}
+        if stitching and number > 0:
+            chunk_payload["previous_text"] = chunks[number - 1][
+                -STITCHING_CONTEXT_CHARS:
+            ]
+        if stitching and number < len(chunks) - 1:
+            chunk_payload["next_text"] = chunks[number + 1][:STITCHING_CONTEXT_CHARS]
+        payloads.append(chunk_payload)
+    return payloads
+
+
+def _generate_chunked_audio(
+    xi_api_key: str,
+    voice_id: str,
+    payload: dict[str, Any],
+    chunks: list[str],
+    output_path: str,
+    max_workers: int = DEFAULT_CHUNK_WORKERS,
+    scheduler: AdaptiveScheduler | None = None,
+) -> int:
+    """Generate a long text chunk by chunk and join the audio.
+
+    Chunks are written to a hidden temporary directory next to
+    ``output_path`` and joined into it only once all of them succeeded.
+    With a ``scheduler``, each chunk is its own scheduled request, so a
+    chunk rejected with 429 is sent again on its own without paying again
+    for the chunks that already finished.
+
+    Args:
+        xi_api_key (str): ElevenLabs API key for authentication.
+        voice_id (str): ID of the voice to use.
+        payload (Dict[str, Any]): Payload for the whole text.
+        chunks (List[str]): Text chunks from :func:`utils.text_chunking.split_text`.
+        output_path (str): Path to save the joined audio file.
+        max_workers (int, optional): Chunks generated at once.
+            Defaults to DEFAULT_CHUNK_WORKERS.
+        scheduler (Optional[AdaptiveScheduler], optional): Scheduler each chunk
+            request is run through. Defaults to None.
+
+    Returns:
+        int: Number of bytes written.
+
+    Raises:
+        TransientAPIError: If the API is rate limiting (HTTP 429) or overloaded (5xx).
+        requests.exceptions.RequestException: If a request fails.
+    """
+    payloads = _chunk_payloads(payload, chunks)
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    with tempfile.TemporaryDirectory(prefix=".chunks-", dir=output_dir) as chunk_dir:
+        chunk_paths = [
+            os.path.join(chunk_dir, f"{number}.mp3") for number in range(len(chunks))
+        ]
+        workers = max(1, min(int(max_workers), len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _post_tts, xi_api_key, voice_id, chunk_payload, path, scheduler
+                )
+                for chunk_payload, path in zip(payloads, chunk_paths)
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        with atomic_write(output_path) as out:
+            return concat_mp3_files(chunk_paths, out)
+
+
+def generate_audio(
+    xi_api_key: str,
+    stability: float,
+    model_id: str,
+    similarity_boost: float,
+    style: float,
+    use_speaker_boost: bool,
+    voice_id: str,
+    text_to_speak: str,
+    output_path: str = "output.mp3",
+    language_code: str | None = None,
+    speed: float | None = None,
+    use_cache: bool = False,
+    chunk_workers: int = DEFAULT_CHUNK_WORKERS,
+    scheduler: AdaptiveScheduler | None = None,
+) -> bool:
+    """Generate audio using ElevenLabs Text-to-Speech API.
+
+    Texts longer than :func:`utils.text_chunking.get_chunk_size` are split at
+    sentence boundaries and generated as several requests, ``chunk_workers``
+    at a time, each with its neighbouring text as context where the model
+    supports request stitching. The chunks' MP3 frames are then joined into a
+    single file, so long scripts no longer run into the request timeout.
+
+    Args:
+        xi_api_key (str): ElevenLabs API key for authentication.
+        stability (float): Voice stability between 0 and 1.
+        model_id (str): ID of the model to use for generation.
+        similarity_boost (float): Voice similarity boost between 0 and 1.
+        style (float): Voice style between 0 and 1.
+        use_speaker_boost (bool): Whether to use speaker boost.
+        voice_id (str): ID of the voice to use.
+        text_to_speak (str): Text to convert to speech.
+        output_path (str, optional): Path to save the audio file. Defaults to "output.mp3".
+        language_code (Optional[str], optional): Language code for multilingual models. Defaults to None.
+        speed (Optional[float], optional): Speed multiplier between 0.5 and 2.0. Available for models that support speed control (multilingual and turbo/flash v2+ models). Defaults to None.
+        use_cache (bool, optional): Serve identical requests from the local audio cache instead of calling the API, and store new clips in it. Defaults to False.
+        chunk_workers (int, optional): Chunks of a long text generated at once. Defaults to DEFAULT_CHUNK_WORKERS.
+        scheduler (Optional[AdaptiveScheduler], optional): Scheduler every request (each chunk of a long text) is run through; requests rejected with 429 are sent again on their own. Defaults to None.
+
+    Returns:
+        bool: Success status of the audio generation.
+
+    Raises:
+        ValidationError: If any of the input parameters are invalid.
+        TransientAPIError: If the API is rate limiting (HTTP 429) or overloaded (5xx).
+        APIError: If the API request fails or returns an error response.
+    """
+    payload = _build_tts_payload(
+        text_to_speak,
+        model_id,
+        stability,
+        similarity_boost,
+        style,
+        use_speaker_boost,
+        language_code=language_code,
+        speed=speed,
+    )
+
+    cache_key = None
+    if use_cache:
+        cache_key = _tts_cache_key(voice_id, payload, language_code)
+        if get_audio_cache().get(cache_key, output_path):
+            logging.info("Audio served from cache for %s", output_path)
+            return True
+
+    chunks = split_text(text_to_speak, get_chunk_size(model_id))
+
+    try:
+        if len(chunks) > 1:
+            logging.info(
+                "Generating %s characters in %s chunks", len(text_to_speak), len(chunks)
+            )
+            bytes_written = _generate_chunked_audio(
+                xi_api_key,
+                voice_id,
+                payload,
+                chunks,
+                output_path,
+                chunk_workers,
+                scheduler,
+            )
+        else:
+            logging.info(
+                "Sending request to ElevenLabs API with payload: %s",
+                json.dumps(payload, indent=2),
+            )
+            bytes_written = _post_tts(
+                xi_api_key, voice_id, payload, output_path, scheduler
+            )
+
+        logging.info("Audio generated successfully (%s bytes)", bytes_written)
+
+        if cache_key:
+            get_audio_cache().put(cache_key, output_path)
 
         return True
 
@@ -181,6 +539,141 @@ def generate_audio(
         raise APIError("Failed to generate audio", str(e))
 
 
+def stream_audio(
+    xi_api_key: str,
+    stability: float,
+    model_id: str,
+    similarity_boost: float,
+    style: float,
+    use_speaker_boost: bool,
+    voice_id: str,
+    text_to_speak: str,
+    output_path: str = "output.mp3",
+    language_code: str | None = None,
+    speed: float | None = None,
+    use_cache: bool = False,
+    on_chunk: Callable[[bytes], None] | None = None,
+    on_progress: Callable[[str, int], None] | None = None,
+) -> dict[str, Any]:
+    """Generate audio through the streaming endpoint, handing out audio as it arrives.
+
+    Unlike :func:`generate_audio`, which returns once the whole clip is
+    written, every piece of audio is written to disk and passed to
+    ``on_chunk`` as soon as it is received, so playback can start after the
+    first chunk instead of after the whole clip. Long texts are split as in
+    :func:`generate_audio` but streamed one chunk after the other, in order.
+    The file only appears under ``output_path`` once the stream completed.
+
+    Args:
+        xi_api_key (str): ElevenLabs API key for authentication.
+        stability (float): Voice stability between 0 and 1.
+        model_id (str): ID of the model to use for generation.
+        similarity_boost (float): Voice similarity boost between 0 and 1.
+        style (float): Voice style between 0 and 1.
+        use_speaker_boost (bool): Whether to use speaker boost.
+        voice_id (str): ID of the voice to use.
+        text_to_speak (str): Text to convert to speech.
+        output_path (str, optional): Path to save the audio file. Defaults to "output.mp3".
+        language_code (Optional[str], optional): Language code for multilingual models. Defaults to None.
+        speed (Optional[float], optional): Speed multiplier between 0.5 and 2.0. Defaults to None.
+        use_cache (bool, optional): Serve identical requests from the local audio cache, as one chunk, and store new clips in it. Defaults to False.
+        on_chunk (Optional[Callable[[bytes], None]], optional): Called with each piece of audio in playback order. Defaults to None.
+        on_progress (Optional[Callable[[str, int], None]], optional): Called after each piece of audio is written and flushed, with the path of the file holding the audio received so far and its size in bytes, so a player can read it from disk. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: Dictionary with:
+        - bytes: Number of bytes written
+        - first_audio_seconds: Seconds until the first audio arrived
+        - total_seconds: Seconds until the clip was complete
+        - cached: True if the clip came from the audio cache
+
+    Raises:
+        ValidationError: If any of the input parameters are invalid.
+        TransientAPIError: If the API is rate limiting (HTTP 429) or overloaded (5xx).
+        APIError: If the API request fails or returns an error response.
+    """
+    payload = _build_tts_payload(
+        text_to_speak,
+        model_id,
+        stability,
+        similarity_boost,
+        style,
+        use_speaker_boost,
+        language_code=language_code,
+        speed=speed,
+    )
+    started = time.monotonic()
+
+    cache_key = None
+    if use_cache:
+        cache_key = _tts_cache_key(voice_id, payload, language_code)
+        if get_audio_cache().get(cache_key, output_path):
+            logging.info("Audio served from cache for %s", output_path)
+            size = os.path.getsize(output_path)
+            if on_chunk:
+                with open(output_path, "rb") as f:
+                    on_chunk(f.read())
+            if on_progress:
+                on_progress(output_path, size)
+            elapsed = time.monotonic() - started
+            return {
+                "bytes": size,
+                "first_audio_seconds": elapsed,
+                "total_seconds": elapsed,
+                "cached": True,
+            }
+
+    tts_url = ELEVENLABS_TTS_STREAM_URL.format(voice_id=voice_id)
+    payloads = _chunk_payloads(
+        payload, split_text(text_to_speak, get_chunk_size(model_id))
+    )
+    bytes_written = 0
+    first_audio_seconds = None
+
+    try:
+        with atomic_write(output_path) as f:
+            for number, chunk_payload in enumerate(payloads):
+                response = _open_tts_response(xi_api_key, tts_url, chunk_payload)
+                try:
+                    audio = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+                    if number > 0:
+                        # Only the first chunk's tags belong in the joined file
+                        audio = skip_id3v2_stream(audio)
+                    for data in audio:
+                        if not data:
+                            continue
+                        f.write(data)
+                        f.flush()
+                        bytes_written += len(data)
+                        if first_audio_seconds is None:
+                            first_audio_seconds = time.monotonic() - started
+                            logging.info("First audio after %.2fs", first_audio_seconds)
+                        if on_chunk:
+                            on_chunk(data)
+                        if on_progress:
+                            on_progress(f.name, bytes_written)
+                finally:
+                    response.close()
+    except requests.exceptions.RequestException as e:
+        raise APIError("Failed to stream audio", str(e))
+
+    total_seconds = time.monotonic() - started
+    logging.info(
+        "Audio streamed successfully (%s bytes in %.2fs)", bytes_written, total_seconds
+    )
+    if cache_key:
+        get_audio_cache().put(cache_key, output_path)
+
+    return {
+        "bytes": bytes_written,
+        "first_audio_seconds": (
+            first_audio_seconds if first_audio_seconds is not None else total_seconds
+        ),
+        "total_seconds": total_seconds,
+        "cached": False,
+    }
+
+
 def generate_voice_previews(
     api_key: str, voice_description: str
 ) -> dict[str, Any] | None:
@@ -215,7 +708,11 @@ def generate_voice_previews(
     payload = {"text": sample_text, "voice_description": voice_description}
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = send_with_retry(
+            "generate_voice_previews",
+            lambda: http_client.post(url, headers=headers, json=payload, timeout=30),
+            idempotent=False,
+        )
         response.raise_for_status()
         result = response.json()
 
@@ -278,13 +775,329 @@ def create_voice_from_preview(
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = send_with_retry(
+            "create_voice_from_preview",
+            lambda: http_client.post(url, headers=headers, json=payload, timeout=30),
+            idempotent=False,
+        )
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
         raise APIError("Failed to create voice from preview", str(e))
 
 
+def _bulk_row_result(
+    index: int,
+    status: str,
+    output_path: str,
+    latency: float | None = None,
+    error: str = "",
+) -> dict[str, Any]:
+    """Build one row of the bulk result report.
+
+    Args:
+        index (int): CSV row index.
+        status (str): One of the BULK_STATUS_* values.
+        output_path (str): Path the row writes to.
+        latency (Optional[float]): Seconds spent generating the row, if it ran.
+        error (str): Error message for failed rows.
+
+    Returns:
+        Dict[str, Any]: Report row with the BULK_REPORT_COLUMNS keys.
+    """
+    size = None
+    if status in (BULK_STATUS_OK, BULK_STATUS_SKIPPED):
+        try:
+            size = os.path.getsize(output_path)
+        except OSError:
+            pass
+    return {
+        "row": index,
+        "status": status,
+        "latency": round(latency, 3) if latency is not None else None,
+        "bytes": size,
+        "output_path": output_path,
+        "error": error,
+    }
+
+
+def _generate_bulk_group(
+    api_key: str,
+    model_id: str,
+    voice_id: str,
+    voice_settings: dict[str, Any],
+    jobs: list[tuple[int, str, str]],
+    use_cache: bool = False,
+    continue_on_error: bool = False,
+    scheduler: AdaptiveScheduler | None = None,
+) -> tuple[list[dict[str, Any]], Exception | None]:
+    """Generate audio for a group of bulk rows that share an output path.
+
+    Rows writing to the same file are generated one after another in CSV order,
+    so the last row still wins exactly as it does in a sequential run.
+
+    Args:
+        api_key (str): ElevenLabs API key for authentication.
+        model_id (str): ID of the model to use.
+        voice_id (str): ID of the voice to use.
+        voice_settings (Dict[str, Any]): Voice settings already cast to their types.
+        jobs (List[Tuple[int, str, str]]): (row index, text, output path) tuples.
+        use_cache (bool, optional): Use the local audio cache. Defaults to False.
+        continue_on_error (bool, optional): Keep generating the remaining rows
+            after one fails instead of marking them cancelled. Defaults to False.
+        scheduler (Optional[AdaptiveScheduler], optional): Scheduler that rate
+            limits each request and reruns those rejected with 429. Defaults to a
+            scheduler running one request at a time.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Optional[Exception]]: A report row for every
+        job, and the first error raised by a row (None if all succeeded).
+    """
+    if scheduler is None:
+        scheduler = AdaptiveScheduler(max_concurrency=1)
+
+    results = []
+    first_error = None
+    for index, text, output_path in jobs:
+        if first_error is not None and not continue_on_error:
+            results.append(_bulk_row_result(index, BULK_STATUS_CANCELLED, output_path))
+            continue
+
+        started = time.perf_counter()
+        try:
+            success = generate_audio(
+                api_key,
+                voice_settings["stability"],
+                model_id,
+                voice_settings["similarity_boost"],
+                voice_settings["style"],
+                voice_settings["use_speaker_boost"],
+                voice_id,
+                text,
+                output_path,
+                speed=voice_settings["speed"],
+                use_cache=use_cache,
+                # Rows already run in parallel; keep within the scheduler's limit
+                chunk_workers=1,
+                # Scheduled per request, so a throttled chunk of a long row
+                # is sent again without the chunks that already finished
+                scheduler=scheduler,
+            )
+            if not success:
+                raise APIError(f"Failed to generate audio for row {index}")
+        except Exception as e:
+            logging.warning("Bulk row %s failed: %s", index, e)
+            first_error = first_error or e
+            results.append(
+                _bulk_row_result(
+                    index,
+                    BULK_STATUS_FAILED,
+                    output_path,
+                    time.perf_counter() - started,
+                    str(e),
+                )
+            )
+            continue
+
+        results.append(
+            _bulk_row_result(
+                index, BULK_STATUS_OK, output_path, time.perf_counter() - started
+            )
+        )
+    return results, first_error
+
+
+def _copy_bulk_clip(
+    source: dict[str, Any],
+    jobs: list[tuple[int, str, str]],
+    continue_on_error: bool = False,
+) -> tuple[list[dict[str, Any]], Exception | None]:
+    """Fan a clip out to bulk rows that request exactly the same audio.
+
+    Args:
+        source (Dict[str, Any]): Report row of the row whose file holds the clip.
+        jobs (List[Tuple[int, str, str]]): (row index, text, output path) tuples
+            of rows with the same request key.
+        continue_on_error (bool, optional): Report the rows as failed rather
+            than cancelled when the source row failed. Defaults to False.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Optional[Exception]]: A report row for every
+        job, and the first error (None if every copy was written).
+    """
+    if source["status"] not in (BULK_STATUS_OK, BULK_STATUS_SKIPPED):
+        if source["status"] == BULK_STATUS_CANCELLED or not continue_on_error:
+            return [
+                _bulk_row_result(index, BULK_STATUS_CANCELLED, path)
+                for index, _, path in jobs
+            ], None
+        error = APIError(
+            f"Row {source['row']} with the same request failed", source["error"]
+        )
+        return [
+            _bulk_row_result(index, BULK_STATUS_FAILED, path, error=str(error))
+            for index, _, path in jobs
+        ], error
+
+    results = []
+    first_error = None
+    for index, _, output_path in jobs:
+        started = time.perf_counter()
+        try:
+            place_file(source["output_path"], output_path)
+        except OSError as e:
+            logging.warning("Bulk row %s could not be copied: %s", index, e)
+            first_error = first_error or e
+            results.append(
+                _bulk_row_result(
+                    index,
+                    BULK_STATUS_FAILED,
+                    output_path,
+                    time.perf_counter() - started,
+                    str(e),
+                )
+            )
+            continue
+        results.append(
+            _bulk_row_result(
+                index, BULK_STATUS_OK, output_path, time.perf_counter() - started
+            )
+        )
+    return results, first_error
+
+
+def _plan_bulk_csv(
+    csv_file: BinaryIO,
+    output_dir: str,
+    model_id: str,
+    voice_id: str,
+    voice_settings: dict[str, Any],
+    workers: int,
+    manifest: BulkManifest | None = None,
+    use_cache: bool = False,
+) -> tuple[dict[str, Any], pd.DataFrame, dict[str, Any]]:
+    """Parse a bulk CSV into its job list and plan the run.
+
+    Args:
+        csv_file (BinaryIO): CSV file object.
+        output_dir (str): Bulk output directory.
+        model_id (str): ID of the model to use.
+        voice_id (str): ID of the voice to use.
+        voice_settings (Dict[str, Any]): Voice settings as passed by the page.
+        workers (int): Concurrent requests.
+        manifest (Optional[BulkManifest]): Manifest of rows to skip; nothing
+            is skipped if None.
+        use_cache (bool, optional): Count clips in the audio cache as free.
+            Defaults to False.
+
+    Returns:
+        Tuple[Dict[str, Any], pd.DataFrame, Dict[str, Any]]: Voice settings cast
+        to their types, the job list and the plan from
+        :func:`scripts.bulk_planning.plan_bulk_run`.
+    """
+    # Cast voice settings to correct types once for every row
+    speed_value = voice_settings.get("speed")
+    typed_settings = {
+        "stability": float(voice_settings["stability"]),
+        "similarity_boost": float(voice_settings["similarity_boost"]),
+        "style": float(voice_settings["style"]),
+        "use_speaker_boost": bool(voice_settings["use_speaker_boost"]),
+        "speed": float(speed_value) if speed_value is not None else None,
+    }
+    settings_key = {
+        key: typed_settings[key]
+        for key in ("stability", "similarity_boost", "style", "use_speaker_boost")
+    }
+
+    # Parse the CSV chunk by chunk into its job list, resolving every row
+    # before any API call; rows sharing an output path form one group
+    jobs_df = read_bulk_jobs(
+        csv_file,
+        output_dir,
+        voice_id,
+        model_id,
+        settings_key,
+        speed=typed_settings["speed"],
+    )
+    plan = plan_bulk_run(
+        jobs_df,
+        model_id,
+        workers,
+        is_complete=manifest.is_complete if manifest is not None else None,
+        is_cached=get_audio_cache().contains if use_cache else None,
+    )
+    return typed_settings, jobs_df, plan
+
+
+def estimate_bulk_generation(
+    model_id: str,
+    voice_id: str,
+    csv_file: BinaryIO,
+    output_dir: str,
+    voice_settings: dict[str, Any],
+    max_workers: int = DEFAULT_BULK_WORKERS,
+    use_cache: bool = False,
+    resume: bool = True,
+) -> dict[str, Any]:
+    """Estimate what :func:`bulk_generate_audio` would use, without calling the API.
+
+    Takes the same arguments and makes the same decisions about rows skipped
+    on resume, rows copied from identical rows and audio cache hits.
+
+    Args:
+        model_id (str): ID of the model to use.
+        voice_id (str): ID of the voice to use.
+        csv_file (BinaryIO): CSV file object containing text and filename columns.
+        output_dir (str): Directory the audio files would be saved to.
+        voice_settings (Dict[str, Any]): Dictionary containing voice generation settings.
+        max_workers (int, optional): Number of concurrent API requests.
+            Defaults to DEFAULT_BULK_WORKERS.
+        use_cache (bool, optional): Count clips in the local audio cache as
+            free. Defaults to False.
+        resume (bool, optional): Count rows completed by a previous run as
+            done. Defaults to True.
+
+    Returns:
+        Dict[str, Any]: The plan from :func:`scripts.bulk_planning.plan_bulk_run`,
+        plus ``row_chars``, the resolved characters per CSV row.
+
+    Raises:
+        ValidationError: If the CSV file format is invalid.
+    """
+    workers = max(1, min(int(max_workers), MAX_BULK_WORKERS))
+    manifest = BulkManifest(output_dir) if resume else None
+    _, jobs_df, plan = _plan_bulk_csv(
+        csv_file,
+        output_dir,
+        model_id,
+        voice_id,
+        voice_settings,
+        workers,
+        manifest,
+        use_cache,
+    )
+    plan["row_chars"] = jobs_df["chars"]
+    return plan
+
+
+def write_bulk_report(results: list[dict[str, Any]], output_dir: str) -> str:
+    """Write a bulk result report as CSV into the job's output directory.
+
+    Args:
+        results (List[Dict[str, Any]]): Report rows from a bulk run.
+        output_dir (str): Bulk output directory.
+
+    Returns:
+        str: Path of the written report.
+    """
+    report_path = os.path.join(output_dir, BULK_REPORT_FILENAME)
+    report = pd.DataFrame(results, columns=BULK_REPORT_COLUMNS)
+    report = report.sort_values("row", kind="stable")
+    with atomic_write(report_path, "w", encoding="utf-8", newline="") as f:
+        report.to_csv(f, index=False)
+    return report_path
+
+
 def bulk_generate_audio(
     api_key: str,
     model_id: str,
@@ -292,9 +1105,42 @@ def bulk_generate_audio(
     csv_file: BinaryIO,
     output_dir: str,
     voice_settings: dict[str, Any],
+    max_workers: int = DEFAULT_BULK_WORKERS,
+    row_callback: Callable[[int, str], None] | None = None,
+    use_cache: bool = False,
+    resume: bool = True,
+    continue_on_error: bool = False,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    max_characters: int | None = None,
 ) -> tuple[bool, str]:
     """Generate audio in bulk from CSV file.
 
+    All rows are validated and their output paths resolved before any API call
+    is made, so a bad filename on a late row no longer costs the earlier
+    generations. Rows are then generated on a pool of ``max_workers`` threads
+    behind an :class:`utils.rate_limiter.AdaptiveScheduler`, which lowers the
+    number of requests in flight when ElevenLabs answers 429 or 5xx, waits for
+    ``Retry-After`` and then runs rows rejected with 429 again. A row that
+    gets a 5xx fails instead, since the clip may already have been billed;
+    resuming the job generates it later.
+
+    Finished rows are checkpointed in a manifest in ``output_dir`` (see
+    :class:`utils.bulk_manifest.BulkManifest`). When ``resume`` is set, rows
+    recorded there with the same text, voice, model and settings whose file is
+    unchanged are skipped, so rerunning a failed job only pays for the rest.
+
+    Rows that resolve to the same text, voice, model and settings as an
+    earlier row are generated once: the other rows get a copy of that row's
+    file, so repeated lines cost neither characters nor API time. Rows whose
+    file is also written by other rows are left out of this and still run in
+    CSV order.
+
+    A per-row report (status, latency, bytes, output path and error; see
+    BULK_REPORT_COLUMNS) is written to ``BULK_REPORT_FILENAME`` in
+    ``output_dir`` whether or not the run succeeds. By default the first failed
+    row stops the job; with ``continue_on_error`` every row is attempted and
+    failures are only reported.
+
     Args:
         api_key (str): ElevenLabs API key for authentication.
         model_id (str): ID of the model to use.
@@ -302,26 +1148,37 @@ def bulk_generate_audio(
         csv_file (BinaryIO): CSV file object containing text and filename columns.
         output_dir (str): Directory to save generated audio files.
         voice_settings (Dict[str, Any]): Dictionary containing voice generation settings.
+        max_workers (int, optional): Number of concurrent API requests, clamped to
+            1..MAX_BULK_WORKERS. Defaults to DEFAULT_BULK_WORKERS.
+        row_callback (Optional[Callable[[int, str], None]], optional): Called with
+            (row index, output path) each time a row finishes. Defaults to None.
+        use_cache (bool, optional): Copy clips for rows already generated with the
+            same text, voice, model and settings from the local audio cache
+            instead of calling the API. Defaults to False.
+        resume (bool, optional): Skip rows completed by a previous run into the
+            same directory. When False the manifest is reset. Defaults to True.
+        continue_on_error (bool, optional): Keep going after a row fails and
+            return False with a summary instead of raising. Defaults to False.
+        progress_callback (Optional[Callable[[Dict[str, Any]], None]], optional):
+            Called with a :meth:`utils.bulk_progress.BulkProgress.snapshot` once
+            the rows to skip are known and again as rows finish. It is called
+            for every row, so throttle any expensive redraws. Defaults to None.
+        max_characters (Optional[int], optional): Refuse the job before any
+            request if it would bill more characters than this, after rows
+            skipped on resume, copies and cache hits are taken out (see
+            :func:`scripts.bulk_planning.plan_bulk_run`). Defaults to None.
 
     Returns:
         Tuple[bool, str]: Tuple containing:
-            - Success status
+            - Success status (False if any row failed with ``continue_on_error``)
             - Status message or error description
 
     Raises:
         ValidationError: If the CSV file format is invalid.
-        APIError: If the API request fails or returns an error response.
+        APIError: If the API request fails or returns an error response, or
+            the job is over ``max_characters``.
     """
     try:
-        csv_file.seek(0)
-        df = pd.read_csv(csv_file)
-
-        if "text" not in df.columns:
-            raise ValidationError(
-                "CSV must contain 'text' column",
-                "Please ensure your CSV file has a column named 'text'",
-            )
-
         # Validate output directory path to prevent traversal
         outputs_base = os.path.abspath(os.path.join(os.getcwd(), "outputs"))
         abs_output_dir = os.path.abspath(output_dir)
@@ -331,70 +1188,194 @@ def bulk_generate_audio(
                 "Output directory must be within the outputs directory",
             )
 
-        os.makedirs(output_dir, exist_ok=True)
-
-        for index, row in df.iterrows():
-            text_template = row["text"]
-            filename_template = str(
-                row.get("filename", f"audio_{index}")
-            )  # Ensure template is a string
-
-            # Perform variable substitution for both text and filename
-            processed_text = str(text_template)  # Ensure text is a string
-            processed_filename_base = filename_template
-
-            for col_name, col_value in row.items():
-                if col_name not in [
-                    "text",
-                    "filename",
-                ]:  # Avoid self-reference or double processing
-                    placeholder = f"{{{col_name}}}"
-                    # Ensure col_value is a string for replacement
-                    str_col_value = str(col_value) if pd.notna(col_value) else ""
-                    processed_text = processed_text.replace(placeholder, str_col_value)
-                    processed_filename_base = processed_filename_base.replace(
-                        placeholder, str_col_value
-                    )
-
-            # Sanitize filename to prevent path issues and ensure it's valid
-            sanitized_filename = sanitize_filename(processed_filename_base)
-
-            output_path = os.path.join(output_dir, sanitized_filename)
-
-            # Validate final output path is within output directory
-            if not validate_path_within_base(output_path, abs_output_dir):
-                raise ValidationError(
-                    f"Invalid filename for row {index}",
-                    "Filename contains invalid characters or path traversal",
-                )
+        workers = max(1, min(int(max_workers), MAX_BULK_WORKERS))
+        manifest = BulkManifest(output_dir)
+        typed_settings, jobs_df, plan = _plan_bulk_csv(
+            csv_file,
+            output_dir,
+            model_id,
+            voice_id,
+            voice_settings,
+            workers,
+            manifest if resume else None,
+            use_cache,
+        )
+        request_keys = jobs_df["request_key"].to_dict()
+        logging.info(
+            "Planned bulk job in %s: %s rows, %s characters, %s to bill in %s "
+            "requests (%s rows done before, %s copied, %s cached, about %.0fs)",
+            output_dir,
+            plan["rows"],
+            plan["chars"],
+            plan["billable_chars"],
+            plan["requests"],
+            plan["skipped_rows"],
+            plan["duplicate_rows"],
+            plan["cached_rows"],
+            plan["estimated_seconds"],
+        )
+        if max_characters is not None and plan["billable_chars"] > max_characters:
+            raise ValidationError(
+                f"Bulk job needs {plan['billable_chars']} characters, "
+                f"more than the budget of {max_characters}",
+                "Split the CSV into smaller files or raise the budget",
+            )
 
-            # Cast voice settings to correct types
-            stability = float(voice_settings["stability"])
-            similarity_boost = float(voice_settings["similarity_boost"])
-            style = float(voice_settings["style"])
-            use_speaker_boost = bool(voice_settings["use_speaker_boost"])
-            # Extract speed if present, otherwise default to None
-            speed_value = voice_settings.get("speed")
-            if speed_value is not None:
-                speed_value = float(speed_value)
+        os.makedirs(output_dir, exist_ok=True)
+        if not resume:
+            manifest.reset()
+
+        # Rows requesting the same audio as another row are copied from that
+        # row's file instead of being generated again (see group_bulk_jobs)
+        groups = plan["groups"]
+        pending_groups = groups["pending"]
+        clip_sources = groups["sources"]
+        duplicates = dict(groups["copies"])
+        results = [
+            _bulk_row_result(index, BULK_STATUS_SKIPPED, path)
+            for jobs in groups["skipped"]
+            for index, _, path in jobs
+        ]
+        skipped_rows = len(results)
+        skipped_last_rows = {jobs[-1][0] for jobs in groups["skipped"]}
+        finished_clips = {
+            request_key: _bulk_row_result(jobs[-1][0], BULK_STATUS_SKIPPED, jobs[-1][2])
+            for request_key, jobs in clip_sources.items()
+            if jobs[-1][0] in skipped_last_rows
+        }
 
-            success = generate_audio(
-                api_key,
-                stability,
-                model_id,
-                similarity_boost,
-                style,
-                use_speaker_boost,
-                voice_id,
-                processed_text,  # Use processed text
-                output_path,
-                speed=speed_value,  # Pass speed here
+        progress = BulkProgress(len(jobs_df))
+        for result in results:
+            progress.add(result)
+        if progress_callback:
+            progress_callback(progress.snapshot())
+        if skipped_rows:
+            logging.info(
+                "Resuming bulk job in %s: %s rows already done",
+                output_dir,
+                skipped_rows,
             )
 
-            if not success:
-                raise APIError(f"Failed to generate audio for row {index}")
-
-        return True, "Bulk generation completed successfully"
+        scheduler = AdaptiveScheduler(max_concurrency=workers)
+        completed_rows = 0
+        copied_rows = 0
+        failed_rows = 0
+        first_error = None
+        futures = {}
+
+        def finish_rows(
+            row_results: list[dict[str, Any]], row_error: Exception | None
+        ) -> None:
+            # Record finished rows; runs on this thread only
+            nonlocal completed_rows, failed_rows, first_error
+            results.extend(row_results)
+            for result in row_results:
+                progress.add(result)
+            if progress_callback:
+                progress_callback(progress.snapshot())
+            for result in row_results:
+                if result["status"] != BULK_STATUS_OK:
+                    continue
+                index, output_path = result["row"], result["output_path"]
+                completed_rows += 1
+                manifest.record(index, request_keys[index], output_path)
+                logging.info("Bulk row %s written to %s", index, output_path)
+                if row_callback:
+                    row_callback(index, output_path)
+            if row_error is None:
+                return
+            failed_rows += sum(
+                result["status"] == BULK_STATUS_FAILED for result in row_results
+            )
+            if first_error is None:
+                first_error = row_error
+                if not continue_on_error:
+                    # Don't start rows that are still queued once one has
+                    # failed, but keep checkpointing rows already running
+                    for pending in futures:
+                        pending.cancel()
+
+        def copy_duplicates(request_key: str, source: dict[str, Any]) -> None:
+            nonlocal copied_rows
+            jobs = duplicates.pop(request_key, [])
+            if not jobs:
+                return
+            copies, copy_error = _copy_bulk_clip(source, jobs, continue_on_error)
+            copied_rows += sum(result["status"] == BULK_STATUS_OK for result in copies)
+            finish_rows(copies, copy_error)
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for request_key, source in finished_clips.items():
+                copy_duplicates(request_key, source)
+            futures.update(
+                {
+                    executor.submit(
+                        _generate_bulk_group,
+                        api_key,
+                        model_id,
+                        voice_id,
+                        typed_settings,
+                        jobs,
+                        use_cache,
+                        continue_on_error,
+                        scheduler,
+                    ): jobs
+                    for jobs in pending_groups
+                }
+            )
+            for future in as_completed(futures):
+                jobs = futures[future]
+                if future.cancelled():
+                    group_results = [
+                        _bulk_row_result(index, BULK_STATUS_CANCELLED, path)
+                        for index, _, path in jobs
+                    ]
+                    group_error = None
+                else:
+                    group_results, group_error = future.result()
+                finish_rows(group_results, group_error)
+                request_key = request_keys[jobs[-1][0]]
+                if clip_sources.get(request_key) is jobs:
+                    copy_duplicates(request_key, group_results[-1])
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            manifest.flush()
+            write_bulk_report(results, output_dir)
+
+        if first_error is not None and not continue_on_error:
+            raise first_error
+
+        scheduler_stats = scheduler.get_stats()
+        logging.info(
+            "Bulk generation finished: %s rows with %s workers "
+            "(%s throttled, %s retried, concurrency ended at %s)",
+            completed_rows,
+            workers,
+            scheduler_stats["throttled"],
+            scheduler_stats["retries"],
+            scheduler_stats["limit"],
+        )
+        if use_cache:
+            cache_stats = get_audio_cache().get_stats()
+            logging.info(
+                "Audio cache: %.0f%% hit ratio, %s bytes saved",
+                cache_stats["hit_ratio"] * 100,
+                cache_stats["bytes_saved"],
+            )
+        resumed_note = f", {skipped_rows} already done" if skipped_rows else ""
+        if copied_rows:
+            resumed_note += f", {copied_rows} copied from identical rows"
+        if failed_rows:
+            return (
+                False,
+                f"Bulk generation finished with {failed_rows} failed rows "
+                f"({completed_rows} files{resumed_note})",
+            )
+        return (
+            True,
+            f"Bulk generation completed successfully ({completed_rows} files{resumed_note})",
+        )
 
     except Exception as e:
         raise APIError("Failed to process bulk generation", str(e))
@@ -1,5 +1,9 @@
-
-from scripts.openrouter_functions import translate_script_with_openrouter
+from scripts.async_functions import run_async, translate_to_languages_async
+from scripts.openrouter_functions import (
+    get_default_translation_model,
+    get_openrouter_api_key,
+    translate_script_with_openrouter,
+)
 
 
 def translate_script(text: str, language: str, model: str | None = None) -> str:
@@ -15,3 +19,37 @@ def translate_script(text: str, language: str, model: str | None = None) -> str:
         Translated text.
     """
     return translate_script_with_openrouter(text, language, model=model)
+
+
+def translate_to_languages(
+    text: str, languages: list[str], model: str | None = None
+) -> dict[str, str]:
+    """
+    Translate the text to several languages at once using OpenRouter.
+
+    The translations are requested concurrently on one thread. The API key
+    and default model are read here, on the Streamlit script thread.
+
+    Args:
+        text: Text to translate.
+        languages: Target languages.
+        model: Optional model to use. If None, uses default model.
+
+    Returns:
+        Translated text per language, or an error message for a language
+        whose translation failed.
+    """
+    api_key = get_openrouter_api_key()
+    if not api_key:
+        message = "OpenRouter API key not found. Please set it in Settings."
+        return {language: message for language in languages}
+    results = run_async(
+        translate_to_languages_async(
+            text,
+            languages,
+            model=model or get_default_translation_model(),
+            api_key=api_key,
+            return_exceptions=True,
+        )
+    )
+    return {language: str(result) for language, result in results.items()}
@@ -0,0 +1,649 @@
+"""Asyncio versions of the ElevenLabs and OpenRouter client functions.
+
+These coroutines mirror the synchronous functions in
+:mod:`scripts.Elevenlabs_functions` and :mod:`scripts.openrouter_functions`
+(same payloads, prompts, cache and error semantics) but send their requests
+through the shared ``httpx.AsyncClient`` in :mod:`utils.async_http_client`, so
+many calls can be in flight on one thread. Use :func:`run_async` to call them
+from a Streamlit page.
+
+Unlike the synchronous OpenRouter functions, which return error messages,
+every coroutine here raises :class:`utils.error_handling.APIError` when a
+request fails. The OpenRouter coroutines read the API key and default models
+from the session when they run; :func:`run_async` may run them on a helper
+thread that cannot read ``st.session_state``, so resolve those settings first
+and pass them in, as :func:`scripts.Translation_functions.translate_to_languages`
+does.
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from scripts.Elevenlabs_functions import (
+    AUDIO_CHUNK_SIZE,
+    DEFAULT_CHUNK_WORKERS,
+    ELEVENLABS_MODELS_URL,
+    ELEVENLABS_TTS_URL,
+    ELEVENLABS_VOICES_URL,
+    _build_tts_payload,
+    _chunk_payloads,
+    _tts_cache_key,
+)
+from scripts.openrouter_functions import (
+    DEFAULT_MODEL,
+    ENHANCEMENT_SYSTEM_PROMPT,
+    OPENROUTER_API_URL,
+    OPENROUTER_MODELS_URL,
+    V3_ENHANCEMENT_SYSTEM_PROMPT,
+    _chat_payload,
+    _enhancement_prompt,
+    _openrouter_headers,
+    _phonetic_prompt,
+    _translation_prompt,
+    _v3_enhancement_prompt,
+    get_default_enhancement_model,
+    get_default_translation_model,
+)
+from utils import async_http_client
+from utils.api_keys import get_openrouter_api_key
+from utils.atomic_files import atomic_write
+from utils.async_http_client import run_async  # noqa: F401
+from utils.audio_cache import get_audio_cache
+from utils.error_handling import APIError
+from utils.model_capabilities import supports_audio_tags
+from utils.mp3 import concat_mp3_files
+from utils.rate_limiter import AdaptiveScheduler, transient_error_from_response
+from utils.retry import send_with_retry_async
+from utils.text_chunking import get_chunk_size, split_text
+
+T = TypeVar("T")
+
+DEFAULT_ASYNC_CONCURRENCY = 8  # Requests in flight per gather_limited call
+
+
+async def gather_limited(
+    calls: Iterable[Callable[[], Awaitable[T]]],
+    max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[T | BaseException]:
+    """Run coroutine factories concurrently with a bound on calls in flight.
+
+    Args:
+        calls (Iterable[Callable[[], Awaitable[T]]]): Zero-argument callables
+            returning the coroutines to run.
+        max_concurrency (int): Maximum coroutines running at once (default: 8).
+        return_exceptions (bool): Return exceptions in the result list instead
+            of raising the first one (default: False).
+
+    Returns:
+        List[Union[T, BaseException]]: Results in the order of ``calls``.
+    """
+    semaphore = asyncio.Semaphore(max(int(max_concurrency), 1))
+
+    async def limited(call: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await call()
+
+    return await asyncio.gather(
+        *(limited(call) for call in calls), return_exceptions=return_exceptions
+    )
+
+
+async def _fetch_catalog(operation: str, url: str, api_key: str) -> Any:
+    """Fetch a JSON catalog from the ElevenLabs API.
+
+    Args:
+        operation (str): Name of the API operation, used for retries and errors.
+        url (str): Catalog URL.
+        api_key (str): ElevenLabs API key for authentication.
+
+    Returns:
+        Any: The decoded JSON body.
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns an error response.
+    """
+    headers = {"xi-api-key": api_key}
+    response = await send_with_retry_async(
+        operation,
+        lambda: async_http_client.get(url, headers=headers, timeout=30),
+        idempotent=True,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+async def fetch_models_async(api_key: str) -> list[tuple[str, str]]:
+    """Fetch available models from ElevenLabs API.
+
+    Args:
+        api_key (str): ElevenLabs API key for authentication.
+
+    Returns:
+        List[Tuple[str, str]]: List of tuples containing (model_id, model_name) pairs.
+
+    Raises:
+        APIError: If the API request fails or returns an error response.
+    """
+    try:
+        models = await _fetch_catalog("fetch_models", ELEVENLABS_MODELS_URL, api_key)
+    except httpx.HTTPError as e:
+        raise APIError("Failed to fetch models", str(e))
+    return [(model["model_id"], model["name"]) for model in models]
+
+
+async def fetch_voices_async(api_key: str) -> list[tuple[str, str]]:
+    """Fetch available voices from ElevenLabs API.
+
+    Args:
+        api_key (str): ElevenLabs API key for authentication.
+
+    Returns:
+        List[Tuple[str, str]]: List of tuples containing (voice_id, voice_name) pairs.
+
+    Raises:
+        APIError: If the API request fails or returns an error response.
+    """
+    try:
+        data = await _fetch_catalog("fetch_voices", ELEVENLABS_VOICES_URL, api_key)
+    except httpx.HTTPError as e:
+        raise APIError("Failed to fetch voices", str(e))
+    return [(voice["voice_id"], voice["name"]) for voice in data["voices"]]
+
+
+async def _run_scheduled(
+    scheduler: AdaptiveScheduler | None, call: Callable[[], Awaitable[T]]
+) -> T:
+    """Await a request, through a scheduler if one is given.
+
+    :class:`utils.rate_limiter.AdaptiveScheduler` blocks while it waits for a
+    slot or backs off, so it runs on a worker thread; each attempt it makes
+    sends the request on this event loop and waits for it there.
+
+    Args:
+        scheduler (Optional[AdaptiveScheduler]): Scheduler to run the request
+            through, or None to await it directly.
+        call (Callable[[], Awaitable[T]]): Zero-argument callable returning the
+            request coroutine; called again for each attempt.
+
+    Returns:
+        T: The request's result.
+    """
+    if scheduler is None:
+        return await call()
+
+    loop = asyncio.get_running_loop()
+    cancelled = threading.Event()
+    attempts: list[concurrent.futures.Future] = []
+
+    def attempt() -> T:
+        if cancelled.is_set():
+            raise concurrent.futures.CancelledError()
+        future = asyncio.run_coroutine_threadsafe(call(), loop)
+        attempts.append(future)
+        return future.result()
+
+    try:
+        return await asyncio.to_thread(scheduler.run, attempt)
+    except asyncio.CancelledError:
+        # Stop the scheduler thread from sending or waiting for more attempts
+        cancelled.set()
+        for future in attempts:
+            future.cancel()
+        raise
+
+
+async def _post_tts_async(
+    xi_api_key: str, voice_id: str, payload: dict[str, Any], output_path: str
+) -> int:
+    """Send one text-to-speech request and stream the audio to disk.
+
+    Args:
+        xi_api_key (str): ElevenLabs API key for authentication.
+        voice_id (str): ID of the voice to use.
+        payload (Dict[str, Any]): Request payload from ``_build_tts_payload``.
+        output_path (str): Path to save the audio file.
+
+    Returns:
+        int: Number of bytes written.
+
+    Raises:
+        TransientAPIError: If the API is rate limiting (HTTP 429) or overloaded (5xx).
+        httpx.HTTPError: If the request fails.
+    """
+    tts_url = ELEVENLABS_TTS_URL.format(voice_id=voice_id)
+    headers = {"xi-api-key": xi_api_key, "Content-Type": "application/json"}
+
+    # Paid request: only retried if it never reached ElevenLabs
+    response = await send_with_retry_async(
+        "generate_audio",
+        lambda: async_http_client.stream(
+            "POST", tts_url, headers=headers, json=payload, timeout=30
+        ),
+        idempotent=False,
+        retry_statuses=(),
+    )
+    bytes_written = 0
+    try:
+        throttled = transient_error_from_response(response, "Failed to generate audio")
+        if throttled:
+            raise throttled
+        response.raise_for_status()
+        with atomic_write(output_path) as f:
+            async for chunk in response.aiter_bytes(AUDIO_CHUNK_SIZE):
+                f.write(chunk)
+                bytes_written += len(chunk)
+    finally:
+        await response.aclose()
+    return bytes_written
+
+
+async def _generate_chunked_audio_async(
+    xi_api_key: str,
+    voice_id: str,
+    payload: dict[str, Any],
+    chunks: list[str],
+    output_path: str,
+    max_workers: int = DEFAULT_CHUNK_WORKERS,
+    scheduler: AdaptiveScheduler | None = None,
+) -> int:
+    """Generate a long text chunk by chunk and join the audio.
+
+    See :func:`scripts.Elevenlabs_functions._generate_chunked_audio`; if a
+    chunk fails, the chunks still waiting or in flight are cancelled.
+
+    Args:
+        xi_api_key (str): ElevenLabs API key for authentication.
+        voice_id (str): ID of the voice to use.
+        payload (Dict[str, Any]): Payload for the whole text.
+        chunks (List[str]): Text chunks from :func:`utils.text_chunking.split_text`.
+        output_path (str): Path to save the joined audio file.
+        max_workers (int, optional): Chunks generated at once.
+            Defaults to DEFAULT_CHUNK_WORKERS.
+        scheduler (Optional[AdaptiveScheduler], optional): Scheduler each chunk
+            request is run through. Defaults to None.
+
+    Returns:
+        int: Number of bytes written.
+
+    Raises:
+        TransientAPIError: If the API is rate limiting (HTTP 429) or overloaded (5xx).
+        httpx.HTTPError: If a request fails.
+    """
+    payloads = _chunk_payloads(payload, chunks)
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    semaphore = asyncio.Semaphore(max(1, min(int(max_workers), len(chunks))))
+
+    async def post_chunk(chunk_payload: dict[str, Any], path: str) -> int:
+        async with semaphore:
+            return await _run_scheduled(
+                scheduler,
+                lambda: _post_tts_async(xi_api_key, voice_id, chunk_payload, path),
+            )
+
+    with tempfile.TemporaryDirectory(prefix=".chunks-", dir=output_dir) as chunk_dir:
+        chunk_paths = [
+            os.path.join(chunk_dir, f"{number}.mp3") for number in range(len(chunks))
+        ]
+        tasks = [
+            asyncio.ensure_future(post_chunk(chunk_payload, path))
+            for chunk_payload, path in zip(payloads, chunk_paths)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        with atomic_write(output_path) as out:
+            return concat_mp3_files(chunk_paths, out)
+
+
+async def generate_audio_async(
+    xi_api_key: str,
+    stability: float,
+    model_id: str,
+    similarity_boost: float,
+    style: float,
+    use_speaker_boost: bool,
+    voice_id: str,
+    text_to_speak: str,
+    output_path: str = "output.mp3",
+    language_code: str | None = None,
+    speed: float | None = None,
+    use_cache: bool = False,
+    chunk_workers: int = DEFAULT_CHUNK_WORKERS,
+    scheduler: AdaptiveScheduler | None = None,
+) -> bool:
+    """Generate audio using ElevenLabs Text-to-Speech API.
+
+    Takes the same arguments as :func:`scripts.Elevenlabs_functions.generate_audio`
+    and behaves the same; response bodies are streamed to disk in chunks and
+    the file only appears once complete.
+
+    Args:
+        xi_api_key (str): ElevenLabs API key for authentication.
+        stability (float): Voice stability between 0 and 1.
+        model_id (str): ID of the model to use for generation.
+        similarity_boost (float): Voice similarity boost between 0 and 1.
+        style (float): Voice style between 0 and 1.
+        use_speaker_boost (bool): Whether to use speaker boost.
+        voice_id (str): ID of the voice to use.
+        text_to_speak (str): Text to convert to speech.
+        output_path (str, optional): Path to save the audio file. Defaults to "output.mp3".
+        language_code (Optional[str], optional): Language code for multilingual models. Defaults to None.
+        speed (Optional[float], optional): Speed multiplier between 0.5 and 2.0. Defaults to None.
+        use_cache (bool, optional): Serve identical requests from the local audio cache instead of calling the API, and store new clips in it. Defaults to False.
+        chunk_workers (int, optional): Chunks of a long text generated at once. Defaults to DEFAULT_CHUNK_WORKERS.
+        scheduler (Optional[AdaptiveScheduler], optional): Scheduler every request (each chunk of a long text) is run through; requests rejected with 429 are sent again on their own. Defaults to None.
+
+    Returns:
+        bool: True if audio generation was successful.
+
+    Raises:
+        ValidationError: If any of the input parameters are invalid.
+        TransientAPIError: If the API is rate limiting (HTTP 429) or overloaded (5xx).
+        APIError: If the API request fails or returns an error response.
+    """
+    payload = _build_tts_payload(
+        text_to_speak,
+        model_id,
+        stability,
+        similarity_boost,
+        style,
+        use_speaker_boost,
+        language_code=language_code,
+        speed=speed,
+    )
+
+    cache_key = None
+    if use_cache:
+        cache_key = _tts_cache_key(voice_id, payload, language_code)
+        if get_audio_cache().get(cache_key, output_path):
+            logging.info("Audio served from cache for %s", output_path)
+            return True
+
+    chunks = split_text(text_to_speak, get_chunk_size(model_id))
+
+    try:
+        if len(chunks) > 1:
+            logging.info(
+                "Generating %s characters in %s chunks", len(text_to_speak), len(chunks)
+            )
+            bytes_written = await _generate_chunked_audio_async(
+                xi_api_key,
+                voice_id,
+                payload,
+                chunks,
+                output_path,
+                chunk_workers,
+                scheduler,
+            )
+        else:
+            logging.info(
+                "Sending request to ElevenLabs API with payload: %s",
+                json.dumps(payload, indent=2),
+            )
+            bytes_written = await _run_scheduled(
+                scheduler,
+                lambda: _post_tts_async(xi_api_key, voice_id, payload, output_path),
+            )
+    except httpx.HTTPError as e:
+        raise APIError("Failed to generate audio", str(e))
+
+    logging.info("Audio generated successfully (%s bytes)", bytes_written)
+
+    if cache_key:
+        get_audio_cache().put(cache_key, output_path)
+
+    return True
+
+
+async def fetch_openrouter_models_async(
+    api_key: str | None = None,
+) -> list[dict[str, Any]]:
+    """Fetch available models from OpenRouter API.
+
+    Args:
+        api_key (Optional[str]): OpenRouter API key. Defaults to the key from
+            session state or secrets.
+
+    Returns:
+        List[Dict[str, Any]]: Model dictionaries containing model information.
+
+    Raises:
+        APIError: If the API key is missing or the request fails.
+    """
+    headers = _openrouter_headers(_require_openrouter_key(api_key))
+    try:
+        response = await send_with_retry_async(
+            "fetch_openrouter_models",
+            lambda: async_http_client.get(
+                OPENROUTER_MODELS_URL, headers=headers, timeout=30
+            ),
+            idempotent=True,
+        )
+        response.raise_for_status()
+        return response.json().get("data", [])
+    except httpx.HTTPError as e:
+        raise APIError(f"Failed to fetch models from OpenRouter: {str(e)}")
+
+
+def _require_openrouter_key(api_key: str | None) -> str:
+    """Resolve the OpenRouter API key, raising if none is set.
+
+    Args:
+        api_key (Optional[str]): Key passed by the caller, or None to read it
+            from session state or secrets.
+
+    Returns:
+        str: The API key.
+
+    Raises:
+        APIError: If no API key is set.
+    """
+    api_key = api_key or get_openrouter_api_key()
+    if not api_key:
+        raise APIError("OpenRouter API key not found. Please set it in Settings.")
+    return api_key
+
+
+async def _chat_completion(operation: str, api_key: str, data: dict[str, Any]) -> str:
+    """Send a chat completion request and return the reply text.
+
+    Args:
+        operation (str): Name of the API operation, used for retries.
+        api_key (str): OpenRouter API key.
+        data (Dict[str, Any]): Payload from ``_chat_payload``.
+
+    Returns:
+        str: The stripped reply text.
+
+    Raises:
+        APIError: If the request fails or the response has no reply.
+    """
+    headers = _openrouter_headers(api_key)
+    try:
+        response = await send_with_retry_async(
+            operation,
+            lambda: async_http_client.post(
+                OPENROUTER_API_URL, headers=headers, json=data, timeout=60
+            ),
+            idempotent=False,
+        )
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"].strip()
+    except (httpx.HTTPError, KeyError, IndexError, ValueError) as e:
+        raise APIError(f"OpenRouter API error: {str(e)}")
+
+
+async def get_openrouter_response_async(
+    prompt: str, model: str | None = None, api_key: str | None = None
+) -> str:
+    """Get a response from OpenRouter using the specified model or default.
+
+    Args:
+        prompt (str): The prompt to send to OpenRouter.
+        model (str, optional): Model ID to use. If None, uses default model. Defaults to None.
+        api_key (Optional[str]): OpenRouter API key. Defaults to the key from
+            session state or secrets.
+
+    Returns:
+        str: The response text from OpenRouter.
+
+    Raises:
+        APIError: If the API key is missing or the request fails.
+    """
+    api_key = _require_openrouter_key(api_key)
+    data = _chat_payload(model or DEFAULT_MODEL, prompt, max_tokens=512)
+    return await _chat_completion("get_openrouter_response", api_key, data)
+
+
+async def translate_script_async(
+    text: str, language: str, model: str | None = None, api_key: str | None = None
+) -> str:
+    """Translate the text to the given language using OpenRouter.
+
+    Args:
+        text (str): Text to translate.
+        language (str): Target language.
+        model (Optional[str]): Model to use. If None, uses default model from settings.
+        api_key (Optional[str]): OpenRouter API key. Defaults to the key from
+            session state or secrets.
+
+    Returns:
+        str: The translated text.
+
+    Raises:
+        APIError: If the API key is missing or the request fails.
+    """
+    return await get_openrouter_response_async(
+        _translation_prompt(text, language),
+        model=model or get_default_translation_model(),
+        api_key=api_key,
+    )
+
+
+async def translate_to_languages_async(
+    text: str,
+    languages: Iterable[str],
+    model: str | None = None,
+    max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    api_key: str | None = None,
+    return_exceptions: bool = False,
+) -> dict[str, str | APIError]:
+    """Translate one text into several languages concurrently.
+
+    Args:
+        text (str): Text to translate.
+        languages (Iterable[str]): Target languages; duplicates are translated once.
+        model (Optional[str]): Model to use. If None, uses default model from settings.
+        max_concurrency (int): Maximum translations in flight (default: 8).
+        api_key (Optional[str]): OpenRouter API key. Defaults to the key from
+            session state or secrets.
+        return_exceptions (bool): Map a failed language to its ``APIError``
+            instead of raising it (default: False).
+
+    Returns:
+        Dict[str, Union[str, APIError]]: The translation per language, in the
+        order of ``languages``.
+
+    Raises:
+        APIError: If the API key is missing, or a translation fails and
+            ``return_exceptions`` is not set.
+    """
+    api_key = _require_openrouter_key(api_key)
+    model = model or get_default_translation_model()
+    languages = list(dict.fromkeys(languages))
+    results = await gather_limited(
+        (
+            lambda language=language: translate_script_async(
+                text, language, model=model, api_key=api_key
+            )
+            for language in languages
+        ),
+        max_concurrency=max_concurrency,
+        return_exceptions=return_exceptions,
+    )
+    return dict(zip(languages, results))
+
+
+async def enhance_script_async(
+    script: str,
+    enhancement_prompt: str = "",
+    model_id: str | None = None,
+    api_key: str | None = None,
+) -> str:
+    """Enhance the given script using OpenRouter's LLM.
+
+    Uses Audio Tags enhancement when ``model_id`` is an ElevenLabs v3 model,
+    like :func:`scripts.openrouter_functions.enhance_script_with_openrouter`.
+
+    Args:
+        script (str): The script to enhance.
+        enhancement_prompt (str, optional): Optional prompt for enhancement guidance. Defaults to "".
+        model_id (str, optional): ElevenLabs model ID that determines the enhancement strategy. Defaults to None.
+        api_key (Optional[str]): OpenRouter API key. Defaults to the key from
+            session state or secrets.
+
+    Returns:
+        str: The enhanced script.
+
+    Raises:
+        APIError: If the API key is missing or the request fails.
+    """
+    api_key = _require_openrouter_key(api_key)
+    if model_id and supports_audio_tags(model_id):
+        operation = "enhance_script_for_v3"
+        data = _chat_payload(
+            DEFAULT_MODEL,
+            _v3_enhancement_prompt(script, enhancement_prompt),
+            system_prompt=V3_ENHANCEMENT_SYSTEM_PROMPT,
+            max_tokens=1024,
+        )
+    else:
+        operation = "enhance_script_with_openrouter"
+        data = _chat_payload(
+            get_default_enhancement_model(),
+            _enhancement_prompt(script, enhancement_prompt),
+            system_prompt=ENHANCEMENT_SYSTEM_PROMPT,
+            max_tokens=1024,
+        )
+    return await _chat_completion(operation, api_key, data)
+
+
+async def convert_word_to_phonetic_async(
+    word: str, language: str, model: str, api_key: str | None = None
+) -> str | None:
+    """Convert a word to its phonetic spelling in a given language using OpenRouter.
+
+    Args:
+        word (str): The word to convert to phonetic spelling.
+        language (str): The target language for phonetic conversion.
+        model (str): The model ID to use for conversion.
+        api_key (Optional[str]): OpenRouter API key. Defaults to the key from
+            session state or secrets.
+
+    Returns:
+        Optional[str]: The phonetic spelling of the word, or None if the reply is empty.
+
+    Raises:
+        APIError: If the API key is missing or the request fails.
+    """
+    result = await get_openrouter_response_async(
+        _phonetic_prompt(word, language, model), model=model, api_key=api_key
+    )
+    return result or None
@@ -0,0 +1,181 @@
+"""Pre-flight estimates for bulk generation runs.
+
+:func:`plan_bulk_run` looks at a prepared job list (see
+:mod:`scripts.bulk_preprocessing`) the way
+:func:`scripts.Elevenlabs_functions.bulk_generate_audio` will run it, and
+reports what the run will cost before any request is sent: resolved
+characters, rows skipped on resume, rows copied from identical rows, clips
+already in the audio cache, the characters and credits actually billed, and
+a rough wall time at the chosen concurrency. :func:`split_bulk_rows` and
+:func:`split_bulk_csv` cut a CSV that is over a character budget into parts
+that each fit.
+"""
+
+import io
+import math
+from collections.abc import Callable
+from typing import IO, Any
+
+import pandas as pd
+
+from scripts.bulk_preprocessing import (
+    BULK_CSV_CHUNK_ROWS,
+    group_bulk_jobs,
+    iter_bulk_csv,
+)
+from utils.model_capabilities import get_credits_per_character
+from utils.text_chunking import get_chunk_size
+
+# Rough generation speed used for wall time estimates
+ESTIMATED_REQUEST_OVERHEAD = 1.0  # Seconds per request before audio streams
+ESTIMATED_CHARS_PER_SECOND = 150.0  # Characters generated per second per request
+
+
+def estimate_request_seconds(chars: int, requests: int = 1) -> float:
+    """Estimate how long generating one clip takes.
+
+    Args:
+        chars (int): Characters in the clip.
+        requests (int): Requests the clip is generated in, one after the
+            other (default: 1).
+
+    Returns:
+        float: Estimated seconds.
+    """
+    return requests * ESTIMATED_REQUEST_OVERHEAD + chars / ESTIMATED_CHARS_PER_SECOND
+
+
+def plan_bulk_run(
+    jobs_df: pd.DataFrame,
+    model_id: str,
+    workers: int = 1,
+    is_complete: Callable[[int, str, str], bool] | None = None,
+    is_cached: Callable[[str], bool] | None = None,
+) -> dict[str, Any]:
+    """Estimate the characters, credits and time a bulk run will use.
+
+    Args:
+        jobs_df (pd.DataFrame): Job list from
+            :func:`scripts.bulk_preprocessing.prepare_bulk_jobs`.
+        model_id (str): ID of the model, for its chunk size and credits per
+            character.
+        workers (int): Requests generated in parallel (default: 1).
+        is_complete (Optional[Callable[[int, str, str], bool]]): Manifest check
+            for rows done by a previous run, as for
+            :func:`scripts.bulk_preprocessing.group_bulk_jobs`.
+        is_cached (Optional[Callable[[str], bool]]): True if the clip for a
+            request key is in the audio cache. No cache hits if None.
+
+    Returns:
+        Dict[str, Any]: Dictionary with:
+        - rows, chars: Rows and resolved characters in the CSV
+        - max_row_chars: Characters in the longest row
+        - skipped_rows: Rows already done by a previous run
+        - duplicate_rows, duplicate_chars: Rows copied from identical rows
+        - cached_rows, cached_chars: Rows served from the audio cache
+        - requests, billable_chars: API requests and the characters they bill
+        - credits: Estimated credits for ``billable_chars``
+        - estimated_seconds: Rough wall time at ``workers`` requests at once
+        - chunked_rows: Rows longer than one request, generated in chunks
+        - chunk_size: Characters per request for the model
+        - groups: The work split from
+          :func:`scripts.bulk_preprocessing.group_bulk_jobs`
+    """
+    groups = group_bulk_jobs(jobs_df, is_complete)
+    chars = jobs_df["chars"]
+    chunk_size = get_chunk_size(model_id)
+
+    cached_rows = 0
+    cached_chars = 0
+    request_chars = []
+    for jobs in groups["pending"]:
+        for index, _, _ in jobs:
+            if is_cached is not None and is_cached(jobs_df.at[index, "request_key"]):
+                cached_rows += 1
+                cached_chars += int(chars[index])
+            else:
+                request_chars.append(int(chars[index]))
+
+    duplicate_rows = [
+        index for jobs in groups["copies"].values() for index, _, _ in jobs
+    ]
+    billable_chars = sum(request_chars)
+    workers = max(int(workers), 1)
+    estimated_seconds = 0.0
+    # Bulk rows generate their chunks one after the other
+    request_counts = [max(math.ceil(count / chunk_size), 1) for count in request_chars]
+    if request_chars:
+        request_seconds = [
+            estimate_request_seconds(count, requests)
+            for count, requests in zip(request_chars, request_counts)
+        ]
+        estimated_seconds = max(sum(request_seconds) / workers, max(request_seconds))
+
+    return {
+        "rows": len(jobs_df),
+        "chars": int(chars.sum()),
+        "max_row_chars": int(chars.max()) if len(chars) else 0,
+        "skipped_rows": sum(len(jobs) for jobs in groups["skipped"]),
+        "duplicate_rows": len(duplicate_rows),
+        "duplicate_chars": int(chars[duplicate_rows].sum()),
+        "cached_rows": cached_rows,
+        "cached_chars": cached_chars,
+        "requests": sum(request_counts),
+        "billable_chars": billable_chars,
+        "credits": billable_chars * get_credits_per_character(model_id),
+        "estimated_seconds": estimated_seconds,
+        "chunked_rows": jobs_df.index[chars > chunk_size].tolist(),
+        "chunk_size": chunk_size,
+        "groups": groups,
+    }
+
+
+def split_bulk_rows(chars: pd.Series, max_chars: int) -> list[list[int]]:
+    """Split rows into consecutive parts of at most ``max_chars`` characters.
+
+    Parts follow CSV order. A single row longer than ``max_chars`` gets a
+    part of its own.
+
+    Args:
+        chars (pd.Series): Resolved characters per row, indexed by row.
+        max_chars (int): Character budget per part.
+
+    Returns:
+        List[List[int]]: Row indexes of each part.
+    """
+    parts: list[list[int]] = []
+    current: list[int] = []
+    current_chars = 0
+    for index, count in chars.items():
+        if current and current_chars + count > max_chars:
+            parts.append(current)
+            current, current_chars = [], 0
+        current.append(index)
+        current_chars += int(count)
+    if current:
+        parts.append(current)
+    return parts
+
+
+def split_bulk_csv(
+    csv_file: IO, parts: list[list[int]], chunksize: int = BULK_CSV_CHUNK_ROWS
+) -> list[bytes]:
+    """Write the rows of each part as a CSV of its own.
+
+    Args:
+        csv_file (IO): The bulk CSV; read from the start in chunks.
+        parts (List[List[int]]): Row indexes per part, from
+            :func:`split_bulk_rows`.
+        chunksize (int): Rows parsed at a time (default: 500).
+
+    Returns:
+        List[bytes]: UTF-8 CSV content per part, with the original header.
+    """
+    part_of_row = {index: number for number, rows in enumerate(parts) for index in rows}
+    buffers = [io.StringIO() for _ in parts]
+    for chunk in iter_bulk_csv(csv_file, chunksize=chunksize):
+        numbers = chunk.index.map(part_of_row)
+        for number, rows in chunk.groupby(numbers, sort=False):
+            buffer = buffers[int(number)]
+            rows.to_csv(buffer, index=False, header=buffer.tell() == 0)
+    return [buffer.getvalue().encode("utf-8") for buffer in buffers]
@@ -0,0 +1,381 @@
+"""Column-wise preparation of bulk CSVs into generation jobs.
+
+Before any API call, :func:`prepare_bulk_jobs` turns an uploaded bulk CSV into
+a compact job list: final texts, sanitized file names, validated output paths,
+request keys, character counts and rows whose file a later row overwrites.
+Every step works on whole columns, so preparing a large CSV is fast and the
+generation phase only handles ready-made work items.
+
+Uploads are parsed in chunks of BULK_CSV_CHUNK_ROWS rows (see
+:func:`iter_bulk_csv`): each chunk is reduced to its job rows before the next
+one is read, so only the compact job list grows with the file, never a full
+DataFrame of every variable column. Values are read as strings, exactly as
+written in the CSV, so chunk boundaries cannot change how a number renders.
+"""
+
+import os
+from collections.abc import Callable, Iterator
+from typing import IO, Any
+
+import pandas as pd
+
+from scripts.bulk_templates import (
+    find_unknown_placeholders,
+    render_templates,
+    variable_values,
+)
+from utils.audio_cache import make_audio_cache_key
+from utils.error_handling import ValidationError
+from utils.security import (
+    MAX_FILENAME_LENGTH,
+    sanitize_filename,
+    validate_path_within_base,
+)
+
+# Columns of the job list returned by prepare_bulk_jobs, indexed by CSV row
+BULK_JOB_COLUMNS = ["text", "output_path", "chars", "request_key", "overwritten"]
+
+BULK_CSV_CHUNK_ROWS = 500  # Rows parsed at a time
+
+# A job row as handed to the generation workers: (row index, text, output path)
+BulkJob = tuple[int, str, str]
+
+_UNSAFE_FILENAME_CHARS = r'[\\/:*?"<>|]'
+
+
+def sanitize_filenames(
+    filenames: pd.Series, max_length: int = MAX_FILENAME_LENGTH
+) -> pd.Series:
+    """Sanitize a column of file names like :func:`utils.security.sanitize_filename`.
+
+    The common case (a short name) is handled with vectorized string
+    operations; names that need truncating or end up empty fall back to the
+    scalar function so the results are identical.
+
+    Args:
+        filenames (pd.Series): File names to sanitize.
+        max_length (int): Maximum length of a name (default: 100).
+
+    Returns:
+        pd.Series: Sanitized file names, indexed like ``filenames``.
+    """
+    filenames = filenames.astype(str)
+    sanitized = filenames.str.replace(_UNSAFE_FILENAME_CHARS, "_", regex=True)
+    sanitized = sanitized.str.strip(". ")
+    fallback = (sanitized.str.len() > max_length) | sanitized.isin(["", ".", ".."])
+    if fallback.any():
+        sanitized[fallback] = filenames[fallback].map(
+            lambda name: sanitize_filename(name, max_length)
+        )
+    return sanitized
+
+
+def prepare_bulk_jobs(
+    df: pd.DataFrame,
+    output_dir: str,
+    voice_id: str,
+    model_id: str,
+    voice_settings: dict[str, Any],
+    speed: float | None = None,
+) -> pd.DataFrame:
+    """Build the job list for a bulk CSV.
+
+    Args:
+        df (pd.DataFrame): Bulk CSV with a ``text`` column, an optional
+            ``filename`` column and variable columns.
+        output_dir (str): Directory the audio files are written to.
+        voice_id (str): ID of the voice, part of the request key.
+        model_id (str): ID of the model, part of the request key.
+        voice_settings (Dict[str, Any]): Stability, similarity boost, style and
+            speaker boost settings, part of the request key.
+        speed (Optional[float]): Speed multiplier, part of the request key.
+
+    Returns:
+        pd.DataFrame: One row per CSV row (same index) with BULK_JOB_COLUMNS:
+        - text: Text with placeholders filled in
+        - output_path: File the row is written to
+        - chars: Number of characters in ``text``
+        - request_key: Audio cache key of the request
+        - overwritten: True if a later row writes the same file
+
+    Raises:
+        ValidationError: If a placeholder has no matching column or a file
+            name would leave ``output_dir``.
+    """
+    if "filename" in df.columns:
+        filename_templates = df["filename"].astype(str)
+    else:
+        filename_templates = pd.Series(
+            [f"audio_{index}" for index in df.index], index=df.index, dtype=object
+        )
+
+    unknown = find_unknown_placeholders(
+        pd.concat([df["text"], filename_templates]), list(df.columns)
+    )
+    if unknown:
+        raise ValidationError(
+            "CSV uses placeholders without a matching column",
+            "; ".join(
+                f"{{{name}}} in rows {', '.join(map(str, sorted(set(rows))))}"
+                for name, rows in unknown.items()
+            ),
+        )
+
+    values = variable_values(df)
+    texts = render_templates(df["text"], values)
+    filenames = sanitize_filenames(render_templates(filename_templates, values))
+    output_paths = os.path.join(output_dir, "") + filenames
+
+    # Sanitized names have no separators, so only "." or ".." could escape;
+    # anything unexpected is checked the slow way
+    abs_output_dir = os.path.abspath(output_dir)
+    suspicious = filenames.str.contains(r"[\\/]") | filenames.isin([".", ".."])
+    for index in filenames.index[suspicious]:
+        if not validate_path_within_base(output_paths[index], abs_output_dir):
+            raise ValidationError(
+                f"Invalid filename for row {index}",
+                "Filename contains invalid characters or path traversal",
+            )
+
+    request_keys = {
+        text: make_audio_cache_key(
+            text, voice_id, model_id, voice_settings, speed=speed
+        )
+        for text in texts.unique()
+    }
+    return pd.DataFrame(
+        {
+            "text": texts,
+            "output_path": output_paths,
+            "chars": texts.str.len(),
+            "request_key": texts.map(request_keys),
+            "overwritten": output_paths.duplicated(keep="last"),
+        },
+        index=df.index,
+        columns=BULK_JOB_COLUMNS,
+    )
+
+
+def _read_csv_chunks(csv_file: IO, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Parse a CSV from the start in chunks, reading every column as strings.
+
+    Args:
+        csv_file (IO): CSV file object.
+        chunksize (int): Rows per chunk.
+
+    Yields:
+        pd.DataFrame: The next chunk, indexed by row number in the file.
+    """
+    csv_file.seek(0)
+    with pd.read_csv(csv_file, dtype=str, chunksize=chunksize) as reader:
+        yield from reader
+
+
+def iter_bulk_csv(
+    csv_file: IO, chunksize: int = BULK_CSV_CHUNK_ROWS, max_rows: int | None = None
+) -> Iterator[pd.DataFrame]:
+    """Parse a bulk CSV chunk by chunk.
+
+    The header is checked once, before any row is returned. Chunks keep the
+    CSV's row numbers as their index, and a header-only file yields a single
+    empty chunk.
+
+    Args:
+        csv_file (IO): CSV file object; read from the start.
+        chunksize (int): Rows per chunk (default: 500).
+        max_rows (Optional[int]): Stop with an error once the file has more
+            rows than this. No limit if None.
+
+    Yields:
+        pd.DataFrame: The next chunk, with every column read as strings.
+
+    Raises:
+        ValidationError: If the CSV has no ``text`` column or too many rows.
+    """
+    rows = 0
+    for chunk in _read_csv_chunks(csv_file, chunksize):
+        if rows == 0 and "text" not in chunk.columns:
+            raise ValidationError(
+                "CSV must contain 'text' column",
+                "Please ensure your CSV file has a column named 'text'",
+            )
+        rows += len(chunk)
+        if max_rows is not None and rows > max_rows:
+            raise ValidationError(
+                f"CSV has more than {max_rows} rows",
+                "Please split your file into smaller batches",
+            )
+        yield chunk
+
+
+def scan_bulk_csv(
+    csv_file: IO,
+    preview_rows: int = 5,
+    chunksize: int = BULK_CSV_CHUNK_ROWS,
+) -> dict[str, Any]:
+    """Collect what the Bulk Generation page shows about an upload.
+
+    Args:
+        csv_file (IO): CSV file object; read from the start.
+        preview_rows (int): Number of leading rows to keep (default: 5).
+        chunksize (int): Rows parsed at a time (default: 500).
+
+    Returns:
+        Dict[str, Any]: Dictionary with:
+        - columns: Column names of the CSV
+        - rows: Number of rows
+        - preview: The first ``preview_rows`` rows
+        - unknown_placeholders: Row numbers per placeholder without a column,
+          as returned by :func:`scripts.bulk_templates.find_unknown_placeholders`
+
+    Placeholders are only checked if the CSV has a ``text`` column; the page
+    reports a missing one itself.
+    """
+    columns: list[str] = []
+    rows = 0
+    preview = None
+    unknown: dict[str, list] = {}
+    for chunk in _read_csv_chunks(csv_file, chunksize):
+        columns = list(chunk.columns)
+        if preview is None:
+            preview = chunk.head(preview_rows)
+        rows += len(chunk)
+        if "text" not in chunk.columns:
+            continue
+        templates = chunk["text"]
+        if "filename" in chunk.columns:
+            templates = pd.concat([templates, chunk["filename"]])
+        for name, name_rows in find_unknown_placeholders(templates, columns).items():
+            unknown.setdefault(name, []).extend(name_rows)
+    return {
+        "columns": columns,
+        "rows": rows,
+        "preview": preview,
+        "unknown_placeholders": unknown,
+    }
+
+
+def read_bulk_rows(
+    csv_file: IO, rows: list[int], chunksize: int = BULK_CSV_CHUNK_ROWS
+) -> pd.DataFrame:
+    """Read selected rows of a bulk CSV, e.g. the ones that failed.
+
+    Args:
+        csv_file (IO): CSV file object; read from the start.
+        rows (List[int]): Row numbers to keep.
+        chunksize (int): Rows parsed at a time (default: 500).
+
+    Returns:
+        pd.DataFrame: The selected rows, in file order.
+    """
+    wanted = pd.Index(rows)
+    return pd.concat(
+        chunk[chunk.index.isin(wanted)]
+        for chunk in iter_bulk_csv(csv_file, chunksize=chunksize)
+    )
+
+
+def read_bulk_jobs(
+    csv_file: IO,
+    output_dir: str,
+    voice_id: str,
+    model_id: str,
+    voice_settings: dict[str, Any],
+    speed: float | None = None,
+    chunksize: int = BULK_CSV_CHUNK_ROWS,
+    max_rows: int | None = None,
+) -> pd.DataFrame:
+    """Parse a bulk CSV in chunks straight into its job list.
+
+    Args:
+        csv_file (IO): CSV file object; read from the start.
+        output_dir (str): Directory the audio files are written to.
+        voice_id (str): ID of the voice, part of the request key.
+        model_id (str): ID of the model, part of the request key.
+        voice_settings (Dict[str, Any]): Voice settings, part of the request key.
+        speed (Optional[float]): Speed multiplier, part of the request key.
+        chunksize (int): Rows parsed at a time (default: 500).
+        max_rows (Optional[int]): Row limit; no limit if None.
+
+    Returns:
+        pd.DataFrame: Job list as returned by :func:`prepare_bulk_jobs`, for
+        the whole file.
+
+    Raises:
+        ValidationError: If the header, a placeholder or a file name is
+            invalid, or the file has more than ``max_rows`` rows.
+    """
+    jobs = pd.concat(
+        prepare_bulk_jobs(
+            chunk, output_dir, voice_id, model_id, voice_settings, speed=speed
+        )
+        for chunk in iter_bulk_csv(csv_file, chunksize=chunksize, max_rows=max_rows)
+    )
+    # A later chunk may overwrite a file named in an earlier one
+    jobs["overwritten"] = jobs["output_path"].duplicated(keep="last")
+    return jobs
+
+
+def group_bulk_jobs(
+    jobs_df: pd.DataFrame,
+    is_complete: Callable[[int, str, str], bool] | None = None,
+) -> dict[str, Any]:
+    """Split a job list into the work a bulk run has to do.
+
+    Rows writing the same file form a group, generated in CSV order so the
+    last row wins. Only the last row of a group decides what ends up in its
+    file, so a group whose last row is complete is skipped. A remaining
+    single-row group requesting the same audio as an earlier group is copied
+    from that group's file instead of being generated.
+
+    Args:
+        jobs_df (pd.DataFrame): Job list from :func:`prepare_bulk_jobs`.
+        is_complete (Optional[Callable[[int, str, str], bool]]): Called with
+            (row index, request key, output path) of a group's last row; True
+            if it was generated before and can be skipped. Nothing is skipped
+            if None.
+
+    Returns:
+        Dict[str, Any]: Dictionary with:
+        - skipped: Groups (lists of BulkJob) that are already complete
+        - pending: Groups to generate
+        - copies: Rows to copy, per request key
+        - sources: Request key -> the skipped or pending group whose file
+          provides the clip for ``copies``
+    """
+    request_keys = jobs_df["request_key"]
+    groups: dict[str, list[BulkJob]] = {}
+    for index, text, output_path in zip(
+        jobs_df.index, jobs_df["text"], jobs_df["output_path"]
+    ):
+        groups.setdefault(output_path, []).append((index, text, output_path))
+
+    skipped = []
+    to_run = []
+    sources: dict[str, list[BulkJob]] = {}
+    for output_path, jobs in groups.items():
+        last_index = jobs[-1][0]
+        request_key = request_keys[last_index]
+        if is_complete is not None and is_complete(
+            last_index, request_key, output_path
+        ):
+            skipped.append(jobs)
+            sources.setdefault(request_key, jobs)
+        else:
+            to_run.append(jobs)
+
+    pending = []
+    copies: dict[str, list[BulkJob]] = {}
+    for jobs in to_run:
+        request_key = request_keys[jobs[-1][0]]
+        if len(jobs) == 1 and request_key in sources:
+            copies.setdefault(request_key, []).append(jobs[0])
+        else:
+            pending.append(jobs)
+            sources.setdefault(request_key, jobs)
+    return {
+        "skipped": skipped,
+        "pending": pending,
+        "copies": copies,
+        "sources": {key: sources[key] for key in copies},
+    }
@@ -0,0 +1,134 @@
+"""Compiled text and filename templates for bulk generation.
+
+A bulk CSV row's ``text`` and ``filename`` may contain ``{column}``
+placeholders that are filled from the row's other columns. Rather than
+calling ``str.replace`` once per column for every row, each distinct template
+is parsed once (with :func:`scripts.functions.detect_string_variables`) into
+literal segments and variable names, and every row sharing that template is
+rendered at once by concatenating whole columns.
+"""
+
+import re
+from functools import lru_cache
+
+import pandas as pd
+
+from scripts.functions import detect_string_variables
+
+# Columns that hold templates rather than variable values
+TEMPLATE_COLUMNS = ("text", "filename")
+
+_PLACEHOLDER_PATTERN = re.compile(r"\{[^}]+\}")
+
+
+class CompiledTemplate:
+    """A template split into literal segments and placeholders.
+
+    ``literals`` has one more entry than ``variables``; rendering interleaves
+    them as ``literals[0] + value(variables[0]) + literals[1] + ...``.
+
+    Attributes:
+        template (str): The source template.
+        literals (Tuple[str, ...]): Text between placeholders.
+        variables (Tuple[str, ...]): Placeholder names in order of appearance.
+    """
+
+    def __init__(self, template: str):
+        """Parse a template.
+
+        Args:
+            template (str): Template with ``{name}`` placeholders.
+        """
+        self.template = template
+        self.variables = tuple(detect_string_variables(template))
+        self.literals = tuple(_PLACEHOLDER_PATTERN.split(template))
+
+    def render_column(self, values: pd.DataFrame) -> pd.Series:
+        """Render the template for every row of ``values`` at once.
+
+        Args:
+            values (pd.DataFrame): String values per variable column.
+
+        Returns:
+            pd.Series: Rendered strings, indexed like ``values``.
+        """
+        rendered = pd.Series(self.literals[0], index=values.index, dtype=object)
+        for name, literal in zip(self.variables, self.literals[1:]):
+            rendered = rendered + values[name] + literal
+        return rendered
+
+
+@lru_cache(maxsize=256)
+def compile_template(template: str) -> CompiledTemplate:
+    """Parse a template, reusing the result for repeated templates.
+
+    Args:
+        template (str): Template with ``{name}`` placeholders.
+
+    Returns:
+        CompiledTemplate: The parsed template.
+    """
+    return CompiledTemplate(template)
+
+
+def variable_values(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the variable columns of a bulk CSV to strings once.
+
+    Missing values become empty strings.
+
+    Args:
+        df (pd.DataFrame): The bulk CSV.
+
+    Returns:
+        pd.DataFrame: One string column per variable column.
+    """
+    columns = [col for col in df.columns if col not in TEMPLATE_COLUMNS]
+    values = df[columns].astype(object)
+    return values.where(values.notna(), "").astype(str)
+
+
+def render_templates(templates: pd.Series, values: pd.DataFrame) -> pd.Series:
+    """Render a column of templates against the variable columns.
+
+    Rows are grouped by template so each distinct template is rendered for
+    all of its rows in one pass.
+
+    Args:
+        templates (pd.Series): Template per row.
+        values (pd.DataFrame): Output of :func:`variable_values`, same index.
+
+    Returns:
+        pd.Series: Rendered text per row.
+
+    Raises:
+        KeyError: If a template uses a placeholder with no matching column;
+            check with :func:`find_unknown_placeholders` first.
+    """
+    templates = templates.astype(str)
+    rendered = pd.Series("", index=templates.index, dtype=object)
+    for template, rows in templates.groupby(templates, sort=False).groups.items():
+        rendered.loc[rows] = compile_template(template).render_column(values.loc[rows])
+    return rendered
+
+
+def find_unknown_placeholders(
+    templates: pd.Series, columns: list[str]
+) -> dict[str, list]:
+    """Find placeholders that no variable column can fill.
+
+    Args:
+        templates (pd.Series): Template per row.
+        columns (List[str]): Column names of the bulk CSV.
+
+    Returns:
+        Dict[str, List]: Row indexes per unknown placeholder name, in order of
+        first appearance. Empty if every placeholder has a column.
+    """
+    known = set(columns) - set(TEMPLATE_COLUMNS)
+    templates = templates.astype(str)
+    unknown: dict[str, list] = {}
+    for template, rows in templates.groupby(templates, sort=False).groups.items():
+        for name in compile_template(template).variables:
+            if name not in known:
+                unknown.setdefault(name, []).extend(rows)
+    return unknown
@@ -11,42 +11,79 @@ from typing import Any
 import requests
 import streamlit as st
 
+from utils import http_client
 from utils.api_keys import get_openrouter_api_key
+from utils.caching import single_flight, st_cache
 from utils.error_handling import APIError
 from utils.model_capabilities import supports_audio_tags
+from utils.retry import send_with_retry
 
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 OPENROUTER_MODELS_URL = "https://openrouter.ai/api/v1/models"
 DEFAULT_MODEL = "openrouter/auto"  # Use a free model or specify as needed
 DEFAULT_TRANSLATION_MODEL = "minimax/minimax-m2:free"
 DEFAULT_ENHANCEMENT_MODEL = "minimax/minimax-m2:free"
+MODELS_MAX_STALE_MINUTES = 12 * 60  # Hard bound on serving a stale model list
+V3_ENHANCEMENT_SYSTEM_PROMPT = "You are a helpful assistant specializing in ElevenLabs v3 Audio Tags script enhancement. You understand how to use Audio Tags to create expressive, natural-sounding speech."
+ENHANCEMENT_SYSTEM_PROMPT = (
+    "You are a helpful assistant for text-to-speech script enhancement."
+)
 
 
-def enhance_script_for_v3(
-    script: str, enhancement_prompt: str = "", progress_callback=None
-) -> tuple[bool, str]:
-    """Enhance the given script specifically for ElevenLabs v3 models using Audio Tags.
+def _openrouter_headers(api_key: str) -> dict[str, str]:
+    """Build the request headers for the OpenRouter API.
 
-    Audio Tags are square-bracketed tags that provide expressive control:
-    - Emotions: [excited], [sad], [angry], [happily], [sorrowful]
-    - Delivery: [whispers], [shouts], [x accent]
-    - Human reactions: [laughs], [clears throat], [sighs]
-    - Sound effects: [gunshot], [clapping], [explosion] (when contextually appropriate)
+    Args:
+        api_key (str): OpenRouter API key.
+
+    Returns:
+        Dict[str, str]: Authorization and content type headers.
+    """
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+def _chat_payload(
+    model: str,
+    prompt: str,
+    system_prompt: str | None = None,
+    max_tokens: int = 512,
+) -> dict[str, Any]:
+    """Build a chat completion request body.
 
     Args:
-        script (str): The script to enhance.
-        enhancement_prompt (str, optional): Optional prompt for enhancement guidance. Defaults to "".
-        progress_callback (Callable, optional): Optional callback function to update progress. Defaults to None.
+        model (str): OpenRouter model ID.
+        prompt (str): User message.
+        system_prompt (Optional[str]): System message, if any. Defaults to None.
+        max_tokens (int): Maximum tokens in the reply. Defaults to 512.
 
     Returns:
-        Tuple[bool, str]: Tuple containing (success, result) where success indicates if enhancement succeeded
-            and result contains the enhanced script or error message.
+        Dict[str, Any]: JSON payload for the chat completions endpoint.
     """
-    api_key = get_openrouter_api_key()
-    if not api_key:
-        return False, "OpenRouter API key not found. Please set it in Settings."
+    messages = [{"role": "user", "content": prompt}]
+    if system_prompt:
+        messages.insert(0, {"role": "system", "content": system_prompt})
+    return {
+        "model": model,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "temperature": 0.7,
+    }
+
+
+def _v3_enhancement_prompt(script: str, enhancement_prompt: str = "") -> str:
+    """Build the Audio Tags enhancement prompt for ElevenLabs v3 models.
 
-    prompt = f"""
+    Args:
+        script (str): The script to enhance.
+        enhancement_prompt (str, optional): Optional guidance. Defaults to "".
+
+    Returns:
+        str: Prompt for the enhancement model.
+    """
+    return f"""
 # Enhance the following script for ElevenLabs v3 Text-to-Speech using Audio Tags.
 
 ElevenLabs v3 models support Audio Tags - square-bracketed tags that control emotion, delivery, and natural speech patterns. Use Audio Tags instead of traditional XML tags.
@@ -89,27 +126,108 @@ Script to enhance:
 IMPORTANT: Provide ONLY the enhanced script as your response. Do not include any explanations, notes, or additional text. The enhanced script should use Audio Tags in square brackets [like this] and be ready for ElevenLabs v3 text-to-speech synthesis. Maintain the overall flow and coherence of the original text.
 """
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
-    data = {
-        "model": DEFAULT_MODEL,
-        "messages": [
-            {
-                "role": "system",
-                "content": "You are a helpful assistant specializing in ElevenLabs v3 Audio Tags script enhancement. You understand how to use Audio Tags to create expressive, natural-sounding speech.",
-            },
-            {"role": "user", "content": prompt},
-        ],
-        "max_tokens": 1024,
-        "temperature": 0.7,
-    }
+
+def _enhancement_prompt(script: str, enhancement_prompt: str = "") -> str:
+    """Build the enhancement prompt for models without Audio Tags.
+
+    Args:
+        script (str): The script to enhance.
+        enhancement_prompt (str, optional): Optional guidance. Defaults to "".
+
+    Returns:
+        str: Prompt for the enhancement model.
+    """
+    return f"""
+# Enhance the following script for text-to-speech purposes, focusing on creating a natural and expressive output.
+
+## Apply the following techniques:
+1. **Pauses:** Use <break> tags to add natural pauses in speech.
+2. **Emotional context:** Use <emotional context> tags to convey emotions.
+3. **Emphasis:** Apply strategic capitalization for important words or phrases.
+4. **Pacing:** Add descriptive language to control speed and rhythm.
+5. **Question emphasis:** Use multiple question marks for dramatic effect.
+6. **Dynamic speech:** Vary sentence structure and emphasis.
+7. **Pronunciation:** Use <phoneme> tags for unusual pronunciations.
+
+{html.unescape(enhancement_prompt) if enhancement_prompt else 'Use the existing context to improve the script, keeping in mind the techniques and examples provided above.'}
+
+Script to enhance:
+{html.unescape(script)}
+
+IMPORTANT: Provide ONLY the enhanced script as your response. Do not include any explanations, notes, or additional text. The enhanced script should be ready for text-to-speech synthesis and maintain the overall flow and coherence of the original text.
+"""
+
+
+def _translation_prompt(text: str, language: str) -> str:
+    """Build the translation prompt.
+
+    Args:
+        text (str): Text to translate.
+        language (str): Target language.
+
+    Returns:
+        str: Prompt for the translation model.
+    """
+    return f"Translate the following text to {language}:\n\n{text}"
+
+
+def _phonetic_prompt(word: str, language: str, model: str) -> str:
+    """Build the phonetic spelling prompt.
+
+    Args:
+        word (str): The word to convert.
+        language (str): The target language.
+        model (str): The model ID the spelling is for.
+
+    Returns:
+        str: Prompt for the conversion model.
+    """
+    if model == "eleven_monolingual_v1":
+        return f"You speak perfect {language}. Convert the word {word} into the phonetic spelling appropriate for the {language} language. Only respond with the phonetic spelling of the word, nothing else."
+    return f"You speak perfect {language}. Your goal is to pronounce this word correctly and help me not sound like a tourist. When I type something in English, you will translate and also give me the phonetic pronunciation. Only respond with the phonetic pronunciation of the word, nothing else."
+
+
+def enhance_script_for_v3(
+    script: str, enhancement_prompt: str = "", progress_callback=None
+) -> tuple[bool, str]:
+    """Enhance the given script specifically for ElevenLabs v3 models using Audio Tags.
+
+    Audio Tags are square-bracketed tags that provide expressive control:
+    - Emotions: [excited], [sad], [angry], [happily], [sorrowful]
+    - Delivery: [whispers], [shouts], [x accent]
+    - Human reactions: [laughs], [clears throat], [sighs]
+    - Sound effects: [gunshot], [clapping], [explosion] (when contextually appropriate)
+
+    Args:
+        script (str): The script to enhance.
+        enhancement_prompt (str, optional): Optional prompt for enhancement guidance. Defaults to "".
+        progress_callback (Callable, optional): Optional callback function to update progress. Defaults to None.
+
+    Returns:
+        Tuple[bool, str]: Tuple containing (success, result) where success indicates if enhancement succeeded
+            and result contains the enhanced script or error message.
+    """
+    api_key = get_openrouter_api_key()
+    if not api_key:
+        return False, "OpenRouter API key not found. Please set it in Settings."
+
+    prompt = _v3_enhancement_prompt(script, enhancement_prompt)
+    headers = _openrouter_headers(api_key)
+    data = _chat_payload(
+        DEFAULT_MODEL,
+        prompt,
+        system_prompt=V3_ENHANCEMENT_SYSTEM_PROMPT,
+        max_tokens=1024,
+    )
     try:
         if progress_callback:
             progress_callback(0.0)
-        response = requests.post(
-            OPENROUTER_API_URL, headers=headers, json=data, timeout=60
+        response = send_with_retry(
+            "enhance_script_for_v3",
+            lambda: http_client.post(
+                OPENROUTER_API_URL, headers=headers, json=data, timeout=60
+            ),
+            idempotent=False,
         )
         if progress_callback:
             progress_callback(0.99)
@@ -155,47 +273,23 @@ def enhance_script_with_openrouter(
     # (model_id parameter is only for ElevenLabs v3 routing logic)
     openrouter_model_id = get_default_enhancement_model()
 
-    prompt = f"""
-# Enhance the following script for text-to-speech purposes, focusing on creating a natural and expressive output.
-
-## Apply the following techniques:
-1. **Pauses:** Use <break> tags to add natural pauses in speech.
-2. **Emotional context:** Use <emotional context> tags to convey emotions.
-3. **Emphasis:** Apply strategic capitalization for important words or phrases.
-4. **Pacing:** Add descriptive language to control speed and rhythm.
-5. **Question emphasis:** Use multiple question marks for dramatic effect.
-6. **Dynamic speech:** Vary sentence structure and emphasis.
-7. **Pronunciation:** Use <phoneme> tags for unusual pronunciations.
-
-{html.unescape(enhancement_prompt) if enhancement_prompt else 'Use the existing context to improve the script, keeping in mind the techniques and examples provided above.'}
-
-Script to enhance:
-{html.unescape(script)}
-
-IMPORTANT: Provide ONLY the enhanced script as your response. Do not include any explanations, notes, or additional text. The enhanced script should be ready for text-to-speech synthesis and maintain the overall flow and coherence of the original text.
-"""
-
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
-    data = {
-        "model": openrouter_model_id,
-        "messages": [
-            {
-                "role": "system",
-                "content": "You are a helpful assistant for text-to-speech script enhancement.",
-            },
-            {"role": "user", "content": prompt},
-        ],
-        "max_tokens": 1024,
-        "temperature": 0.7,
-    }
+    prompt = _enhancement_prompt(script, enhancement_prompt)
+    headers = _openrouter_headers(api_key)
+    data = _chat_payload(
+        openrouter_model_id,
+        prompt,
+        system_prompt=ENHANCEMENT_SYSTEM_PROMPT,
+        max_tokens=1024,
+    )
     try:
         if progress_callback:
             progress_callback(0.0)
-        response = requests.post(
-            OPENROUTER_API_URL, headers=headers, json=data, timeout=60
+        response = send_with_retry(
+            "enhance_script_with_openrouter",
+            lambda: http_client.post(
+                OPENROUTER_API_URL, headers=headers, json=data, timeout=60
+            ),
+            idempotent=False,
         )
         if progress_callback:
             progress_callback(0.99)
@@ -220,21 +314,15 @@ def get_openrouter_response(prompt: str, model: str | None = None) -> str:
     api_key = get_openrouter_api_key()
     if not api_key:
         return "OpenRouter API key not found. Please set it in Settings."
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
-    data = {
-        "model": model or DEFAULT_MODEL,
-        "messages": [
-            {"role": "user", "content": prompt},
-        ],
-        "max_tokens": 512,
-        "temperature": 0.7,
-    }
+    headers = _openrouter_headers(api_key)
+    data = _chat_payload(model or DEFAULT_MODEL, prompt, max_tokens=512)
     try:
-        response = requests.post(
-            OPENROUTER_API_URL, headers=headers, json=data, timeout=60
+        response = send_with_retry(
+            "get_openrouter_response",
+            lambda: http_client.post(
+                OPENROUTER_API_URL, headers=headers, json=data, timeout=60
+            ),
+            idempotent=False,
         )
         response.raise_for_status()
         result = response.json()
@@ -261,7 +349,7 @@ def translate_script_with_openrouter(
     if model is None:
         model = get_default_translation_model()
 
-    prompt = f"Translate the following text to {language}:\n\n{text}"
+    prompt = _translation_prompt(text, language)
     return get_openrouter_response(prompt, model=model)
 
 
@@ -278,15 +366,11 @@ def convert_word_to_phonetic_openrouter(
     Returns:
         Optional[str]: The phonetic spelling of the word, or None if conversion fails.
     """
-    if model == "eleven_monolingual_v1":
-        prompt = f"You speak perfect {language}. Convert the word {word} into the phonetic spelling appropriate for the {language} language. Only respond with the phonetic spelling of the word, nothing else."
-    else:
-        prompt = f"You speak perfect {language}. Your goal is to pronounce this word correctly and help me not sound like a tourist. When I type something in English, you will translate and also give me the phonetic pronunciation. Only respond with the phonetic pronunciation of the word, nothing else."
+    prompt = _phonetic_prompt(word, language, model)
     result = get_openrouter_response(prompt, model=model)
     return result.strip() if result else None
 
 
-@st.cache_data(ttl=3600)
 def fetch_openrouter_models() -> list[dict[str, Any]]:
     """
     Fetch available models from OpenRouter API.
@@ -301,13 +385,39 @@ def fetch_openrouter_models() -> list[dict[str, Any]]:
     if not api_key:
         raise APIError("OpenRouter API key not found. Please set it in Settings.")
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+    return _request_openrouter_models(api_key)
+
+
+@st_cache(
+    ttl_minutes=60,
+    stale_while_revalidate=True,
+    max_stale_minutes=MODELS_MAX_STALE_MINUTES,
+)
+@single_flight
+def _request_openrouter_models(api_key: str) -> list[dict[str, Any]]:
+    """Request the model list from OpenRouter, coalescing concurrent calls.
+
+    Results are cached per API key. Once an hour old they are still served
+    while a background refresh runs, up to ``MODELS_MAX_STALE_MINUTES`` past
+    the TTL.
+
+    Args:
+        api_key (str): OpenRouter API key for authentication.
+
+    Returns:
+        List of model dictionaries containing model information.
+
+    Raises:
+        APIError: If the API request fails or returns an error response.
+    """
+    headers = _openrouter_headers(api_key)
 
     try:
-        response = requests.get(OPENROUTER_MODELS_URL, headers=headers, timeout=30)
+        response = send_with_retry(
+            "fetch_openrouter_models",
+            lambda: http_client.get(OPENROUTER_MODELS_URL, headers=headers, timeout=30),
+            idempotent=True,
+        )
         response.raise_for_status()
         data = response.json()
         return data.get("data", [])
@@ -315,6 +425,9 @@ def fetch_openrouter_models() -> list[dict[str, Any]]:
         raise APIError(f"Failed to fetch models from OpenRouter: {str(e)}")
 
 
+fetch_openrouter_models.clear = _request_openrouter_models.clear  # type: ignore[attr-defined]
+
+
 def identify_free_models(models: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """
     Identify free models from a list of models.
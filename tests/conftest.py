@@ -8,7 +8,10 @@ import pytest
 @pytest.fixture
 def mock_requests():
     """Mock requests for API tests."""
-    with patch("requests.get") as mock_get, patch("requests.post") as mock_post:
+    with (
+        patch("utils.http_client.get") as mock_get,
+        patch("utils.http_client.post") as mock_post,
+    ):
         yield mock_get, mock_post
 
 
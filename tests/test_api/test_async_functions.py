@@ -0,0 +1,252 @@
+"""Tests for the asyncio client functions."""
+
+import asyncio
+import inspect
+import json
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from scripts import Translation_functions, async_functions  # noqa: E402
+from scripts.Elevenlabs_functions import generate_audio  # noqa: E402
+from scripts.async_functions import (  # noqa: E402
+    enhance_script_async,
+    fetch_voices_async,
+    generate_audio_async,
+    run_async,
+    translate_to_languages_async,
+)
+from utils import async_http_client  # noqa: E402
+from utils.error_handling import APIError, TransientAPIError  # noqa: E402
+from utils.rate_limiter import AdaptiveScheduler  # noqa: E402
+
+
+@pytest.fixture
+def mock_transport(mocker):
+    """Route the shared async client through a handler set by the test."""
+    handlers = []
+    clients = []
+
+    def build_client():
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: handlers[0](request))
+        )
+        clients.append(client)
+        return client
+
+    mocker.patch.object(async_http_client, "_build_client", side_effect=build_client)
+    mocker.patch("utils.retry.asyncio.sleep", new=AsyncMock())
+    mocker.patch.object(async_functions, "get_openrouter_api_key", return_value="key")
+    yield handlers, clients
+
+
+def test_generate_audio_async_streams_to_file(mock_transport, tmp_path):
+    handlers, clients = mock_transport
+    handlers.append(lambda request: httpx.Response(200, content=b"mp3" * 1000))
+    output_path = tmp_path / "clip.mp3"
+
+    assert run_async(
+        generate_audio_async(
+            "api_key",
+            0.5,
+            "model_id",
+            0.75,
+            0,
+            True,
+            "voice_id",
+            "Hello",
+            str(output_path),
+        )
+    )
+    assert output_path.read_bytes() == b"mp3" * 1000
+    assert [p.name for p in tmp_path.iterdir()] == ["clip.mp3"]
+    assert clients[0].is_closed
+
+
+def test_generate_audio_async_takes_the_same_arguments_as_generate_audio():
+    assert inspect.signature(generate_audio_async) == inspect.signature(generate_audio)
+
+
+def test_generate_audio_async_resends_only_the_throttled_chunk(
+    mock_transport, tmp_path
+):
+    handlers, _ = mock_transport
+    sentences = [f"Sentence {n} " + "x" * 900 + "." for n in range(3)]
+    sent = []
+
+    def handler(request):
+        text = json.loads(request.content)["text"]
+        sent.append(text)
+        if text == sentences[1] and sent.count(text) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, content=b"")
+        return httpx.Response(200, content=text[:10].encode())
+
+    handlers.append(handler)
+    output_path = tmp_path / "long.mp3"
+
+    assert run_async(
+        generate_audio_async(
+            "api_key",
+            0.5,
+            "eleven_multilingual_v2",
+            0.7,
+            0.5,
+            True,
+            "voice_id",
+            " ".join(sentences),
+            str(output_path),
+            chunk_workers=1,
+            scheduler=AdaptiveScheduler(max_concurrency=1, requests_per_second=1000),
+        )
+    )
+    assert sent == [sentences[0], sentences[1], sentences[1], sentences[2]]
+    assert output_path.read_bytes() == b"Sentence 0Sentence 1Sentence 2"
+    assert [p.name for p in tmp_path.iterdir()] == ["long.mp3"]
+
+
+def test_generate_audio_async_raises_transient_error_on_429(mock_transport, tmp_path):
+    handlers, _ = mock_transport
+    handlers.append(
+        lambda request: httpx.Response(429, headers={"Retry-After": "2"}, content=b"")
+    )
+
+    with pytest.raises(TransientAPIError) as excinfo:
+        run_async(
+            generate_audio_async(
+                "api_key",
+                0.5,
+                "model_id",
+                0.75,
+                0,
+                True,
+                "voice_id",
+                "Hello",
+                str(tmp_path / "clip.mp3"),
+            )
+        )
+    assert excinfo.value.retry_after == 2.0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fetch_voices_async_retries_dropped_connection(mock_transport):
+    handlers, _ = mock_transport
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ReadError("connection reset", request=request)
+        return httpx.Response(200, json={"voices": [{"voice_id": "v1", "name": "A"}]})
+
+    handlers.append(handler)
+
+    assert run_async(fetch_voices_async("api_key")) == [("v1", "A")]
+    assert len(calls) == 2
+
+
+def test_translations_fan_out_on_one_client(mock_transport):
+    handlers, clients = mock_transport
+
+    def handler(request):
+        prompt = json.loads(request.content)["messages"][-1]["content"]
+        language = prompt.split(" to ")[1].split(":")[0]
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": f" {language} text "}}]}
+        )
+
+    handlers.append(handler)
+
+    result = run_async(
+        translate_to_languages_async(
+            "Hello", ["German", "French", "German", "Danish"], model="m"
+        )
+    )
+    assert result == {
+        "German": "German text",
+        "French": "French text",
+        "Danish": "Danish text",
+    }
+    assert len(clients) == 1
+
+
+def test_async_api_functions_are_coroutine_functions():
+    public = [
+        function
+        for name, function in vars(async_functions).items()
+        if name.endswith("_async")
+        and not name.startswith("_")
+        and function.__module__ == async_functions.__name__
+    ]
+
+    assert len(public) == 9
+    assert all(inspect.iscoroutinefunction(function) for function in public)
+
+
+def test_openrouter_failures_raise_api_error(mock_transport, mocker):
+    handlers, _ = mock_transport
+    handlers.append(lambda request: httpx.Response(400, json={"error": "bad"}))
+
+    with pytest.raises(APIError, match="OpenRouter API error"):
+        run_async(enhance_script_async("Hello", api_key="key"))
+
+    mocker.patch.object(async_functions, "get_openrouter_api_key", return_value=None)
+    with pytest.raises(APIError, match="API key not found"):
+        run_async(enhance_script_async("Hello"))
+
+
+def test_fan_out_can_return_failed_languages(mock_transport):
+    handlers, _ = mock_transport
+
+    def handler(request):
+        if "French" in request.content.decode():
+            return httpx.Response(500, json={})
+        return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+    handlers.append(handler)
+
+    result = run_async(
+        translate_to_languages_async(
+            "Hello", ["German", "French"], model="m", return_exceptions=True
+        )
+    )
+    assert result["German"] == "ok"
+    assert isinstance(result["French"], APIError)
+
+
+def test_translate_to_languages_reads_settings_on_the_calling_thread(
+    mock_transport, mocker
+):
+    handlers, _ = mock_transport
+    handlers.append(
+        lambda request: httpx.Response(
+            200, json={"choices": [{"message": {"content": "translated"}}]}
+        )
+    )
+    caller = threading.current_thread()
+
+    def session_setting(*args):
+        # st.session_state is only readable from the script thread
+        assert threading.current_thread() is caller
+        return "setting"
+
+    mocker.patch.object(
+        Translation_functions, "get_openrouter_api_key", session_setting
+    )
+    mocker.patch.object(
+        Translation_functions, "get_default_translation_model", session_setting
+    )
+    mocker.patch.object(async_functions, "get_openrouter_api_key", session_setting)
+
+    async def page_inside_event_loop():
+        # A running loop makes run_async use a helper thread
+        return Translation_functions.translate_to_languages(
+            "Hello", ["German", "French"]
+        )
+
+    assert asyncio.run(page_inside_event_loop()) == {
+        "German": "translated",
+        "French": "translated",
+    }
@@ -2,7 +2,6 @@ import base64
 import io
 from typing import Any
 
-import pandas as pd
 import pytest
 
 from scripts.Elevenlabs_functions import (
@@ -17,11 +16,11 @@ from utils.error_handling import APIError, ValidationError
 @pytest.mark.core_suite
 def test_generate_audio_success(mocker, tmp_path):
     mock_response = mocker.Mock()
-    mock_response.content = b"fake-bytes"
+    mock_response.iter_content.return_value = [b"fake-", b"bytes"]
     mock_response.raise_for_status = mocker.Mock()
 
     mocker.patch(
-        "scripts.Elevenlabs_functions.requests.post",
+        "scripts.Elevenlabs_functions.http_client.post",
         return_value=mock_response,
     )
     mocker.patch(
@@ -81,7 +80,7 @@ def test_generate_audio_api_error(mocker):
     from requests import exceptions as requests_exceptions
 
     mocker.patch(
-        "scripts.Elevenlabs_functions.requests.post",
+        "scripts.Elevenlabs_functions.http_client.post",
         side_effect=requests_exceptions.HTTPError("429"),
     )
 
@@ -109,7 +108,7 @@ def test_generate_voice_previews_success(mocker, tmp_path, monkeypatch):
     mock_response.json.return_value = {"previews": [fake_preview]}
 
     mocker.patch(
-        "scripts.Elevenlabs_functions.requests.post",
+        "scripts.Elevenlabs_functions.http_client.post",
         return_value=mock_response,
     )
 
@@ -136,7 +135,7 @@ def test_create_voice_from_preview_success(mocker):
     mock_response.raise_for_status = mocker.Mock()
     mock_response.json.return_value = {"status": "queued"}
     mocker.patch(
-        "scripts.Elevenlabs_functions.requests.post",
+        "scripts.Elevenlabs_functions.http_client.post",
         return_value=mock_response,
     )
 
@@ -165,7 +164,9 @@ def test_create_voice_from_preview_validation_error():
 def test_bulk_generate_audio_success(mocker, tmp_path, monkeypatch):
     # Arrange
     csv_content = (
-        "text,filename\nHello {name},greeting_{name}\nWorld {name},world_{name}"
+        "text,filename,name\n"
+        "Hello {name},greeting_{name},Alice\n"
+        "World {name},world_{name},Bob"
     )
     csv_file = io.BytesIO(csv_content.encode("utf-8"))
 
@@ -180,23 +181,11 @@ def test_bulk_generate_audio_success(mocker, tmp_path, monkeypatch):
         "scripts.Elevenlabs_functions.validate_path_within_base",
         return_value=True,
     )
-    mocker.patch(
-        "scripts.Elevenlabs_functions.sanitize_filename",
-        side_effect=lambda value: value + ".mp3",
-    )
 
     outputs_dir = tmp_path / "outputs"
     outputs_dir.mkdir()
     monkeypatch.chdir(tmp_path)
 
-    df_success = pd.DataFrame(
-        [
-            {"text": "Hello {name}", "filename": "greeting_{name}", "name": "Alice"},
-            {"text": "World {name}", "filename": "world_{name}", "name": "Bob"},
-        ]
-    )
-    mocker.patch("pandas.read_csv", return_value=df_success)
-
     success, message = bulk_generate_audio(
         api_key="sk-test",
         model_id="eleven_multilingual_v2",
@@ -227,9 +216,6 @@ def test_bulk_generate_audio_missing_columns(mocker, tmp_path, monkeypatch):
     outputs_dir.mkdir()
     monkeypatch.chdir(tmp_path)
 
-    df_invalid = pd.DataFrame([{"name": "Alice"}])
-    mocker.patch("pandas.read_csv", return_value=df_invalid)
-
     invalid_csv = io.BytesIO(b"name\nAlice")
     with pytest.raises(APIError):
         bulk_generate_audio(
@@ -251,7 +237,9 @@ def test_bulk_generate_audio_missing_columns(mocker, tmp_path, monkeypatch):
 def test_bulk_generate_audio_downstream_error(mocker, tmp_path, monkeypatch):
     # Arrange
     csv_content = (
-        "text,filename\nHello {name},greeting_{name}\nWorld {name},world_{name}"
+        "text,filename,name\n"
+        "Hello {name},greeting_{name},Alice\n"
+        "World {name},world_{name},Bob"
     )
     csv_file_error = io.BytesIO(csv_content.encode("utf-8"))
 
@@ -263,23 +251,11 @@ def test_bulk_generate_audio_downstream_error(mocker, tmp_path, monkeypatch):
         "scripts.Elevenlabs_functions.validate_path_within_base",
         return_value=True,
     )
-    mocker.patch(
-        "scripts.Elevenlabs_functions.sanitize_filename",
-        side_effect=lambda value: value + ".mp3",
-    )
 
     outputs_dir = tmp_path / "outputs"
     outputs_dir.mkdir()
     monkeypatch.chdir(tmp_path)
 
-    df_success = pd.DataFrame(
-        [
-            {"text": "Hello {name}", "filename": "greeting_{name}", "name": "Alice"},
-            {"text": "World {name}", "filename": "world_{name}", "name": "Bob"},
-        ]
-    )
-    mocker.patch("pandas.read_csv", return_value=df_success)
-
     with pytest.raises(APIError) as exc:
         bulk_generate_audio(
             api_key="sk-test",
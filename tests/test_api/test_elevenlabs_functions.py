@@ -1,10 +1,14 @@
 from io import StringIO
-from unittest.mock import MagicMock, mock_open
+from pathlib import Path
+from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
+import requests
 
 from scripts.Elevenlabs_functions import (
+    BULK_REPORT_COLUMNS,
+    BULK_REPORT_FILENAME,
     ValidationError,
     bulk_generate_audio,
     fetch_models,
@@ -13,10 +17,18 @@ from scripts.Elevenlabs_functions import (
     get_voice_id,
 )
 from scripts.functions import detect_string_variables
+from utils.error_handling import APIError, TransientAPIError
+from utils.rate_limiter import AdaptiveScheduler
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Write relative output paths such as output.mp3 into a temp directory."""
+    monkeypatch.chdir(tmp_path)
 
 
 def test_fetch_models(mocker):
-    mock_get = mocker.patch("scripts.Elevenlabs_functions.requests.get")
+    mock_get = mocker.patch("scripts.Elevenlabs_functions.http_client.get")
     mock_response = MagicMock()
     mock_response.json.return_value = [
         {"model_id": "model1", "name": "Model 1"},
@@ -29,7 +41,7 @@ def test_fetch_models(mocker):
 
 
 def test_fetch_voices(mocker):
-    mock_get = mocker.patch("scripts.Elevenlabs_functions.requests.get")
+    mock_get = mocker.patch("scripts.Elevenlabs_functions.http_client.get")
     mock_response = MagicMock()
     mock_response.json.return_value = {
         "voices": [
@@ -43,6 +55,19 @@ def test_fetch_voices(mocker):
     assert result == [("voice1", "Voice 1"), ("voice2", "Voice 2")]
 
 
+def test_fetch_voices_retries_dropped_connection(mocker):
+    mocker.patch("utils.retry.time.sleep")
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"voices": [{"voice_id": "v1", "name": "V1"}]}
+    mock_get = mocker.patch(
+        "scripts.Elevenlabs_functions.http_client.get",
+        side_effect=[requests.exceptions.ConnectionError("reset"), mock_response],
+    )
+
+    assert fetch_voices("retry_api_key") == [("v1", "V1")]
+    assert mock_get.call_count == 2
+
+
 def test_get_voice_id():
     voices = [("voice1", "Voice 1"), ("voice2", "Voice 2")]
     assert get_voice_id(voices, "Voice 1") == "voice1"
@@ -51,11 +76,10 @@ def test_get_voice_id():
 
 
 def test_generate_audio(mocker):
-    mock_post = mocker.patch("scripts.Elevenlabs_functions.requests.post")
-    mock_file = mocker.patch("scripts.Elevenlabs_functions.open", mock_open())
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
     mock_response = MagicMock()
     mock_response.ok = True
-    mock_response.content = b"fake audio content"
+    mock_response.iter_content.return_value = [b"fake audio content"]
     mock_post.return_value = mock_response
 
     success = generate_audio(
@@ -71,12 +95,89 @@ def test_generate_audio(mocker):
     )
 
     assert success is True
-    mock_file.assert_called_once_with("output.mp3", "wb")
-    mock_file().write.assert_called_once_with(b"fake audio content")
+    assert Path("output.mp3").read_bytes() == b"fake audio content"
+    assert mock_post.call_args.kwargs["stream"] is True
+
+
+def test_generate_audio_splits_long_text_into_chunks(mocker, tmp_path):
+    """Long texts are generated per sentence chunk with stitching context."""
+    sentences = [f"Sentence {n} " + "x" * 900 + "." for n in range(3)]
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
+
+    def respond(url, headers, json, timeout, stream):
+        response = MagicMock()
+        response.iter_content.return_value = [json["text"][:10].encode()]
+        return response
+
+    mock_post.side_effect = respond
+    output_path = tmp_path / "long.mp3"
+
+    success = generate_audio(
+        "fake_api_key",
+        0.5,
+        "eleven_multilingual_v2",
+        0.7,
+        0.5,
+        True,
+        "voice1",
+        " ".join(sentences),
+        str(output_path),
+    )
+
+    assert success is True
+    payloads = sorted(
+        (call.kwargs["json"] for call in mock_post.call_args_list),
+        key=lambda payload: payload["text"],
+    )
+    assert [payload["text"] for payload in payloads] == sentences
+    assert "previous_text" not in payloads[0]
+    assert payloads[0]["next_text"] == sentences[1][:300]
+    assert payloads[2]["previous_text"] == sentences[1][-300:]
+    assert "next_text" not in payloads[2]
+    assert output_path.read_bytes() == b"Sentence 0Sentence 1Sentence 2"
+    assert list(tmp_path.iterdir()) == [output_path]
+
+
+def test_generate_audio_resends_only_the_throttled_chunk(mocker, tmp_path):
+    """A 429 on one chunk does not pay again for the chunks that finished."""
+    sentences = [f"Sentence {n} " + "x" * 900 + "." for n in range(3)]
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
+    sent = []
+
+    def respond(url, headers, json, timeout, stream):
+        sent.append(json["text"])
+        response = MagicMock()
+        if json["text"] == sentences[1] and sent.count(sentences[1]) == 1:
+            response.status_code = 429
+            response.headers = {"Retry-After": "0"}
+        else:
+            response.status_code = 200
+            response.iter_content.return_value = [json["text"][:10].encode()]
+        return response
+
+    mock_post.side_effect = respond
+    output_path = tmp_path / "long.mp3"
+
+    generate_audio(
+        "fake_api_key",
+        0.5,
+        "eleven_multilingual_v2",
+        0.7,
+        0.5,
+        True,
+        "voice1",
+        " ".join(sentences),
+        str(output_path),
+        chunk_workers=1,
+        scheduler=AdaptiveScheduler(max_concurrency=1, requests_per_second=1000),
+    )
+
+    assert sent == [sentences[0], sentences[1], sentences[1], sentences[2]]
+    assert output_path.read_bytes() == b"Sentence 0Sentence 1Sentence 2"
 
 
 def test_generate_audio_failure(mocker):
-    mock_post = mocker.patch("scripts.Elevenlabs_functions.requests.post")
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
     mock_response = MagicMock()
     mock_response.ok = False
     mock_response.text = "API Error"
@@ -104,6 +205,63 @@ def test_generate_audio_failure(mocker):
     assert "Failed to generate audio" in str(exc_info.value)
 
 
+def test_generate_audio_interrupted_stream_leaves_no_file(mocker, tmp_path):
+    """A dropped stream never leaves a partial clip or temp file behind."""
+    import requests
+
+    def broken_stream(chunk_size):
+        yield b"first chunk"
+        raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
+    mock_post.return_value.iter_content.side_effect = broken_stream
+
+    with pytest.raises(Exception) as exc_info:
+        generate_audio(
+            "fake_api_key",
+            0.5,
+            "model1",
+            0.7,
+            0.5,
+            True,
+            "voice1",
+            "Hello, world!",
+            str(tmp_path / "clip.mp3"),
+        )
+
+    assert "Failed to generate audio" in str(exc_info.value)
+    assert list(tmp_path.iterdir()) == []
+    mock_post.return_value.close.assert_called_once()
+
+
+def test_generate_audio_serves_repeat_requests_from_cache(mocker, tmp_path):
+    """An identical second request is copied from the audio cache."""
+    from utils.audio_cache import AudioCache
+
+    cache = AudioCache(cache_dir=str(tmp_path / "cache"))
+    mocker.patch("scripts.Elevenlabs_functions.get_audio_cache", return_value=cache)
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
+    mock_post.return_value.iter_content.return_value = [b"cached audio"]
+
+    for name in ("first.mp3", "second.mp3"):
+        assert generate_audio(
+            "fake_api_key",
+            0.5,
+            "model1",
+            0.7,
+            0.5,
+            True,
+            "voice1",
+            "Hello, world!",
+            str(tmp_path / name),
+            use_cache=True,
+        )
+
+    assert mock_post.call_count == 1
+    assert (tmp_path / "second.mp3").read_bytes() == b"cached audio"
+    assert cache.get_stats()["hits"] == 1
+
+
 def test_process_text():
     """Test variable detection using detect_string_variables (replaces removed process_text)."""
     text = "Hello {name}\\nWelcome to {place}!"
@@ -174,14 +332,13 @@ def test_bulk_generate_audio_with_empty_csv(mocker):
 
 def test_bulk_generate_audio_with_random_seed(mocker):
     # Mock the HTTP request to generate_audio
-    mock_post = mocker.patch("scripts.Elevenlabs_functions.requests.post")
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.content = b"fake_audio_content"
+    mock_response.iter_content.return_value = [b"fake_audio_content"]
     mock_post.return_value = mock_response
 
     # Mock file operations
-    mocker.patch("scripts.Elevenlabs_functions.open", mock_open())
     mocker.patch("os.makedirs")
 
     csv_content = "text,filename\nHello {name},greeting_{name}"
@@ -206,11 +363,10 @@ def test_bulk_generate_audio_with_random_seed(mocker):
 
 
 def test_generate_audio_with_speed(mocker):
-    mock_post = mocker.patch("scripts.Elevenlabs_functions.requests.post")
-    mock_file = mocker.patch("scripts.Elevenlabs_functions.open", mock_open())
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
     mock_response = MagicMock()
     mock_response.ok = True
-    mock_response.content = b"fake audio content"
+    mock_response.iter_content.return_value = [b"fake audio content"]
     mock_post.return_value = mock_response
     # Test valid speed with multilingual v2 model
     success = generate_audio(
@@ -344,11 +500,10 @@ def test_speed_validation_for_other_models():
 
 def test_multilingual_v2_speed_exclusion(mocker):
     """Test that speed is excluded from payload for eleven_multilingual_v2 when not provided."""
-    mock_post = mocker.patch("scripts.Elevenlabs_functions.requests.post")
-    mock_file = mocker.patch("scripts.Elevenlabs_functions.open", mock_open())
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
     mock_response = MagicMock()
     mock_response.ok = True
-    mock_response.content = b"fake audio content"
+    mock_response.iter_content.return_value = [b"fake audio content"]
     mock_post.return_value = mock_response
 
     success = generate_audio(
@@ -378,11 +533,10 @@ def test_multilingual_v2_speed_exclusion(mocker):
 
 def test_monolingual_v1_no_speed_in_payload(mocker):
     """Test that speed is never included in payload for monolingual v1 even if validation passes somehow."""
-    mock_post = mocker.patch("scripts.Elevenlabs_functions.requests.post")
-    mock_file = mocker.patch("scripts.Elevenlabs_functions.open", mock_open())
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
     mock_response = MagicMock()
     mock_response.ok = True
-    mock_response.content = b"fake audio content"
+    mock_response.iter_content.return_value = [b"fake audio content"]
     mock_post.return_value = mock_response
 
     # This should pass validation since speed=None
@@ -408,11 +562,10 @@ def test_monolingual_v1_no_speed_in_payload(mocker):
 
 def test_common_settings_all_models(mocker):
     """Test that common voice settings work with all models."""
-    mock_post = mocker.patch("scripts.Elevenlabs_functions.requests.post")
-    mock_file = mocker.patch("scripts.Elevenlabs_functions.open", mock_open())
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
     mock_response = MagicMock()
     mock_response.ok = True
-    mock_response.content = b"fake audio content"
+    mock_response.iter_content.return_value = [b"fake audio content"]
     mock_post.return_value = mock_response
 
     models_to_test = ["eleven_monolingual_v1", "eleven_multilingual_v2"]
@@ -459,11 +612,10 @@ def test_common_settings_all_models(mocker):
 
 def test_payload_structure_per_model(mocker):
     """Test that payload structure is correct for different model types."""
-    mock_post = mocker.patch("scripts.Elevenlabs_functions.requests.post")
-    mock_file = mocker.patch("scripts.Elevenlabs_functions.open", mock_open())
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
     mock_response = MagicMock()
     mock_response.ok = True
-    mock_response.content = b"fake audio content"
+    mock_response.iter_content.return_value = [b"fake audio content"]
     mock_post.return_value = mock_response
 
     # Test monolingual v1 - should not have speed
@@ -540,12 +692,11 @@ def test_payload_structure_per_model(mocker):
 
 def test_bulk_generation_model_compatibility(mocker):
     """Test that bulk generation respects model-voice setting compatibility."""
-    mock_post = mocker.patch("scripts.Elevenlabs_functions.requests.post")
-    mock_file = mocker.patch("scripts.Elevenlabs_functions.open", mock_open())
+    mock_post = mocker.patch("scripts.Elevenlabs_functions.http_client.post")
     mocker.patch("os.makedirs")
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.content = b"fake_audio_content"
+    mock_response.iter_content.return_value = [b"fake_audio_content"]
     mock_post.return_value = mock_response
 
     csv_content = "text,filename\nHello {name},greeting_{name}"
@@ -591,3 +742,449 @@ def test_bulk_generation_model_compatibility(mocker):
         )
     # Verify the error message contains the validation error
     assert "Speed parameter is not supported for model" in str(exc_info.value)
+
+
+# Concurrent bulk generation tests
+
+
+def test_bulk_generate_audio_concurrent_reports_each_row(mocker, tmp_path, monkeypatch):
+    """Rows run on a worker pool and each finished row is reported once."""
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "outputs" / "demo"
+    generated = []
+
+    def fake_generate_audio(*args, **kwargs):
+        generated.append((args[7], args[8]))
+        return True
+
+    mocker.patch(
+        "scripts.Elevenlabs_functions.generate_audio", side_effect=fake_generate_audio
+    )
+    csv_file = StringIO(
+        "text,filename,name\n"
+        "Hello {name},greeting_{name}.mp3,Alice\n"
+        "Hello {name},greeting_{name}.mp3,Bob\n"
+        "Bye {name},bye_{name}.mp3,Carol\n"
+    )
+    reported = []
+
+    success, message = bulk_generate_audio(
+        "fake_api_key",
+        "model1",
+        "voice1",
+        csv_file,
+        str(output_dir),
+        {
+            "stability": 0.5,
+            "similarity_boost": 0.7,
+            "style": 0.5,
+            "use_speaker_boost": True,
+        },
+        max_workers=3,
+        row_callback=lambda index, path: reported.append((index, path)),
+    )
+
+    assert success is True
+    assert "3 files" in message
+    assert sorted(reported) == [
+        (0, str(output_dir / "greeting_Alice.mp3")),
+        (1, str(output_dir / "greeting_Bob.mp3")),
+        (2, str(output_dir / "bye_Carol.mp3")),
+    ]
+    assert sorted(text for text, _ in generated) == [
+        "Bye Carol",
+        "Hello Alice",
+        "Hello Bob",
+    ]
+
+
+def test_bulk_generate_audio_concurrent_keeps_row_order_for_shared_paths(
+    mocker, tmp_path, monkeypatch
+):
+    """Rows resolving to the same file are generated in CSV order."""
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "outputs" / "demo"
+    generated = []
+    mocker.patch(
+        "scripts.Elevenlabs_functions.generate_audio",
+        side_effect=lambda *args, **kwargs: generated.append(args[7]) or True,
+    )
+    csv_file = StringIO("text,filename\nfirst,same.mp3\nsecond,same.mp3\n")
+
+    bulk_generate_audio(
+        "fake_api_key",
+        "model1",
+        "voice1",
+        csv_file,
+        str(output_dir),
+        {
+            "stability": 0.5,
+            "similarity_boost": 0.7,
+            "style": 0.5,
+            "use_speaker_boost": True,
+        },
+        max_workers=4,
+    )
+
+    assert generated == ["first", "second"]
+
+
+def test_bulk_generate_audio_resumes_after_failure(mocker, tmp_path, monkeypatch):
+    """A rerun skips rows checkpointed by the failed run."""
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "outputs" / "demo"
+    generated = []
+    failing = {"Row two"}
+
+    def fake_generate_audio(*args, **kwargs):
+        text, output_path = args[7], args[8]
+        generated.append(text)
+        if text in failing:
+            raise APIError("Failed to generate audio", "boom")
+        with open(output_path, "wb") as f:
+            f.write(text.encode())
+        return True
+
+    mocker.patch(
+        "scripts.Elevenlabs_functions.generate_audio", side_effect=fake_generate_audio
+    )
+    csv_text = "text,filename\nRow one,one.mp3\nRow two,two.mp3\nRow three,three.mp3\n"
+    settings = {
+        "stability": 0.5,
+        "similarity_boost": 0.7,
+        "style": 0.5,
+        "use_speaker_boost": True,
+    }
+
+    with pytest.raises(APIError):
+        bulk_generate_audio(
+            "fake_api_key",
+            "model1",
+            "voice1",
+            StringIO(csv_text),
+            str(output_dir),
+            settings,
+        )
+    assert generated[:2] == ["Row one", "Row two"]
+    first_run = set(generated)
+
+    generated.clear()
+    failing.clear()
+    success, message = bulk_generate_audio(
+        "fake_api_key",
+        "model1",
+        "voice1",
+        StringIO(csv_text),
+        str(output_dir),
+        settings,
+    )
+
+    assert success is True
+    assert "Row one" not in generated
+    # Row three may already have started before the failure was seen
+    assert generated == ["Row two"] + (
+        [] if "Row three" in first_run else ["Row three"]
+    )
+    assert f"{3 - len(generated)} already done" in message
+
+    generated.clear()
+    bulk_generate_audio(
+        "fake_api_key",
+        "model1",
+        "voice1",
+        StringIO(csv_text),
+        str(output_dir),
+        settings,
+        resume=False,
+    )
+    assert generated == ["Row one", "Row two", "Row three"]
+
+
+def test_bulk_generate_audio_continue_on_error_reports_each_row(
+    mocker, tmp_path, monkeypatch
+):
+    """A failed row is reported without stopping the other rows."""
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "outputs" / "demo"
+
+    def fake_generate_audio(*args, **kwargs):
+        text, output_path = args[7], args[8]
+        if text == "bad":
+            raise APIError("Failed to generate audio", "quota exceeded")
+        with open(output_path, "wb") as f:
+            f.write(b"x" * 10)
+        return True
+
+    mocker.patch(
+        "scripts.Elevenlabs_functions.generate_audio", side_effect=fake_generate_audio
+    )
+    csv_file = StringIO(
+        "text,filename\ngood,one.mp3\nbad,two.mp3\ngood too,three.mp3\n"
+    )
+    snapshots = []
+
+    success, message = bulk_generate_audio(
+        "fake_api_key",
+        "model1",
+        "voice1",
+        csv_file,
+        str(output_dir),
+        {
+            "stability": 0.5,
+            "similarity_boost": 0.7,
+            "style": 0.5,
+            "use_speaker_boost": True,
+        },
+        max_workers=2,
+        continue_on_error=True,
+        progress_callback=snapshots.append,
+    )
+
+    assert success is False
+    assert "1 failed rows" in message
+    assert [snapshot["rows_processed"] for snapshot in snapshots] == [0, 1, 2, 3]
+    final = snapshots[-1]
+    assert (final["rows_done"], final["rows_failed"], final["total"]) == (2, 1, 3)
+    assert final["bytes_written"] == 20
+    assert final["eta_seconds"] == 0.0
+    report = pd.read_csv(output_dir / BULK_REPORT_FILENAME)
+    assert list(report.columns) == BULK_REPORT_COLUMNS
+    assert report["status"].tolist() == ["ok", "failed", "ok"]
+    assert report["bytes"].tolist()[::2] == [10, 10]
+    assert "quota exceeded" in report.loc[1, "error"]
+    assert report.loc[2, "output_path"] == str(output_dir / "three.mp3")
+
+
+def test_bulk_generate_audio_failure_still_writes_report(mocker, tmp_path, monkeypatch):
+    """Stopping at the first failure marks the rows that never ran."""
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "outputs" / "demo"
+    mocker.patch(
+        "scripts.Elevenlabs_functions.generate_audio",
+        side_effect=APIError("Failed to generate audio", "boom"),
+    )
+    csv_file = StringIO("text,filename\nfirst,same.mp3\nsecond,same.mp3\n")
+
+    with pytest.raises(APIError):
+        bulk_generate_audio(
+            "fake_api_key",
+            "model1",
+            "voice1",
+            csv_file,
+            str(output_dir),
+            {
+                "stability": 0.5,
+                "similarity_boost": 0.7,
+                "style": 0.5,
+                "use_speaker_boost": True,
+            },
+        )
+
+    report = pd.read_csv(output_dir / BULK_REPORT_FILENAME)
+    assert report["status"].tolist() == ["failed", "cancelled"]
+
+
+def test_generate_audio_raises_transient_error_on_429(mocker):
+    response = MagicMock(status_code=429, headers={"Retry-After": "3"})
+    mocker.patch("scripts.Elevenlabs_functions.http_client.post", return_value=response)
+
+    with pytest.raises(TransientAPIError) as exc:
+        generate_audio("fake_api_key", 0.5, "model1", 0.7, 0.5, True, "voice1", "Hello")
+
+    assert exc.value.retry_after == 3.0
+    response.close.assert_called_once()
+
+
+def test_bulk_generate_audio_retries_throttled_rows(mocker, tmp_path, monkeypatch):
+    """A 429 on one row is retried instead of failing the job."""
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "outputs" / "demo"
+    attempts = []
+
+    def fake_generate_audio(*args, **kwargs):
+        def request():
+            attempts.append(args[7])
+            if attempts.count(args[7]) == 1 and args[7] == "two":
+                raise TransientAPIError(
+                    "Failed to generate audio", status_code=429, retry_after=0.01
+                )
+            return True
+
+        return kwargs["scheduler"].run(request)
+
+    mocker.patch(
+        "scripts.Elevenlabs_functions.generate_audio", side_effect=fake_generate_audio
+    )
+    success, message = bulk_generate_audio(
+        "fake_api_key",
+        "model1",
+        "voice1",
+        StringIO("text,filename\none,one.mp3\ntwo,two.mp3\n"),
+        str(output_dir),
+        {
+            "stability": 0.5,
+            "similarity_boost": 0.7,
+            "style": 0.5,
+            "use_speaker_boost": True,
+        },
+        max_workers=2,
+    )
+
+    assert success is True
+    assert sorted(attempts) == ["one", "two", "two"]
+
+
+def test_bulk_generate_audio_does_not_resend_rows_after_server_errors(
+    mocker, tmp_path, monkeypatch
+):
+    """A 5xx may come after the clip was billed, so the row fails instead."""
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "outputs" / "demo"
+    attempts = []
+
+    def fake_generate_audio(*args, **kwargs):
+        attempts.append(args[7])
+        if args[7] == "two":
+            raise TransientAPIError(
+                "Failed to generate audio", status_code=503, retry_after=0.01
+            )
+        return True
+
+    mocker.patch(
+        "scripts.Elevenlabs_functions.generate_audio", side_effect=fake_generate_audio
+    )
+    with pytest.raises(APIError):
+        bulk_generate_audio(
+            "fake_api_key",
+            "model1",
+            "voice1",
+            StringIO("text,filename\none,one.mp3\ntwo,two.mp3\n"),
+            str(output_dir),
+            {
+                "stability": 0.5,
+                "similarity_boost": 0.7,
+                "style": 0.5,
+                "use_speaker_boost": True,
+            },
+            max_workers=2,
+        )
+
+    assert sorted(attempts) == ["one", "two"]
+    report = pd.read_csv(output_dir / BULK_REPORT_FILENAME)
+    assert report.set_index("row").loc[1, "status"] == "failed"
+
+
+def test_bulk_generate_audio_rejects_unknown_placeholders(
+    mocker, tmp_path, monkeypatch
+):
+    """Typos in placeholders are reported before any row is generated."""
+    monkeypatch.chdir(tmp_path)
+    generate = mocker.patch("scripts.Elevenlabs_functions.generate_audio")
+    csv_file = StringIO(
+        "text,filename,name\nHello {name},a_{name}.mp3,Alice\nBye {nmae},b.mp3,Bob\n"
+    )
+
+    with pytest.raises(APIError) as excinfo:
+        bulk_generate_audio(
+            "fake_api_key",
+            "model1",
+            "voice1",
+            csv_file,
+            str(tmp_path / "outputs" / "demo"),
+            {
+                "stability": 0.5,
+                "similarity_boost": 0.7,
+                "style": 0.5,
+                "use_speaker_boost": True,
+            },
+        )
+
+    assert "{nmae} in rows 1" in str(excinfo.value)
+    generate.assert_not_called()
+
+
+def test_bulk_generate_audio_generates_repeated_rows_once(
+    mocker, tmp_path, monkeypatch
+):
+    """Rows with the same request share one generation, also on resume."""
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "outputs" / "demo"
+    generated = []
+
+    def fake_generate_audio(*args, **kwargs):
+        text, output_path = args[7], args[8]
+        generated.append(text)
+        with open(output_path, "wb") as f:
+            f.write(text.encode())
+        return True
+
+    mocker.patch(
+        "scripts.Elevenlabs_functions.generate_audio", side_effect=fake_generate_audio
+    )
+    settings = {
+        "stability": 0.5,
+        "similarity_boost": 0.7,
+        "style": 0.5,
+        "use_speaker_boost": True,
+    }
+    csv_text = "text,filename\nPress one,a.mp3\nGoodbye,b.mp3\nPress one,c.mp3\n"
+
+    success, message = bulk_generate_audio(
+        "fake_api_key",
+        "model1",
+        "voice1",
+        StringIO(csv_text),
+        str(output_dir),
+        settings,
+        max_workers=3,
+    )
+
+    assert success is True
+    assert "1 copied from identical rows" in message
+    assert sorted(generated) == ["Goodbye", "Press one"]
+    assert (output_dir / "c.mp3").read_bytes() == b"Press one"
+    report = pd.read_csv(output_dir / BULK_REPORT_FILENAME)
+    assert report["status"].tolist() == ["ok", "ok", "ok"]
+
+    generated.clear()
+    success, message = bulk_generate_audio(
+        "fake_api_key",
+        "model1",
+        "voice1",
+        StringIO(csv_text + "Press one,d.mp3\n"),
+        str(output_dir),
+        settings,
+    )
+
+    assert generated == []
+    assert (output_dir / "d.mp3").read_bytes() == b"Press one"
+
+
+def test_bulk_generate_audio_refuses_jobs_over_character_budget(
+    mocker, tmp_path, monkeypatch
+):
+    """A job over its character budget is refused before any request."""
+    monkeypatch.chdir(tmp_path)
+    generate = mocker.patch("scripts.Elevenlabs_functions.generate_audio")
+    csv_text = "text,filename\nHello there,a.mp3\nHello there,b.mp3\nBye,c.mp3\n"
+    settings = {
+        "stability": 0.5,
+        "similarity_boost": 0.7,
+        "style": 0.5,
+        "use_speaker_boost": True,
+    }
+
+    with pytest.raises(APIError) as excinfo:
+        bulk_generate_audio(
+            "fake_api_key",
+            "model1",
+            "voice1",
+            StringIO(csv_text),
+            str(tmp_path / "outputs" / "demo"),
+            settings,
+            max_characters=10,
+        )
+
+    # The repeated row is copied, so only 11 + 3 characters are billed
+    assert "needs 14 characters" in str(excinfo.value)
+    generate.assert_not_called()
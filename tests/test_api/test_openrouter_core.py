@@ -48,7 +48,7 @@ def test_get_openrouter_response_success(mocker):
         "scripts.openrouter_functions.get_openrouter_api_key", return_value="sk"
     )
     mocker.patch(
-        "scripts.openrouter_functions.requests.post",
+        "scripts.openrouter_functions.http_client.post",
         return_value=mock_response,
     )
 
@@ -63,7 +63,7 @@ def test_get_openrouter_response_error(mocker):
         "scripts.openrouter_functions.get_openrouter_api_key", return_value="sk"
     )
     mocker.patch(
-        "scripts.openrouter_functions.requests.post",
+        "scripts.openrouter_functions.http_client.post",
         side_effect=Exception("Timeout"),
     )
 
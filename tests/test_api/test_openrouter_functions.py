@@ -23,7 +23,7 @@ def mock_streamlit_session(monkeypatch, request):
 
 @pytest.fixture
 def mock_post():
-    with patch("scripts.openrouter_functions.requests.post") as mock:
+    with patch("scripts.openrouter_functions.http_client.post") as mock:
         mock.return_value = MagicMock(
             status_code=200,
             json=lambda: {"choices": [{"message": {"content": "mocked response"}}]},
@@ -69,7 +69,8 @@ def test_phonetic_conversion_calls_api_once(mock_post):
 
 def test_error_handling_on_api_failure():
     with patch(
-        "scripts.openrouter_functions.requests.post", side_effect=Exception("API down")
+        "scripts.openrouter_functions.http_client.post",
+        side_effect=Exception("API down"),
     ):
         success, result = orf.enhance_script_with_openrouter("fail script")
         assert not success
@@ -105,7 +106,7 @@ def test_enhance_script_routes_to_v3_when_v3_model():
 def test_enhance_script_routes_to_traditional_when_non_v3_model():
     """Test that enhancement uses traditional method when non-v3 model is detected."""
     with patch("scripts.openrouter_functions.supports_audio_tags", return_value=False):
-        with patch("scripts.openrouter_functions.requests.post") as mock_post:
+        with patch("scripts.openrouter_functions.http_client.post") as mock_post:
             mock_post.return_value = MagicMock(
                 status_code=200,
                 json=lambda: {
@@ -124,7 +125,7 @@ def test_enhance_script_routes_to_traditional_when_non_v3_model():
 
 def test_enhance_script_routes_to_traditional_when_no_model_id():
     """Test that enhancement uses traditional method when no model_id is provided."""
-    with patch("scripts.openrouter_functions.requests.post") as mock_post:
+    with patch("scripts.openrouter_functions.http_client.post") as mock_post:
         mock_post.return_value = MagicMock(
             status_code=200,
             json=lambda: {
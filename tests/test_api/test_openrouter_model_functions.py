@@ -52,14 +52,14 @@ def sample_models():
 @pytest.fixture
 def mock_get():
     """Mock requests.get for model fetching."""
-    with patch("scripts.openrouter_functions.requests.get") as mock:
+    with patch("scripts.openrouter_functions.http_client.get") as mock:
         yield mock
 
 
 @pytest.fixture
 def mock_post():
     """Mock requests.post for API calls."""
-    with patch("scripts.openrouter_functions.requests.post") as mock:
+    with patch("scripts.openrouter_functions.http_client.post") as mock:
         mock.return_value = MagicMock(
             status_code=200,
             json=lambda: {"choices": [{"message": {"content": "mocked response"}}]},
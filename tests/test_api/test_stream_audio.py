@@ -0,0 +1,169 @@
+"""Tests for streaming text-to-speech against a local chunked MP3 server."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scripts import Elevenlabs_functions
+from scripts.Elevenlabs_functions import stream_audio
+from utils.error_handling import APIError
+
+# ID3v2.4 header for a 5-byte tag body, as sent at the start of each clip
+ID3V2 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"TBODY"
+
+
+class _ChunkedMp3Handler(BaseHTTPRequestHandler):
+    """Serve each request as an ID3 tag and two audio chunks, chunk-encoded.
+
+    Between the chunks the server waits for ``server.first_chunk_seen``, so a
+    client that only hands out audio once the response is complete stalls.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((self.path, body))
+        if self.server.status != 200:
+            self.send_response(self.server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        label = body["text"][:2].encode()
+        self._write_chunk(ID3V2 + label + b"-first")
+        self.server.progressive.append(self.server.first_chunk_seen.wait(timeout=5))
+        self._write_chunk(label + b"-second")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mp3_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChunkedMp3Handler)
+    server.requests = []
+    server.progressive = []
+    server.first_chunk_seen = threading.Event()
+    server.status = 200
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        Elevenlabs_functions,
+        "ELEVENLABS_TTS_STREAM_URL",
+        f"http://127.0.0.1:{server.server_address[1]}/v1/text-to-speech/{{voice_id}}/stream",
+    )
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _stream(text, output_path, model_id="eleven_multilingual_v2", **kwargs):
+    return stream_audio(
+        "fake_api_key",
+        0.5,
+        model_id,
+        0.7,
+        0.5,
+        True,
+        "voice1",
+        text,
+        output_path,
+        **kwargs,
+    )
+
+
+def test_stream_audio_hands_out_audio_before_response_completes(mp3_server, tmp_path):
+    received = []
+    on_disk = []
+
+    def on_chunk(data):
+        received.append(data)
+        mp3_server.first_chunk_seen.set()
+
+    def on_progress(partial_path, size):
+        with open(partial_path, "rb") as f:
+            on_disk.append(f.read())
+        assert len(on_disk[-1]) == size
+
+    output_path = tmp_path / "clip.mp3"
+    result = _stream(
+        "Hello there.", str(output_path), on_chunk=on_chunk, on_progress=on_progress
+    )
+
+    assert mp3_server.progressive == [True]
+    assert mp3_server.requests[0][0] == "/v1/text-to-speech/voice1/stream"
+    assert b"".join(received) == ID3V2 + b"He-firstHe-second"
+    assert on_disk[-1] == ID3V2 + b"He-firstHe-second"
+    assert output_path.read_bytes() == ID3V2 + b"He-firstHe-second"
+    assert result["bytes"] == output_path.stat().st_size
+    assert result["first_audio_seconds"] <= result["total_seconds"]
+    assert result["cached"] is False
+
+
+def test_stream_audio_streams_long_text_chunks_in_order(mp3_server, tmp_path):
+    mp3_server.first_chunk_seen.set()
+    text = "A" + "a" * 999 + ". B" + "b" * 999 + "."
+    output_path = tmp_path / "long.mp3"
+
+    _stream(text, str(output_path))
+
+    bodies = [body for _, body in mp3_server.requests]
+    assert [body["text"][:2] for body in bodies] == ["Aa", "Bb"]
+    assert bodies[0]["next_text"] == bodies[1]["text"][:300]
+    # Only the first clip's ID3 tag is kept
+    assert output_path.read_bytes() == (ID3V2 + b"Aa-firstAa-secondBb-firstBb-second")
+
+
+def test_stream_audio_error_leaves_no_file(mp3_server, tmp_path):
+    mp3_server.status = 401
+
+    with pytest.raises(APIError):
+        _stream("Hello there.", str(tmp_path / "clip.mp3"))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stream_audio_cache_hit_reads_the_clip_only_for_on_chunk(mocker, tmp_path):
+    output_path = tmp_path / "clip.mp3"
+
+    def serve_from_cache(key, path):
+        with open(path, "wb") as f:
+            f.write(b"cached-audio")
+        return True
+
+    cache = mocker.Mock(get=mocker.Mock(side_effect=serve_from_cache))
+    mocker.patch("scripts.Elevenlabs_functions.get_audio_cache", return_value=cache)
+    real_open = open
+    reads = []
+
+    def tracking_open(path, mode="r", *args, **kwargs):
+        if "r" in mode:
+            reads.append(path)
+        return real_open(path, mode, *args, **kwargs)
+
+    mocker.patch("builtins.open", side_effect=tracking_open)
+    on_progress = mocker.Mock()
+
+    result = _stream(
+        "Hello there.", str(output_path), use_cache=True, on_progress=on_progress
+    )
+
+    assert result["cached"] is True and result["bytes"] == len(b"cached-audio")
+    on_progress.assert_called_once_with(str(output_path), len(b"cached-audio"))
+    assert reads == []
+
+    received = []
+    _stream("Hello there.", str(output_path), use_cache=True, on_chunk=received.append)
+    assert received == [b"cached-audio"]
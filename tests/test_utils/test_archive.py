@@ -0,0 +1,108 @@
+"""Tests for ZIP archive building."""
+
+import io
+import os
+import zipfile
+
+import pytest
+import streamlit as st
+
+from utils.archive import (
+    ArchiveCache,
+    build_zip_archive,
+    close_archive,
+    fingerprint_files,
+    open_download,
+)
+
+
+def test_build_zip_archive_stores_mp3_and_deflates_text(tmp_path):
+    (tmp_path / "group").mkdir()
+    clip = tmp_path / "group" / "clip.mp3"
+    clip.write_bytes(b"\xff\xfb" * 1000)
+    notes = tmp_path / "notes.txt"
+    notes.write_text("hello " * 100)
+
+    archive = build_zip_archive(
+        [str(clip), str(notes), str(tmp_path / "missing.mp3")], base_dir=str(tmp_path)
+    )
+
+    with zipfile.ZipFile(archive) as zip_file:
+        infos = {info.filename: info for info in zip_file.infolist()}
+        assert sorted(infos) == ["group/clip.mp3", "notes.txt"]
+        assert infos["group/clip.mp3"].compress_type == zipfile.ZIP_STORED
+        assert infos["notes.txt"].compress_type == zipfile.ZIP_DEFLATED
+        assert zip_file.read("group/clip.mp3") == clip.read_bytes()
+
+
+def test_build_zip_archive_writes_large_archives_to_disk(tmp_path):
+    clip = tmp_path / "clip.mp3"
+    clip.write_bytes(b"\x00" * 4096)
+
+    small = build_zip_archive([str(clip)])
+    archive = build_zip_archive([str(clip)], spool_size=1024)
+
+    assert isinstance(small, io.BytesIO)
+    assert os.path.isfile(archive.name)
+    with zipfile.ZipFile(archive) as zip_file:
+        assert zip_file.namelist() == ["clip.mp3"]
+    close_archive(archive)
+    assert not os.path.exists(archive.name)
+
+
+@pytest.mark.parametrize("spool_size", [1024 * 1024, 1024])
+def test_open_download_gives_data_streamlit_accepts(tmp_path, spool_size):
+    clip = tmp_path / "clip.mp3"
+    clip.write_bytes(b"\x00" * 4096)
+    archive = build_zip_archive([str(clip)], spool_size=spool_size)
+
+    with open_download(archive) as data:
+        # Raises StreamlitAPIException for data it cannot serve
+        st.download_button("Save", data=data, file_name="clips.zip", key=spool_size)
+        assert isinstance(data, bytes) == (spool_size > 4096)
+
+    archive.seek(0)
+    with zipfile.ZipFile(archive) as zip_file:
+        assert zip_file.read("clip.mp3") == clip.read_bytes()
+    close_archive(archive)
+
+
+def test_fingerprint_files_changes_with_files(tmp_path):
+    clip = tmp_path / "clip.mp3"
+    clip.write_bytes(b"first")
+    paths = [str(clip)]
+    fingerprint = fingerprint_files(paths)
+
+    assert fingerprint_files(paths) == fingerprint
+    assert fingerprint_files(paths, base_dir=str(tmp_path)) != fingerprint
+
+    os.utime(clip, ns=(0, 0))
+    touched = fingerprint_files(paths)
+    assert touched != fingerprint
+
+    clip.write_bytes(b"second clip")
+    os.utime(clip, ns=(0, 0))
+    assert fingerprint_files(paths) != touched
+
+    clip.unlink()
+    assert fingerprint_files(paths) not in (fingerprint, touched)
+
+
+def test_archive_cache_reuses_and_evicts_archives(tmp_path):
+    clips = []
+    for number in range(3):
+        clip = tmp_path / f"{number}.mp3"
+        clip.write_bytes(b"audio")
+        clips.append(str(clip))
+    cache = ArchiveCache(max_entries=2)
+
+    fingerprint, first = cache.build(clips[:1])
+    assert cache.build(clips[:1]) == (fingerprint, first)
+    assert cache.get(fingerprint) is first
+
+    cache.build(clips[:2])
+    cache.build(clips[:3])
+
+    assert len(cache) == 2
+    assert cache.get(fingerprint) is None
+    assert first.closed
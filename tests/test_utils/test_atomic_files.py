@@ -0,0 +1,32 @@
+"""Tests for atomic file writes."""
+
+import json
+import os
+
+import pytest
+
+from utils.atomic_files import atomic_write, atomic_write_json
+
+
+def test_atomic_write_json_replaces_the_file(tmp_path):
+    target = tmp_path / "index.json"
+    target.write_text('{"old": true}')
+
+    atomic_write_json(str(target), {"new": True})
+
+    assert json.loads(target.read_text()) == {"new": True}
+    assert os.listdir(tmp_path) == ["index.json"]
+
+
+def test_failed_write_keeps_the_old_file_and_removes_the_part_file(tmp_path):
+    target = tmp_path / "report.csv"
+    target.write_text("old")
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(target), "w") as f:
+            f.write("partial")
+            assert os.path.basename(f.name).endswith(".part")
+            raise RuntimeError("interrupted")
+
+    assert target.read_text() == "old"
+    assert os.listdir(tmp_path) == ["report.csv"]
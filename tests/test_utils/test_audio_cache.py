@@ -0,0 +1,103 @@
+"""Tests for the content-addressed audio cache."""
+
+import os
+
+import pytest
+
+from utils.audio_cache import AudioCache, make_audio_cache_key
+
+SETTINGS = {
+    "stability": 0.5,
+    "similarity_boost": 0.7,
+    "style": 0.0,
+    "use_speaker_boost": True,
+}
+
+
+def test_cache_key_is_stable_and_sensitive_to_settings():
+    key = make_audio_cache_key("Hello", "voice1", "model1", SETTINGS, speed=1.0)
+
+    assert key == make_audio_cache_key(
+        "Hello", "voice1", "model1", dict(reversed(SETTINGS.items())), speed=1.0
+    )
+    assert key != make_audio_cache_key("Hello", "voice1", "model1", SETTINGS)
+    assert key != make_audio_cache_key(
+        "Hello", "voice1", "model1", {**SETTINGS, "style": 0.1}, speed=1.0
+    )
+
+
+def test_put_then_get_places_clip_and_counts_savings(tmp_path):
+    cache = AudioCache(cache_dir=str(tmp_path / "cache"))
+    generated = tmp_path / "generated.mp3"
+    generated.write_bytes(b"audio-bytes")
+    key = make_audio_cache_key("Hello", "voice1", "model1", SETTINGS)
+
+    assert cache.get(key, str(tmp_path / "miss.mp3")) is False
+    cache.put(key, str(generated))
+    target = tmp_path / "session" / "copy.mp3"
+    target.parent.mkdir()
+    assert cache.get(key, str(target)) is True
+
+    assert target.read_bytes() == b"audio-bytes"
+    assert cache.get_stats() == {
+        "hits": 1,
+        "misses": 1,
+        "hit_ratio": 0.5,
+        "bytes_saved": len(b"audio-bytes"),
+    }
+    assert not any(name.endswith(".part") for name in os.listdir(target.parent))
+
+
+def test_evict_removes_least_recently_used_entries(tmp_path):
+    cache = AudioCache(cache_dir=str(tmp_path / "cache"))
+    keys = []
+    for name in ["old", "new"]:
+        source = tmp_path / f"{name}.mp3"
+        source.write_bytes(b"x" * 6)
+        key = make_audio_cache_key(name, "voice1", "model1", SETTINGS)
+        cache.put(key, str(source))
+        keys.append(key)
+
+    cache.max_bytes = 10
+    assert cache.evict() == 1
+    assert not os.path.exists(cache._entry_path(keys[0]))
+    assert os.path.exists(cache._entry_path(keys[1]))
+
+
+def test_hits_leave_the_output_modification_time_alone(tmp_path):
+    cache = AudioCache(cache_dir=str(tmp_path / "cache"))
+    generated = tmp_path / "generated.mp3"
+    generated.write_bytes(b"audio-bytes")
+    key = make_audio_cache_key("Hello", "voice1", "model1", SETTINGS)
+    cache.put(key, str(generated))
+    os.utime(generated, (1000, 1000))
+
+    assert cache.get(key, str(tmp_path / "copy.mp3")) is True
+    assert os.path.getmtime(generated) == 1000
+    assert os.path.getmtime(tmp_path / "copy.mp3") == 1000
+
+
+def test_put_keeps_a_running_total_instead_of_walking_the_cache(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    cache = AudioCache(cache_dir=cache_dir, max_bytes=12)
+    monkeypatch.setattr(
+        "utils.audio_cache.os.walk", lambda *_: pytest.fail("walked the cache")
+    )
+    keys = []
+    for name in ["first", "second", "third"]:
+        source = tmp_path / f"{name}.mp3"
+        source.write_bytes(b"x" * 4)
+        keys.append(make_audio_cache_key(name, "voice1", "model1", SETTINGS))
+        cache.put(keys[-1], str(source))
+    assert cache.get(keys[0], str(tmp_path / "hit.mp3")) is True
+    monkeypatch.undo()
+
+    source = tmp_path / "fourth.mp3"
+    source.write_bytes(b"x" * 4)
+    cache.put(make_audio_cache_key("fourth", "voice1", "model1", SETTINGS), str(source))
+
+    # "second" was least recently used once "first" was read back
+    assert os.path.exists(cache._entry_path(keys[0]))
+    assert not os.path.exists(cache._entry_path(keys[1]))
+    restarted = AudioCache(cache_dir=cache_dir, max_bytes=12)
+    assert restarted._total_bytes == 12
@@ -0,0 +1,52 @@
+"""Tests for bulk job checkpoint manifests."""
+
+import json
+
+from utils import bulk_manifest
+from utils.bulk_manifest import BulkManifest
+
+
+def test_recorded_row_is_complete_until_file_changes(tmp_path):
+    clip = tmp_path / "greeting.mp3"
+    clip.write_bytes(b"audio")
+    manifest = BulkManifest(str(tmp_path))
+    manifest.record(0, "key-a", str(clip))
+    manifest.flush()
+
+    reloaded = BulkManifest(str(tmp_path))
+    assert reloaded.completed_count() == 1
+    assert reloaded.is_complete(0, "key-a", str(clip))
+    assert not reloaded.is_complete(0, "key-b", str(clip))  # text or settings changed
+    assert not reloaded.is_complete(1, "key-a", str(clip))
+
+    clip.write_bytes(b"other")
+    assert not reloaded.is_complete(0, "key-a", str(clip))
+
+
+def test_record_is_throttled_until_flush(tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_manifest, "CHECKPOINT_INTERVAL", 3600)
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.mp3").write_bytes(name.encode())
+    manifest = BulkManifest(str(tmp_path))
+
+    manifest.record(0, "key-a", str(tmp_path / "a.mp3"))  # first write is immediate
+    manifest.record(1, "key-b", str(tmp_path / "b.mp3"))
+    assert BulkManifest(str(tmp_path)).completed_count() == 1
+
+    manifest.flush()
+    assert BulkManifest(str(tmp_path)).completed_count() == 2
+
+
+def test_missing_output_and_corrupt_manifest_are_ignored(tmp_path):
+    manifest = BulkManifest(str(tmp_path))
+    manifest.record(0, "key-a", str(tmp_path / "missing.mp3"))
+    manifest.flush()
+    assert not (tmp_path / bulk_manifest.MANIFEST_FILENAME).exists()
+
+    (tmp_path / bulk_manifest.MANIFEST_FILENAME).write_text("{not json")
+    assert BulkManifest(str(tmp_path)).completed_count() == 0
+
+    (tmp_path / bulk_manifest.MANIFEST_FILENAME).write_text(
+        json.dumps({"version": 0, "rows": {"0": {}}})
+    )
+    assert BulkManifest(str(tmp_path)).completed_count() == 0
@@ -0,0 +1,82 @@
+"""Tests for bulk run estimates and budget splitting."""
+
+import io
+
+import pandas as pd
+import pytest
+
+from scripts.bulk_planning import (
+    estimate_request_seconds,
+    plan_bulk_run,
+    split_bulk_csv,
+    split_bulk_rows,
+)
+from scripts.bulk_preprocessing import prepare_bulk_jobs
+
+SETTINGS = {
+    "stability": 0.5,
+    "similarity_boost": 0.75,
+    "style": 0.0,
+    "use_speaker_boost": True,
+}
+
+
+def make_jobs(tmp_path, texts, filenames):
+    df = pd.DataFrame({"text": texts, "filename": filenames})
+    return prepare_bulk_jobs(df, str(tmp_path), "voice", "model", SETTINGS)
+
+
+def test_plan_bulk_run_counts_savings(tmp_path):
+    jobs = make_jobs(
+        tmp_path,
+        ["aaaa", "bb", "aaaa", "cccccc", "dd"],
+        ["1.mp3", "2.mp3", "3.mp3", "4.mp3", "5.mp3"],
+    )
+    done = {1}
+    cached = {jobs.at[3, "request_key"]}
+
+    plan = plan_bulk_run(
+        jobs,
+        "eleven_flash_v2_5",
+        workers=2,
+        is_complete=lambda index, key, path: index in done,
+        is_cached=cached.__contains__,
+    )
+
+    assert plan["rows"] == 5
+    assert plan["chars"] == 18
+    assert plan["max_row_chars"] == 6
+    assert plan["skipped_rows"] == 1
+    assert (plan["duplicate_rows"], plan["duplicate_chars"]) == (1, 4)
+    assert (plan["cached_rows"], plan["cached_chars"]) == (1, 6)
+    assert (plan["requests"], plan["billable_chars"]) == (2, 6)
+    assert plan["credits"] == 3.0
+    # Two requests on two workers: the longer one decides
+    assert plan["estimated_seconds"] == pytest.approx(estimate_request_seconds(4))
+    assert plan["chunked_rows"] == []
+
+
+def test_plan_bulk_run_counts_chunked_rows(tmp_path):
+    jobs = make_jobs(tmp_path, ["x" * 3001, "short"], ["1.mp3", "2.mp3"])
+
+    plan = plan_bulk_run(jobs, "eleven_v3")
+
+    assert plan["chunk_size"] == 1500
+    assert plan["chunked_rows"] == [0]
+    # Three chunks for the long row, one request for the short one
+    assert plan["requests"] == 4
+
+
+def test_split_bulk_csv_keeps_each_part_within_budget():
+    csv_text = "text,name\n" + "".join(f"{'x' * n},row{n}\n" for n in (4, 3, 5, 9))
+    chars = pd.Series([4, 3, 5, 9])
+
+    parts = split_bulk_rows(chars, max_chars=8)
+    contents = split_bulk_csv(io.StringIO(csv_text), parts, chunksize=3)
+
+    assert parts == [[0, 1], [2], [3]]
+    assert [pd.read_csv(io.BytesIO(c))["name"].tolist() for c in contents] == [
+        ["row4", "row3"],
+        ["row5"],
+        ["row9"],
+    ]
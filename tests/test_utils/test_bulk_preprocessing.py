@@ -0,0 +1,117 @@
+"""Tests for column-wise bulk CSV preparation."""
+
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from scripts.bulk_preprocessing import (
+    prepare_bulk_jobs,
+    read_bulk_jobs,
+    read_bulk_rows,
+    sanitize_filenames,
+    scan_bulk_csv,
+)
+from utils.audio_cache import make_audio_cache_key
+from utils.error_handling import ValidationError
+from utils.security import sanitize_filename
+
+SETTINGS = {
+    "stability": 0.5,
+    "similarity_boost": 0.75,
+    "style": 0.0,
+    "use_speaker_boost": True,
+}
+
+
+def test_sanitize_filenames_matches_scalar_version():
+    names = pd.Series(
+        ["greeting.mp3", 'a/b\\c:d*e?"f<g>h|i', " .hidden. ", "..", "", "x" * 150]
+    )
+    assert sanitize_filenames(names).tolist() == [
+        sanitize_filename(name) for name in names
+    ]
+
+
+def test_prepare_bulk_jobs_builds_job_list(tmp_path):
+    df = pd.DataFrame(
+        {
+            "text": ["Hello {name}", "Bye {name}", "Hello {name}"],
+            "filename": ["hi_{name}.mp3", "bye_{name}.mp3", "hi_{name}.mp3"],
+            "name": ["Alice", "Bob", "Alice"],
+        }
+    )
+
+    jobs = prepare_bulk_jobs(df, str(tmp_path), "voice", "model", SETTINGS)
+
+    assert jobs["text"].tolist() == ["Hello Alice", "Bye Bob", "Hello Alice"]
+    assert jobs["output_path"].tolist() == [
+        os.path.join(str(tmp_path), name)
+        for name in ["hi_Alice.mp3", "bye_Bob.mp3", "hi_Alice.mp3"]
+    ]
+    assert jobs["chars"].tolist() == [11, 7, 11]
+    assert jobs["request_key"][0] == make_audio_cache_key(
+        "Hello Alice", "voice", "model", SETTINGS
+    )
+    assert jobs["request_key"][0] == jobs["request_key"][2]
+    assert jobs["overwritten"].tolist() == [True, False, False]
+
+
+def test_prepare_bulk_jobs_rejects_unknown_placeholders(tmp_path):
+    df = pd.DataFrame({"text": ["Hello {nmae}"], "name": ["Alice"]})
+
+    with pytest.raises(ValidationError) as exc:
+        prepare_bulk_jobs(df, str(tmp_path), "voice", "model", SETTINGS)
+
+    assert "{nmae} in rows 0" in exc.value.details
+
+
+def test_read_bulk_jobs_matches_whole_file_across_chunks(tmp_path):
+    csv_text = "text,filename,n\n" + "".join(
+        f"Line {{n}},file_{i % 3}.mp3,{i}\n" for i in range(7)
+    )
+
+    chunked = read_bulk_jobs(
+        io.StringIO(csv_text), str(tmp_path), "voice", "model", SETTINGS, chunksize=2
+    )
+    whole = prepare_bulk_jobs(
+        pd.read_csv(io.StringIO(csv_text), dtype=str),
+        str(tmp_path),
+        "voice",
+        "model",
+        SETTINGS,
+    )
+
+    pd.testing.assert_frame_equal(chunked, whole)
+    assert chunked["overwritten"].tolist() == [True] * 4 + [False] * 3
+
+
+def test_read_bulk_jobs_checks_header_and_row_limit(tmp_path):
+    with pytest.raises(ValidationError, match="'text' column"):
+        read_bulk_jobs(io.StringIO("name\nAlice\n"), str(tmp_path), "v", "m", {})
+    with pytest.raises(ValidationError, match="more than 2 rows"):
+        read_bulk_jobs(
+            io.StringIO("text\na\nb\nc\n"),
+            str(tmp_path),
+            "v",
+            "m",
+            SETTINGS,
+            chunksize=1,
+            max_rows=2,
+        )
+
+
+def test_scan_bulk_csv_and_read_bulk_rows():
+    csv_file = io.StringIO("text,name\nHi {name},Al\nBye {nmae},Bo\nHey,Cy\n")
+
+    scan = scan_bulk_csv(csv_file, preview_rows=2, chunksize=2)
+
+    assert scan["columns"] == ["text", "name"]
+    assert scan["rows"] == 3
+    assert scan["preview"]["name"].tolist() == ["Al", "Bo"]
+    assert scan["unknown_placeholders"] == {"nmae": [1]}
+    assert read_bulk_rows(csv_file, [0, 2], chunksize=2)["name"].tolist() == [
+        "Al",
+        "Cy",
+    ]
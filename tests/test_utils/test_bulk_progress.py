@@ -0,0 +1,31 @@
+"""Tests for bulk generation progress tracking."""
+
+from utils import bulk_progress
+from utils.bulk_progress import BulkProgress, format_bulk_progress
+
+
+def test_snapshot_reports_throughput_and_eta(mocker):
+    clock = mocker.patch("utils.bulk_progress.time.monotonic", return_value=100.0)
+    progress = BulkProgress(total=10)
+    progress.add({"status": "skipped", "bytes": 500})
+    assert progress.snapshot()["eta_seconds"] is None
+
+    progress.add({"status": "ok", "bytes": 1024 * 1024})
+    progress.add({"status": "ok", "bytes": 1024 * 1024})
+    progress.add({"status": "failed", "bytes": None})
+    clock.return_value = 106.0
+
+    snapshot = progress.snapshot()
+    assert snapshot["rows_processed"] == 4
+    assert snapshot["bytes_written"] == 2 * 1024 * 1024
+    # Skipped rows do not count towards throughput
+    assert snapshot["rows_per_second"] == 0.5
+    assert snapshot["eta_seconds"] == 12.0
+    assert format_bulk_progress(snapshot) == (
+        "4 of 10 rows, 1 failed, 1 already done, 0.5 rows/s, 2.0 MB written, ETA 0:12"
+    )
+
+
+def test_format_duration_handles_hours():
+    assert bulk_progress.format_duration(3725) == "1:02:05"
+    assert bulk_progress.format_duration(59.6) == "1:00"
@@ -0,0 +1,42 @@
+"""Tests for compiled bulk templates."""
+
+import pandas as pd
+
+from scripts.bulk_templates import (
+    compile_template,
+    find_unknown_placeholders,
+    render_templates,
+    variable_values,
+)
+
+
+def test_compile_template_splits_literals_and_variables():
+    template = compile_template("Hi {name}, meet {friend}!")
+    assert template.variables == ("name", "friend")
+    assert template.literals == ("Hi ", ", meet ", "!")
+    assert compile_template("Hi {name}, meet {friend}!") is template
+
+
+def test_render_templates_fills_each_row_from_its_columns():
+    df = pd.DataFrame(
+        {
+            "text": ["Hello {name}", "{name} is {age}", "Hello {name}", "plain"],
+            "name": ["Alice", "Bob", None, "Dan"],
+            "age": [30, 41, 52, 63],
+            # Values are inserted as is, never substituted again
+            "other": ["{age}", "x", "y", "z"],
+        }
+    )
+
+    rendered = render_templates(df["text"], variable_values(df))
+
+    assert rendered.tolist() == ["Hello Alice", "Bob is 41", "Hello ", "plain"]
+    assert rendered.index.equals(df.index)
+
+
+def test_find_unknown_placeholders_lists_rows():
+    templates = pd.Series(["Hi {name}", "Bye {nmae}", "{text} {nmae}"])
+    assert find_unknown_placeholders(templates, ["text", "name"]) == {
+        "nmae": [1, 2],
+        "text": [2],
+    }
@@ -0,0 +1,278 @@
+"""Tests for the file-based TTL cache."""
+
+import functools
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from utils import caching
+from utils.caching import Cache
+
+
+def test_cache_paths_are_stable_across_processes(tmp_path):
+    cache = Cache(cache_dir=str(tmp_path))
+    digest = hashlib.sha256(b"fetch_models:('key',)").hexdigest()
+
+    child_path = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from utils.caching import Cache; import sys; "
+            "print(Cache(cache_dir=sys.argv[1])._get_cache_path(sys.argv[2]))",
+            str(tmp_path),
+            "fetch_models:('key',)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    ).stdout.strip()
+
+    expected = os.path.join(str(tmp_path), digest[:2], f"{digest}.json")
+    assert cache._get_cache_path("fetch_models:('key',)") == expected
+    assert child_path == expected
+
+
+def test_set_get_roundtrip_writes_index(tmp_path):
+    cache = Cache(ttl_seconds=60, cache_dir=str(tmp_path))
+    cache.set("models", [["m1", "Model 1"]])
+
+    assert cache.get("models") == [["m1", "Model 1"]]
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert list(index) == [hashlib.sha256(b"models").hexdigest()]
+    assert not [p for p in tmp_path.rglob("*.part")]
+
+
+def test_index_keeps_entries_set_by_concurrent_processes(tmp_path):
+    script = (
+        "from utils.caching import Cache; import sys; "
+        "cache = Cache(cache_dir=sys.argv[1]); "
+        "[cache.set(f'{sys.argv[2]}-{i}', i) for i in range(30)]"
+    )
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", script, str(tmp_path), f"worker{n}"],
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+        )
+        for n in range(4)
+    ]
+    assert [worker.wait(timeout=60) for worker in workers] == [0] * 4
+
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert len(index) == 4 * 30
+
+
+def test_cleanup_expired_uses_index_and_removes_orphans(tmp_path, mocker):
+    short = Cache(ttl_seconds=1, cache_dir=str(tmp_path))
+    long = Cache(ttl_seconds=3600, cache_dir=str(tmp_path))
+    short.set("stale", "a")
+    long.set("fresh", "b")
+    (tmp_path / "-123456789.json").write_text("{}")  # legacy hash() entry
+
+    index = json.loads((tmp_path / "index.json").read_text())
+    for entry in index.values():
+        entry["timestamp"] -= 10
+    (tmp_path / "index.json").write_text(json.dumps(index))
+
+    load = mocker.spy(json, "load")
+    assert long.cleanup_expired() == 2
+    assert load.call_count == 1  # only the index is read
+
+    assert short.get("stale") is None
+    assert long.get("fresh") == "b"
+    assert not (tmp_path / "-123456789.json").exists()
+
+
+@pytest.fixture
+def tmp_cached(tmp_path, monkeypatch):
+    """cached() decorator whose disk tier lives in a temp directory."""
+    monkeypatch.setattr(
+        caching, "Cache", functools.partial(caching.Cache, cache_dir=str(tmp_path))
+    )
+    return caching.cached
+
+
+def test_cached_serves_repeat_calls_from_memory(tmp_cached, mocker):
+    calls = []
+
+    @tmp_cached(ttl_seconds=60)
+    def fetch(name):
+        calls.append(name)
+        return {"name": name}
+
+    assert fetch("a") == {"name": "a"}
+    load = mocker.spy(json, "load")
+    assert fetch("a") == {"name": "a"}
+
+    assert calls == ["a"]
+    assert load.call_count == 0
+    stats = fetch.cache_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["load_time"] >= 0
+    assert caching.get_cache_stats()[fetch.__qualname__]["hits"] == 1
+
+
+def test_cached_evicts_lru_and_falls_back_to_disk(tmp_cached):
+    calls = []
+
+    @tmp_cached(ttl_seconds=60, max_entries=1)
+    def fetch(name):
+        calls.append(name)
+        return name.upper()
+
+    fetch("a")
+    fetch("b")  # evicts "a" from memory
+    assert fetch("a") == "A"
+
+    stats = fetch.cache_stats()
+    assert calls == ["a", "b"]
+    assert stats["disk_hits"] == 1
+    assert stats["evictions"] >= 1
+
+
+def test_cached_disk_tier_survives_new_decorator(tmp_cached):
+    @tmp_cached(ttl_seconds=60)
+    def fetch(name):
+        return [name]
+
+    fetch("a")
+
+    @tmp_cached(ttl_seconds=60)
+    def fetch(name):  # noqa: F811 - simulates a restarted process
+        raise AssertionError("should be served from disk")
+
+    assert fetch("a") == ["a"]
+    assert fetch.cache_stats()["disk_hits"] == 1
+
+
+def _wait_for(predicate, timeout=2.0):
+    """Poll predicate until it returns True or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_cached_serves_stale_value_while_refreshing(tmp_cached):
+    release = threading.Event()
+    calls = []
+
+    @tmp_cached(ttl_seconds=0, stale_while_revalidate=True, max_stale_seconds=60)
+    def fetch(name):
+        calls.append(name)
+        if len(calls) > 1:
+            release.wait(timeout=5)
+        return len(calls)
+
+    assert fetch("a") == 1
+    time.sleep(0.01)
+    assert fetch("a") == 1  # stale, refresh starts in the background
+    assert fetch("a") == 1  # refresh already in flight, not started again
+    assert _wait_for(lambda: len(calls) == 2)
+
+    release.set()
+    assert _wait_for(lambda: fetch("a") >= 2)
+    assert fetch.cache_stats()["stale_hits"] >= 2
+
+
+def test_cached_blocks_once_past_max_staleness(tmp_cached):
+    calls = []
+
+    @tmp_cached(ttl_seconds=0, stale_while_revalidate=True, max_stale_seconds=0)
+    def fetch(name):
+        calls.append(name)
+        return len(calls)
+
+    assert fetch("a") == 1
+    time.sleep(0.01)
+    assert fetch("a") == 2
+    assert fetch.cache_stats()["stale_hits"] == 0
+
+
+def test_st_cache_keeps_stale_value_when_refresh_fails():
+    calls = []
+
+    @caching.st_cache(ttl_minutes=0, stale_while_revalidate=True, max_stale_minutes=60)
+    def fetch(api_key):
+        calls.append(api_key)
+        if len(calls) > 1:
+            raise ValueError("upstream down")
+        return ["model"]
+
+    assert fetch("key") == ["model"]
+    time.sleep(0.01)
+    assert fetch("key") == ["model"]
+    assert _wait_for(lambda: len(calls) == 2)
+    assert fetch("key") == ["model"]
+
+    fetch.clear()
+    with pytest.raises(ValueError):
+        fetch("key")
+
+
+def _run_concurrently(func, count):
+    """Call func from count threads at once and collect results or errors."""
+    outcomes = [None] * count
+
+    def call(index):
+        try:
+            outcomes[index] = func()
+        except Exception as e:  # noqa: BLE001 - collected for assertions
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def test_single_flight_shares_one_call_between_concurrent_callers():
+    release = threading.Event()
+    calls = []
+
+    @caching.single_flight
+    def fetch(api_key):
+        calls.append(api_key)
+        release.wait(timeout=5)
+        return [("m1", "Model 1")]
+
+    threads, outcomes = _run_concurrently(lambda: fetch("key"), 5)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["key"]
+    assert all(outcome == [("m1", "Model 1")] for outcome in outcomes)
+
+
+def test_single_flight_shares_errors_without_caching_them():
+    release = threading.Event()
+    calls = []
+
+    @caching.single_flight
+    def fetch():
+        calls.append(1)
+        release.wait(timeout=5)
+        if len(calls) == 1:
+            raise ValueError("upstream down")
+        return "ok"
+
+    threads, outcomes = _run_concurrently(fetch, 3)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert fetch() == "ok"
@@ -0,0 +1,68 @@
+"""Tests for the shared pooled HTTP client."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils import http_client
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    defaults = {
+        "pool_connections": http_client.DEFAULT_POOL_CONNECTIONS,
+        "pool_maxsize": http_client.DEFAULT_POOL_MAXSIZE,
+        "timeout": http_client.DEFAULT_TIMEOUT,
+    }
+    http_client.configure_pool(**defaults)
+    http_client.reset_pool_stats()
+    yield
+    http_client.configure_pool(**defaults)
+    http_client.reset_pool_stats()
+
+
+def test_keep_alive_connections_are_reused(local_server):
+    for _ in range(3):
+        response = http_client.get(f"{local_server}/models")
+        assert response.text == "ok"
+
+    stats = http_client.get_pool_stats()["127.0.0.1"]
+    assert stats == {"requests": 3, "misses": 1, "hits": 2}
+
+
+def test_configure_pool_rebuilds_session_and_default_timeout(mocker):
+    session = http_client.get_session()
+    http_client.configure_pool(pool_maxsize=5, timeout=12)
+
+    new_session = http_client.get_session()
+    assert new_session is not session
+    assert new_session.get_adapter("https://api.elevenlabs.io")._pool_maxsize == 5
+
+    send = mocker.patch.object(new_session, "request")
+    http_client.post("https://api.elevenlabs.io/v1/models", json={})
+    assert send.call_args.kwargs["timeout"] == 12
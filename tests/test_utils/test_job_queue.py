@@ -0,0 +1,181 @@
+"""Tests for the background job queue."""
+
+import sqlite3
+import threading
+import time
+
+from utils import job_queue as job_queue_module
+from utils.job_queue import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_INTERRUPTED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JobQueue,
+)
+
+
+def _wait(job_queue, job_id, status, timeout=5):
+    for _ in range(int(timeout / 0.01)):
+        job = job_queue.get(job_id)
+        if job["status"] == status:
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError(f"job {job_id} is {job_queue.get(job_id)['status']}")
+
+
+def test_jobs_record_progress_and_result(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_queue_module, "PROGRESS_INTERVAL", 0)
+    job_queue = JobQueue(db_path=str(tmp_path / "jobs.db"))
+    release = threading.Event()
+
+    def work(progress):
+        progress(1, {"rows_per_second": 2.0})
+        release.wait(5)
+        progress(2)
+        return True, "2 files"
+
+    job_id = job_queue.submit("session-a", "demo.csv", work, total=2, job_key="dir")
+    job = _wait(job_queue, job_id, JOB_RUNNING)
+    assert job_queue.submit("session-a", "demo.csv", work, job_key="dir") == job_id
+
+    release.set()
+    job = _wait(job_queue, job_id, JOB_SUCCEEDED)
+    assert (job["done"], job["total"], job["message"]) == (2, 2, "2 files")
+    assert job["details"] == {"rows_per_second": 2.0}
+    assert job_queue.find_active("dir") is None
+    assert job_queue.list_jobs("session-b") == []
+    job_queue.shutdown()
+
+
+def test_concurrent_submits_queue_one_job_per_key(tmp_path, monkeypatch):
+    find_active = job_queue_module._find_active
+
+    def slow_find_active(conn, job_key):
+        # Widen the gap between checking for an active job and queueing one
+        job = find_active(conn, job_key)
+        threading.Event().wait(0.02)
+        return job
+
+    monkeypatch.setattr(job_queue_module, "_find_active", slow_find_active)
+    # Two queues on one table stand in for two server processes
+    db_path = str(tmp_path / "jobs.db")
+    queues = [JobQueue(db_path=db_path), JobQueue(db_path=db_path)]
+    release = threading.Event()
+    start = threading.Barrier(8)
+    job_ids = []
+
+    def work(progress):
+        release.wait(5)
+        return True, ""
+
+    def submit(job_queue):
+        start.wait()
+        job_ids.append(job_queue.submit("session-a", "demo.csv", work, job_key="dir"))
+
+    threads = [threading.Thread(target=submit, args=(queues[i % 2],)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(job_ids)) == 1
+    release.set()
+    for job_queue in queues:
+        job_queue.shutdown()
+
+
+def test_jobs_are_found_by_their_token_only(tmp_path):
+    job_queue = JobQueue(db_path=str(tmp_path / "jobs.db"))
+    first = job_queue.submit("session-a", "a.csv", lambda progress: (True, ""))
+    second = job_queue.submit("session-a", "b.csv", lambda progress: (True, ""))
+    token = job_queue.get(first)["token"]
+
+    assert len(token) >= 32 and token != job_queue.get(second)["token"]
+    assert "session-a" not in token
+    assert job_queue.get_by_token(token)["id"] == first
+    assert job_queue.get_by_token("session-a") is None
+    job_queue.shutdown()
+
+
+def test_job_errors_mark_the_job_failed(tmp_path):
+    job_queue = JobQueue(db_path=str(tmp_path / "jobs.db"))
+
+    def work(progress):
+        raise RuntimeError("disk full")
+
+    job_id = job_queue.submit("session-a", "demo.csv", work)
+    assert _wait(job_queue, job_id, JOB_FAILED)["message"] == "disk full"
+    job_queue.shutdown()
+
+
+def test_concurrency_is_bounded_and_queued_jobs_can_be_cancelled(tmp_path):
+    job_queue = JobQueue(db_path=str(tmp_path / "jobs.db"), max_workers=1)
+    release = threading.Event()
+
+    def blocking(progress):
+        release.wait(5)
+        return True, ""
+
+    first = job_queue.submit("a", "first", blocking)
+    second = job_queue.submit("b", "second", lambda progress: (True, ""))
+    _wait(job_queue, first, JOB_RUNNING)
+    assert job_queue.get(second)["status"] == JOB_QUEUED
+
+    assert job_queue.cancel(second)
+    assert not job_queue.cancel(first)
+    assert job_queue.get(second)["status"] == JOB_CANCELLED
+    release.set()
+    job_queue.shutdown()
+
+
+def test_only_jobs_without_a_live_owner_are_marked_interrupted(tmp_path):
+    db_path = str(tmp_path / "jobs.db")
+    job_queue = JobQueue(db_path=db_path, max_workers=1)
+    release = threading.Event()
+
+    def blocking(progress):
+        release.wait(5)
+        return True, ""
+
+    job_id = job_queue.submit("a", "demo.csv", blocking)
+    _wait(job_queue, job_id, JOB_RUNNING)
+
+    # Another server process starting leaves a live owner's jobs alone
+    other = JobQueue(db_path=db_path)
+    assert other.get(job_id)["status"] == JOB_RUNNING
+    other.shutdown()
+
+    # Once the owner's heartbeat is older than the timeout, the job is reclaimed
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE jobs SET heartbeat_at = ?",
+            (time.time() - job_queue_module.HEARTBEAT_TIMEOUT - 1,),
+        )
+    restarted = JobQueue(db_path=db_path)
+    assert restarted.get(job_id)["status"] == JOB_INTERRUPTED
+    release.set()
+    job_queue.shutdown()
+    restarted.shutdown()
+
+
+def test_heartbeats_keep_active_jobs_alive(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_queue_module, "HEARTBEAT_INTERVAL", 0.01)
+    job_queue = JobQueue(db_path=str(tmp_path / "jobs.db"), max_workers=1)
+    release = threading.Event()
+
+    def blocking(progress):
+        release.wait(5)
+        return True, ""
+
+    job_id = job_queue.submit("a", "demo.csv", blocking)
+    first_beat = job_queue.get(job_id)["heartbeat_at"]
+    for _ in range(500):
+        if job_queue.get(job_id)["heartbeat_at"] > first_beat:
+            break
+        threading.Event().wait(0.01)
+    assert job_queue.get(job_id)["heartbeat_at"] > first_beat
+    assert job_queue.get(job_id)["owner"] == job_queue.owner
+    release.set()
+    job_queue.shutdown()
@@ -1,8 +1,12 @@
 """Tests for model capabilities detection."""
 
 from utils.model_capabilities import (
+    DEFAULT_CHARACTER_LIMIT,
+    get_character_limit,
+    get_credits_per_character,
     get_model_capabilities,
     supports_audio_tags,
+    supports_request_stitching,
     supports_speed,
 )
 
@@ -128,3 +132,19 @@ def test_get_model_capabilities_extensibility_with_audio_tags():
     assert isinstance(capabilities, dict)
     assert "speed" in capabilities
     assert "audio_tags" in capabilities
+
+
+def test_character_limits_and_credit_rates():
+    """Test per-request character limits and credits per character."""
+    assert get_character_limit("eleven_multilingual_v2") == 10000
+    assert get_character_limit("eleven_flash_v2_5") == 40000
+    assert get_character_limit("unknown_model") == DEFAULT_CHARACTER_LIMIT
+    assert get_credits_per_character("eleven_multilingual_v2") == 1.0
+    assert get_credits_per_character("eleven_turbo_v2_5") == 0.5
+
+
+def test_supports_request_stitching():
+    """Test that v3 models do not take previous/next text context."""
+    assert supports_request_stitching("eleven_multilingual_v2") is True
+    assert supports_request_stitching("eleven_flash_v2_5") is True
+    assert supports_request_stitching("eleven_v3") is False
@@ -0,0 +1,160 @@
+"""Tests for the MP3 helpers."""
+
+import io
+
+import pytest
+
+from utils.mp3 import (
+    concat_mp3_files,
+    id3v2_size,
+    index_mp3,
+    parse_frame_header,
+    read_mp3_info,
+    skip_id3v2_stream,
+    slice_mp3,
+    strip_id3,
+)
+
+# ID3v2.4 header for a 5-byte tag body (syncsafe size 0x00000005)
+ID3V2 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"TBODY"
+ID3V1 = b"TAG" + b"\x00" * 125
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo: 417-byte frames of 1152 samples
+FRAME_HEADER = b"\xff\xfb\x90\x64"
+FRAME_SIZE = 417
+FRAME_SECONDS = 1152 / 44100
+
+
+def make_frames(count, first=0):
+    """Build frames whose bodies are filled with their frame number."""
+    return b"".join(
+        FRAME_HEADER + bytes([number]) * (FRAME_SIZE - 4)
+        for number in range(first, first + count)
+    )
+
+
+def make_info_frame():
+    return FRAME_HEADER + b"\x00" * 32 + b"Xing" + b"\x00" * (FRAME_SIZE - 40)
+
+
+def test_id3v2_size():
+    assert id3v2_size(ID3V2 + b"frames") == 15
+    assert id3v2_size(b"\xff\xfbframes") == 0
+
+
+def test_strip_id3_removes_both_tags():
+    assert strip_id3(ID3V2 + b"frames" + ID3V1) == b"frames"
+    assert strip_id3(ID3V2 + b"frames", keep_id3v2=True) == ID3V2 + b"frames"
+
+
+def test_concat_mp3_files_keeps_only_first_tag(tmp_path):
+    paths = []
+    for number in range(3):
+        path = tmp_path / f"{number}.mp3"
+        path.write_bytes(ID3V2 + f"frames{number}".encode() + ID3V1)
+        paths.append(str(path))
+    out = io.BytesIO()
+
+    written = concat_mp3_files(paths, out)
+
+    assert out.getvalue() == ID3V2 + b"frames0frames1frames2"
+    assert written == len(out.getvalue())
+
+
+def test_skip_id3v2_stream_drops_tag_split_across_chunks():
+    data = ID3V2 + b"frames"
+    pieces = [data[:4], data[4:12], data[12:17], data[17:]]
+
+    assert b"".join(skip_id3v2_stream(pieces)) == b"frames"
+    assert list(skip_id3v2_stream([b"\xff\xfb", b"frames"])) == [b"\xff\xfb", b"frames"]
+
+
+def test_parse_frame_header():
+    header = parse_frame_header(FRAME_HEADER)
+
+    assert header["bitrate"] == 128
+    assert header["sample_rate"] == 44100
+    assert header["frame_size"] == FRAME_SIZE
+    assert parse_frame_header(b"\xff\xfb\xf0\x64") is None  # bad bitrate
+
+
+def test_index_mp3_skips_tags_junk_info_frame_and_cut_frame():
+    data = (
+        ID3V2
+        + b"\xff\x00junk"
+        + make_info_frame()
+        + make_frames(10)
+        + FRAME_HEADER
+        + b"cut"
+        + ID3V1
+    )
+
+    index = index_mp3(data)
+
+    assert index["id3v2_size"] == len(ID3V2)
+    assert index["info_frame"] == (len(ID3V2) + 6, FRAME_SIZE)
+    assert len(index["frames"]) == 10
+    assert index["frames"][0] == (len(ID3V2) + 6 + FRAME_SIZE, FRAME_SIZE)
+    assert index["duration"] == pytest.approx(10 * FRAME_SECONDS)
+    assert index["bitrate"] == 128
+
+
+def test_concat_mp3_files_joins_frames(tmp_path):
+    paths = []
+    for number in range(2):
+        path = tmp_path / f"{number}.mp3"
+        path.write_bytes(ID3V2 + make_info_frame() + make_frames(3, first=3 * number))
+        paths.append(str(path))
+    out = io.BytesIO()
+
+    concat_mp3_files(paths, out)
+
+    assert out.getvalue() == ID3V2 + make_frames(6)
+    assert read_mp3_info(paths[0])["frames"] == 3
+
+
+@pytest.mark.parametrize("info_frame, frames", [(b"", 400), (b"count", 1000)])
+def test_read_mp3_info_reads_only_the_start_of_long_files(
+    mocker, tmp_path, info_frame, frames
+):
+    if info_frame:
+        # Xing header with the frame count flag set and 1000 frames
+        info_frame = (
+            FRAME_HEADER
+            + b"\x00" * 32
+            + b"Xing\x00\x00\x00\x01"
+            + (1000).to_bytes(4, "big")
+        )
+        info_frame += b"\x00" * (FRAME_SIZE - len(info_frame))
+    path = tmp_path / "long.mp3"
+    path.write_bytes(
+        ID3V2 + info_frame + (FRAME_HEADER + b"\x00" * (FRAME_SIZE - 4)) * 400 + ID3V1
+    )
+    real_open = open
+    handles = []
+
+    def tracking_open(*args, **kwargs):
+        handles.append(mocker.MagicMock(wraps=real_open(*args, **kwargs)))
+        handles[-1].__enter__.return_value = handles[-1]
+        return handles[-1]
+
+    mocker.patch("builtins.open", side_effect=tracking_open)
+
+    info = read_mp3_info(str(path))
+
+    assert info["frames"] == frames
+    assert info["duration"] == pytest.approx(frames * FRAME_SECONDS)
+    assert info["sample_rate"] == 44100
+    # Bounded reads only: the ID3v2 header, the ID3v1 tag and the first audio
+    sizes = [call.args[0] if call.args else -1 for call in handles[0].read.mock_calls]
+    assert len(handles) == 1
+    assert min(sizes) > 0 and sum(sizes) < path.stat().st_size
+
+
+def test_slice_mp3_keeps_frames_in_range():
+    data = ID3V2 + make_info_frame() + make_frames(10)
+
+    cut = slice_mp3(data, 2 * FRAME_SECONDS, 5 * FRAME_SECONDS)
+
+    assert cut == ID3V2 + make_frames(3, first=2)
+    assert slice_mp3(data) == ID3V2 + make_frames(10)
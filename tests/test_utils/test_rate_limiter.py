@@ -0,0 +1,104 @@
+"""Tests for the rate-limit-aware request scheduler."""
+
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+from utils.error_handling import TransientAPIError
+from utils.rate_limiter import AdaptiveScheduler, TokenBucket, parse_retry_after
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert 25 <= parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+    assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0.0
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+    started = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - started >= 0.09  # 5 refills at 20ms each
+
+
+def test_scheduler_waits_for_retry_after_and_halves_concurrency():
+    scheduler = AdaptiveScheduler(max_concurrency=4, requests_per_second=1000)
+    attempts = []
+
+    def call():
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise TransientAPIError("throttled", status_code=429, retry_after=0.1)
+        return "ok"
+
+    assert scheduler.run(call) == "ok"
+    assert attempts[1] - attempts[0] >= 0.1
+    stats = scheduler.get_stats()
+    assert stats == {"calls": 1, "throttled": 1, "retries": 1, "limit": 2}
+
+
+def test_scheduler_ramps_back_up_after_successes():
+    scheduler = AdaptiveScheduler(max_concurrency=4, requests_per_second=1000)
+    scheduler._on_throttle(TransientAPIError("throttled", retry_after=0))
+    assert scheduler.limit == 2
+
+    for _ in range(2):
+        scheduler.run(lambda: None)
+    assert scheduler.limit == 3
+
+
+def test_scheduler_gives_up_after_max_retries():
+    scheduler = AdaptiveScheduler(max_concurrency=1, max_retries=2)
+
+    def call():
+        raise TransientAPIError("throttled", status_code=429, retry_after=0)
+
+    with pytest.raises(TransientAPIError):
+        scheduler.run(call)
+    assert scheduler.get_stats()["throttled"] == 3
+
+
+def test_scheduler_does_not_rerun_calls_after_server_errors():
+    scheduler = AdaptiveScheduler(max_concurrency=4, requests_per_second=1000)
+    attempts = []
+
+    def call():
+        attempts.append(1)
+        raise TransientAPIError("overloaded", status_code=503, retry_after=0)
+
+    with pytest.raises(TransientAPIError):
+        scheduler.run(call)
+    assert len(attempts) == 1
+    assert scheduler.get_stats() == {
+        "calls": 0,
+        "throttled": 1,
+        "retries": 0,
+        "limit": 2,
+    }
+
+
+def test_scheduler_respects_concurrency_limit():
+    scheduler = AdaptiveScheduler(max_concurrency=2, requests_per_second=1000)
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def call():
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.pop()
+
+    threads = [threading.Thread(target=scheduler.run, args=(call,)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) == 2
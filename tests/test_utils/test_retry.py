@@ -0,0 +1,89 @@
+"""Tests for the shared retry policy."""
+
+import socket
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from utils import http_client, retry
+from utils.retry import RetryPolicy
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(mocker):
+    retry.reset_retry_stats()
+    yield mocker.patch("utils.retry.time.sleep")
+    retry.reset_retry_stats()
+
+
+def _response(status_code, headers=None):
+    return MagicMock(status_code=status_code, headers=headers or {})
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_idempotent_request_retries_dropped_connection():
+    request = MagicMock(
+        side_effect=[requests.exceptions.ConnectionError("reset"), _response(200)]
+    )
+
+    response = RetryPolicy().send("fetch_models", request, idempotent=True)
+
+    assert response.status_code == 200
+    assert retry.get_retry_stats()["fetch_models"] == {
+        "attempts": 2,
+        "retries": 1,
+        "gave_up": 0,
+    }
+
+
+def test_paid_request_is_not_resent_after_ambiguous_failure():
+    request = MagicMock(side_effect=requests.exceptions.ReadTimeout("no reply"))
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        RetryPolicy().send("generate_audio", request, idempotent=False)
+    assert request.call_count == 1
+
+
+def test_paid_request_is_retried_when_connection_was_refused():
+    url = f"http://127.0.0.1:{_closed_port()}/v1/text-to-speech/voice"
+    attempts = []
+
+    def request():
+        attempts.append(url)
+        return http_client.post(url, json={}, timeout=2)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        RetryPolicy(max_attempts=3).send("generate_audio", request, idempotent=False)
+    assert len(attempts) == 3
+    assert retry.get_retry_stats()["generate_audio"]["gave_up"] == 1
+
+
+def test_status_retries_honour_retry_after_and_idempotency(no_sleep):
+    throttled = _response(429, {"Retry-After": "2"})
+    request = MagicMock(side_effect=[throttled, _response(200)])
+
+    response = RetryPolicy().send("get_openrouter_response", request, idempotent=False)
+
+    assert response.status_code == 200
+    throttled.close.assert_called_once()
+    assert no_sleep.call_args.args[0] >= 2
+
+    request = MagicMock(return_value=_response(500))
+    assert RetryPolicy().send("x", request, idempotent=False).status_code == 500
+    assert request.call_count == 1
+
+
+def test_deadline_stops_retries():
+    request = MagicMock(return_value=_response(503, {"Retry-After": "120"}))
+
+    response = RetryPolicy(deadline=60).send("fetch_voices", request, idempotent=True)
+
+    assert response.status_code == 503
+    assert request.call_count == 1
+    assert retry.get_retry_stats()["fetch_voices"]["gave_up"] == 1
@@ -0,0 +1,40 @@
+"""Tests for sentence-boundary text chunking."""
+
+from utils.text_chunking import get_chunk_size, split_text
+
+
+def test_split_text_keeps_short_text_whole():
+    assert split_text("  Hello there.  ", 100) == ["Hello there."]
+    assert split_text("   ", 100) == []
+
+
+def test_split_text_prefers_sentence_boundaries():
+    text = "One two three. Four five six! Seven eight nine? Ten."
+
+    chunks = split_text(text, 30)
+
+    assert chunks == ["One two three. Four five six!", "Seven eight nine? Ten."]
+    assert " ".join(chunks) == text
+
+
+def test_split_text_falls_back_to_clauses_words_and_cuts():
+    assert split_text("alpha, beta, gamma, delta", 13) == [
+        "alpha, beta,",
+        "gamma, delta",
+    ]
+    assert split_text("alpha beta gamma", 11) == ["alpha beta", "gamma"]
+    assert split_text("abcdefghij", 4) == ["abcd", "efgh", "ij"]
+
+
+def test_split_text_respects_max_chars():
+    text = " ".join(f"Sentence number {n} is here." for n in range(200))
+
+    chunks = split_text(text, 250)
+
+    assert all(len(chunk) <= 250 for chunk in chunks)
+    assert " ".join(chunks) == text
+
+
+def test_get_chunk_size_caps_at_model_limit():
+    assert get_chunk_size("eleven_multilingual_v2") == 1500
+    assert get_chunk_size("eleven_v3", 8000) == 5000
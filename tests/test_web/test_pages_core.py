@@ -1,9 +1,9 @@
 import io
+import os
 import runpy
 from types import SimpleNamespace
 from typing import Any
 
-import pandas as pd
 import pytest
 import streamlit as st
 
@@ -75,6 +75,7 @@ def stub_streamlit(monkeypatch):
     text_input_values: dict[str, str] = {}
     selectbox_choices: dict[str, Any] = {}
     checkbox_states: dict[str, bool] = {}
+    multiselect_choices: dict[str, list[Any]] = {}
     uploader_value: Any = None
 
     session_state: StubSessionState = StubSessionState()
@@ -95,6 +96,9 @@ def stub_streamlit(monkeypatch):
     def set_checkbox(label: str, value: bool) -> None:
         checkbox_states[label] = value
 
+    def set_multiselect(label: str, value: list[Any]) -> None:
+        multiselect_choices[label] = value
+
     def set_uploader(value: Any) -> None:
         nonlocal uploader_value
         uploader_value = value
@@ -139,6 +143,9 @@ def stub_streamlit(monkeypatch):
     def checkbox(label: str, value: bool = False, **kwargs) -> bool:
         return checkbox_states.get(label, value)
 
+    def multiselect(label: str, options: list[Any], default=None, **kwargs) -> list:
+        return multiselect_choices.get(label, list(default or []))
+
     def button(label: str, **kwargs) -> bool:
         return button_states.get(label, False)
 
@@ -149,6 +156,7 @@ def stub_streamlit(monkeypatch):
     monkeypatch.setattr(st, "text_area", text_area, raising=False)
     monkeypatch.setattr(st, "text_input", text_input, raising=False)
     monkeypatch.setattr(st, "checkbox", checkbox, raising=False)
+    monkeypatch.setattr(st, "multiselect", multiselect, raising=False)
     monkeypatch.setattr(st, "button", button, raising=False)
     monkeypatch.setattr(st, "file_uploader", file_uploader, raising=False)
     monkeypatch.setattr(
@@ -193,25 +201,58 @@ def stub_streamlit(monkeypatch):
         "set_text_input": set_text_input,
         "set_selectbox": set_selectbox,
         "set_checkbox": set_checkbox,
+        "set_multiselect": set_multiselect,
         "set_uploader": set_uploader,
     }
 
 
 @pytest.mark.core_suite
-def test_app_page_generates_audio(monkeypatch, stub_streamlit, tmp_path):
-    calls = {"generate_audio": 0}
+@pytest.mark.parametrize("stream_playback", [False, True])
+@pytest.mark.parametrize("skip_cache", [False, True])
+def test_app_page_generates_audio(
+    monkeypatch, stub_streamlit, tmp_path, stream_playback, skip_cache
+):
+    calls = {"generate_audio": 0, "stream_audio": 0}
+    use_cache = []
 
     single_dir = tmp_path / "single"
     single_dir.mkdir()
 
     def fake_generate_audio(*args, **kwargs):
         calls["generate_audio"] += 1
+        use_cache.append(kwargs["use_cache"])
         return True
 
+    partial_path = single_dir / ".clip.mp3.part"
+
+    def fake_stream_audio(*args, on_progress=None, **kwargs):
+        calls["stream_audio"] += 1
+        use_cache.append(kwargs["use_cache"])
+        partial_path.write_bytes(b"\xff" * 20000)
+        on_progress(str(partial_path), 20000)
+        with open(partial_path, "ab") as f:
+            f.write(b"\xff" * 100)
+        on_progress(str(partial_path), 20100)
+        for size in (50000, 120000, 300000, 800000):
+            on_progress(str(partial_path), size)
+        return {"bytes": 800000, "first_audio_seconds": 0.1, "total_seconds": 0.5}
+
+    previews = []
+    errors = []
+    monkeypatch.setattr(
+        st,
+        "empty",
+        lambda: SimpleNamespace(audio=lambda data, **kwargs: previews.append(data)),
+        raising=False,
+    )
+    monkeypatch.setattr("utils.error_handling.handle_error", errors.append)
+
     stub_streamlit["set_text_area"]("Text to speech", "Hello {name}")
     stub_streamlit["set_selectbox"]("Select model", "Model 1")
     stub_streamlit["set_selectbox"]("Select voice", "Voice 1")
     stub_streamlit["set_button"]("Generate Audio", True)
+    stub_streamlit["set_checkbox"]("Stream playback", stream_playback)
+    stub_streamlit["set_checkbox"]("Regenerate (skip cache)", skip_cache)
     stub_streamlit["session_state"]["ELEVENLABS_API_KEY"] = "sk-test"
 
     monkeypatch.setattr("utils.api_keys.get_elevenlabs_api_key", lambda: "sk-test")
@@ -250,6 +291,7 @@ def test_app_page_generates_audio(monkeypatch, stub_streamlit, tmp_path):
     monkeypatch.setattr(
         "scripts.Elevenlabs_functions.generate_audio", fake_generate_audio
     )
+    monkeypatch.setattr("scripts.Elevenlabs_functions.stream_audio", fake_stream_audio)
     monkeypatch.setattr(
         "scripts.openrouter_functions.get_default_enhancement_model",
         lambda: "openrouter/auto",
@@ -271,14 +313,28 @@ def test_app_page_generates_audio(monkeypatch, stub_streamlit, tmp_path):
         if "st.stop" not in str(exc):
             raise
 
-    assert calls["generate_audio"] == 1
+    assert errors == []
+    assert use_cache == [not skip_cache]
+    assert calls == {
+        "generate_audio": 0 if stream_playback else 1,
+        "stream_audio": 1 if stream_playback else 0,
+    }
+    if stream_playback:
+        # The player reads the partial file a capped number of times at
+        # doubling sizes, then the finished clip
+        assert previews[:-1] == [str(partial_path)] * 3
+        assert previews[-1].startswith(str(single_dir))
+        assert previews[-1].endswith(".mp3")
 
 
 @pytest.mark.core_suite
-def test_bulk_generation_page_invokes_bulk_generation(monkeypatch, stub_streamlit):
-    csv_bytes = io.BytesIO(b"text,filename\nHello {name},greeting_{name}")
+def test_bulk_generation_page_invokes_bulk_generation(
+    monkeypatch, stub_streamlit, tmp_path
+):
+    csv_bytes = io.BytesIO(b"text,filename,name\nHello {name},greeting_{name},Alice")
     uploaded = SimpleNamespace(
         name="demo.csv",
+        file_id="demo-upload",
         size=len(csv_bytes.getvalue()),
         read=csv_bytes.read,
         seek=csv_bytes.seek,
@@ -287,17 +343,18 @@ def test_bulk_generation_page_invokes_bulk_generation(monkeypatch, stub_streamli
     stub_streamlit["set_button"]("Generate Bulk Audio", True)
     stub_streamlit["set_selectbox"]("Select model", "Model 1")
     stub_streamlit["set_selectbox"]("Select voice", "Voice 1")
-    df = pd.DataFrame(
-        [{"text": "Hello {name}", "filename": "greeting_{name}", "name": "Alice"}]
-    )
-    monkeypatch.setattr("pandas.read_csv", lambda *_: df.copy())
-
     success_messages: list[str] = []
+    bulk_calls: list[bytes] = []
 
-    def record_bulk(*args, **kwargs):
+    def record_bulk(api_key, model_id, voice_id, csv_file, *args, **kwargs):
+        bulk_calls.append(csv_file.read())
         return True, "ok"
 
     from pages import Bulk_Generation
+    from utils.job_queue import JobQueue
+
+    job_queue = JobQueue(db_path=str(tmp_path / "jobs.db"))
+    monkeypatch.setattr(Bulk_Generation, "get_job_queue", lambda: job_queue)
 
     monkeypatch.setattr(Bulk_Generation, "get_elevenlabs_api_key", lambda: "sk-test")
     monkeypatch.setattr(
@@ -329,15 +386,64 @@ def test_bulk_generation_page_invokes_bulk_generation(monkeypatch, stub_streamli
     )
 
     Bulk_Generation.main()
+    job_queue.shutdown(wait=True)
+    assert bulk_calls == [csv_bytes.getvalue()]
+
+    # The job ran in the background; the next rerun shows its result
+    stub_streamlit["set_button"]("Generate Bulk Audio", False)
+    Bulk_Generation.main()
+    assert any("Bulk generation completed!" in message for message in success_messages)
+
+    # A refreshed page gets a new session; the URL only lets it follow the job
+    (job,) = job_queue.list_jobs(stub_streamlit["session_state"]["session_id"])
+    assert st.query_params["job"] == job["token"]
+    stub_streamlit["session_state"].clear()
+    stub_streamlit["set_uploader"](None)
+    success_messages.clear()
+    Bulk_Generation.main()
+    assert stub_streamlit["session_state"]["session_id"] != job["session_id"]
+    assert stub_streamlit["session_state"]["bulk_followed_jobs"] == [job["id"]]
     assert any("Bulk generation completed!" in message for message in success_messages)
+    del st.query_params["job"]
+
+
+@pytest.mark.core_suite
+def test_failed_rows_csv_is_parsed_once_per_upload_and_run(
+    monkeypatch, stub_streamlit, tmp_path
+):
+    from pages import Bulk_Generation
+
+    reads = []
+
+    def read_rows(csv_file, rows):
+        reads.append(rows)
+        return Bulk_Generation.pd.DataFrame({"text": ["row"] * len(rows)})
+
+    monkeypatch.setattr(Bulk_Generation, "read_bulk_rows", read_rows)
+    report_path = tmp_path / "report.csv"
+    report_path.write_text("row,status\n0,failed\n")
+    uploaded = SimpleNamespace(file_id="demo-upload")
+
+    first = Bulk_Generation.failed_rows_csv(uploaded, str(report_path), [0])
+    assert Bulk_Generation.failed_rows_csv(uploaded, str(report_path), [0]) == first
+    assert reads == [[0]]
+
+    # A new run rewrites the report
+    os.utime(report_path, ns=(0, 0))
+    Bulk_Generation.failed_rows_csv(uploaded, str(report_path), [0])
+    assert reads == [[0], [0]]
 
 
 @pytest.mark.core_suite
-def test_translation_page_triggers_translation(monkeypatch, stub_streamlit):
-    calls = {"translate": 0}
+@pytest.mark.parametrize("extra_languages", [[], ["German"]])
+def test_translation_page_triggers_translation(
+    monkeypatch, stub_streamlit, extra_languages
+):
+    calls = {"translate": 0, "fan_out": []}
 
     stub_streamlit["set_text_area"]("Enter text to translate", "Hello there")
     stub_streamlit["set_selectbox"]("Select target language", "French")
+    stub_streamlit["set_multiselect"]("Also translate to", extra_languages)
     stub_streamlit["set_button"]("Translate", True)
 
     monkeypatch.setattr(
@@ -369,6 +475,11 @@ def test_translation_page_triggers_translation(monkeypatch, stub_streamlit):
         lambda *args, **kwargs: calls.update(translate=calls["translate"] + 1)
         or "Bonjour",
     )
+    monkeypatch.setattr(
+        "scripts.Translation_functions.translate_to_languages",
+        lambda text, languages, model=None: calls["fan_out"].append(languages)
+        or {language: "..." for language in languages},
+    )
     monkeypatch.setattr(
         "utils.error_handling.handle_error", lambda *args, **kwargs: (False, "handled")
     )
@@ -379,7 +490,11 @@ def test_translation_page_triggers_translation(monkeypatch, stub_streamlit):
         if "st.stop" not in str(exc):
             raise
 
-    assert calls["translate"] == 1
+    if extra_languages:
+        # Several languages are translated in one concurrent fan-out
+        assert calls == {"translate": 0, "fan_out": [["French", "German"]]}
+    else:
+        assert calls == {"translate": 1, "fan_out": []}
 
 
 @pytest.mark.core_suite
@@ -478,6 +593,66 @@ def test_file_explorer_page_lists_outputs(monkeypatch, stub_streamlit, tmp_path)
     assert "generated_audio" not in stub_streamlit["session_state"]
 
 
+@pytest.mark.core_suite
+def test_file_explorer_offers_archives_only_when_requested_and_caches_them(
+    monkeypatch, stub_streamlit, tmp_path
+):
+    session_dir = tmp_path / "outputs"
+    bulk_dir = session_dir / "bulk" / "demo"
+    single_dir = session_dir / "single"
+    bulk_dir.mkdir(parents=True)
+    single_dir.mkdir(parents=True)
+    (bulk_dir / "demo_file.mp3").write_bytes(b"bulk audio")
+    (single_dir / "en_voice_20250101_abc12345.mp3").write_bytes(b"single audio")
+
+    monkeypatch.setattr("utils.session_manager.cleanup_old_sessions", lambda: None)
+    monkeypatch.setattr("utils.session_manager.get_session_id", lambda: "abcdef123456")
+    monkeypatch.setattr(
+        "utils.session_manager.get_session_output_dir", lambda: str(session_dir)
+    )
+    built = []
+    monkeypatch.setattr(
+        "utils.archive.zipfile.ZipFile.write",
+        lambda self, path, arcname=None, **kwargs: built.append(arcname),
+    )
+    archives = {}
+
+    def download_button(label, data, file_name=None, mime=None, key=None, **kwargs):
+        if mime == "application/zip":
+            # Streamlit only accepts bytes, str or files it can read
+            assert isinstance(data, bytes)
+            archives[key] = file_name
+
+    monkeypatch.setattr(st, "download_button", download_button)
+    stub_streamlit["set_button"]("📦 Download All Single Files", True)
+
+    runpy.run_path("pages/File_Explorer.py", run_name="__main__")
+
+    assert archives == {"download_all_single": "single_abcdef12.zip"}
+    assert built == ["en_voice_20250101_abc12345.mp3"]
+
+    # Other reruns do not hand the archive to Streamlit again
+    stub_streamlit["set_button"]("📦 Download All Single Files", False)
+    archives.clear()
+    runpy.run_path("pages/File_Explorer.py", run_name="__main__")
+
+    assert archives == {}
+
+    # Asking again offers the cached archive without building it again
+    stub_streamlit["set_button"]("📦 Download All Single Files", True)
+    runpy.run_path("pages/File_Explorer.py", run_name="__main__")
+
+    assert archives == {"download_all_single": "single_abcdef12.zip"}
+    assert len(built) == 1
+
+    # A changed file invalidates it
+    single_clip = single_dir / "en_voice_20250101_abc12345.mp3"
+    single_clip.write_bytes(b"new single audio")
+    runpy.run_path("pages/File_Explorer.py", run_name="__main__")
+
+    assert len(built) == 2
+
+
 @pytest.mark.core_suite
 def test_voice_design_workflow_uses_api_functions(monkeypatch, stub_streamlit):
     calls = {"previews": 0, "create": 0}
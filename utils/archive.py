@@ -0,0 +1,235 @@
+"""ZIP archives of generated audio for download.
+
+Small archives are built in memory and larger ones in a named temporary
+file on disk; each member is copied in blocks, so building one never holds
+all the clips in memory at once. MP3 and other already-compressed files are
+stored as they are; deflating them costs CPU and saves next to nothing.
+:func:`open_download` hands an archive to ``st.download_button`` as bytes
+or as the file on disk, the two forms Streamlit accepts.
+
+Built archives are kept in an :class:`ArchiveCache` under a fingerprint of
+their files' names, modification times and sizes. Checking whether an
+archive is still current costs one ``stat`` per file, and any change to the
+files gives a new fingerprint, so stale archives are never served.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+import zipfile
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO, BinaryIO
+
+# Archives of up to this many bytes of files are built in memory, larger
+# ones in a temp file
+ARCHIVE_SPOOL_SIZE = 16 * 1024 * 1024  # 16MB
+
+# Built archives an ArchiveCache keeps before closing the least recently used
+MAX_CACHED_ARCHIVES = 4
+
+# Extensions of compressed formats that are stored rather than deflated
+STORED_EXTENSIONS = (".mp3", ".zip", ".ogg", ".opus", ".m4a", ".aac", ".flac")
+
+
+def _compression_for(file_path: str) -> int:
+    """Get the ZIP compression method for a file."""
+    if file_path.lower().endswith(STORED_EXTENSIONS):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def build_zip_archive(
+    file_paths: list[str],
+    base_dir: str | None = None,
+    spool_size: int = ARCHIVE_SPOOL_SIZE,
+) -> IO[bytes]:
+    """Write files into a ZIP archive in memory or in a temporary file.
+
+    Files that no longer exist are left out.
+
+    Args:
+        file_paths (List[str]): Files to include, in archive order.
+        base_dir (Optional[str]): Name members by their path relative to this
+            directory, keeping subfolders apart; by file name if None.
+        spool_size (int): Build the archive in memory if the files add up to
+            at most this many bytes, in a temp file otherwise (default: 16MB).
+
+    Returns:
+        IO[bytes]: The archive, positioned at the start: an ``io.BytesIO`` or
+        a named temp file. Pass it to :func:`close_archive` to free the
+        memory or remove the temp file.
+
+    Raises:
+        OSError: If a file cannot be read or the archive cannot be written.
+    """
+    total_size = 0
+    for file_path in file_paths:
+        try:
+            total_size += os.path.getsize(file_path)
+        except OSError:
+            pass
+    if total_size <= spool_size:
+        archive: IO[bytes] = io.BytesIO()
+    else:
+        # Reopened by name for download, which Windows only allows when the
+        # file is not deleted on close; close_archive removes it
+        archive = tempfile.NamedTemporaryFile(
+            prefix="eleventools-", suffix=".zip", delete_on_close=False
+        )
+    try:
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            for file_path in file_paths:
+                if not os.path.exists(file_path):
+                    continue
+                if base_dir:
+                    arcname = os.path.relpath(file_path, base_dir)
+                else:
+                    arcname = os.path.basename(file_path)
+                zip_file.write(
+                    file_path, arcname, compress_type=_compression_for(file_path)
+                )
+    except BaseException:
+        close_archive(archive)
+        raise
+    archive.flush()
+    archive.seek(0)
+    return archive
+
+
+def close_archive(archive: IO[bytes]) -> None:
+    """Close an archive from :func:`build_zip_archive` and remove its temp file.
+
+    Args:
+        archive (IO[bytes]): Archive to close.
+    """
+    archive.close()
+    name = getattr(archive, "name", None)
+    if isinstance(name, str):
+        try:
+            os.remove(name)
+        except OSError:
+            pass
+
+
+@contextmanager
+def open_download(archive: IO[bytes]) -> Iterator[bytes | BinaryIO]:
+    """Open an archive in a form ``st.download_button`` accepts.
+
+    Streamlit rejects other file-like objects, so archives in memory are
+    given as bytes and archives on disk as their file, opened by name.
+
+    Args:
+        archive (IO[bytes]): Archive from :func:`build_zip_archive`.
+
+    Yields:
+        Union[bytes, BinaryIO]: The archive's bytes, or its file opened for
+        reading; the file is closed when the ``with`` block ends.
+    """
+    name = getattr(archive, "name", None)
+    if isinstance(name, str):
+        with open(name, "rb") as f:
+            yield f
+    else:
+        archive.seek(0)
+        yield archive.read()
+
+
+def fingerprint_files(file_paths: list[str], base_dir: str | None = None) -> str:
+    """Fingerprint a set of files by name, modification time and size.
+
+    File contents are not read. Missing files are part of the fingerprint, so
+    a file appearing or disappearing changes it.
+
+    Args:
+        file_paths (List[str]): Files an archive is built from.
+        base_dir (Optional[str]): Directory member names are relative to, as
+            passed to :func:`build_zip_archive`.
+
+    Returns:
+        str: Hex digest that changes whenever a file is added, removed,
+        renamed or rewritten.
+    """
+    digest = hashlib.sha256(f"{base_dir}\n".encode())
+    for file_path in sorted(file_paths):
+        try:
+            stat = os.stat(file_path)
+            entry = f"{file_path}\0{stat.st_mtime_ns}\0{stat.st_size}\n"
+        except OSError:
+            entry = f"{file_path}\0missing\n"
+        digest.update(entry.encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+class ArchiveCache:
+    """Built archives keyed by the fingerprint of the files in them.
+
+    Archives are evicted least recently used first once more than
+    ``max_entries`` are kept; evicted archives are closed, which frees their
+    memory or removes their temp file.
+
+    Attributes:
+        max_entries (int): Maximum number of archives kept.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_ARCHIVES):
+        """Initialize the archive cache.
+
+        Args:
+            max_entries (int): Maximum number of archives kept (default: 4).
+        """
+        self.max_entries = max_entries
+        self._archives: OrderedDict[str, IO[bytes]] = OrderedDict()
+
+    def get(self, fingerprint: str) -> IO[bytes] | None:
+        """Get a built archive, positioned at the start.
+
+        Args:
+            fingerprint (str): Fingerprint from :func:`fingerprint_files`.
+
+        Returns:
+            Optional[IO[bytes]]: The archive, or None if it is not cached.
+        """
+        archive = self._archives.get(fingerprint)
+        if archive is None:
+            return None
+        self._archives.move_to_end(fingerprint)
+        archive.seek(0)
+        return archive
+
+    def build(
+        self, file_paths: list[str], base_dir: str | None = None
+    ) -> tuple[str, IO[bytes]]:
+        """Get the archive of a set of files, building it if it is not cached.
+
+        Args:
+            file_paths (List[str]): Files to include.
+            base_dir (Optional[str]): Directory member names are relative to.
+
+        Returns:
+            Tuple[str, IO[bytes]]: The files' fingerprint and their archive,
+            positioned at the start.
+
+        Raises:
+            OSError: If the archive cannot be built.
+        """
+        fingerprint = fingerprint_files(file_paths, base_dir)
+        archive = self.get(fingerprint)
+        if archive is None:
+            archive = build_zip_archive(file_paths, base_dir=base_dir)
+            self._archives[fingerprint] = archive
+            while len(self._archives) > self.max_entries:
+                _, evicted = self._archives.popitem(last=False)
+                close_archive(evicted)
+        return fingerprint, archive
+
+    def clear(self) -> None:
+        """Close and remove all archives."""
+        for archive in self._archives.values():
+            close_archive(archive)
+        self._archives.clear()
+
+    def __len__(self) -> int:
+        return len(self._archives)
@@ -0,0 +1,187 @@
+"""Shared asyncio HTTP client for ElevenTools.
+
+This module is the asyncio counterpart of :mod:`utils.http_client`: an
+``httpx.AsyncClient`` with keep-alive connection pools, so many ElevenLabs and
+OpenRouter requests can be multiplexed on a single thread. An async client is
+bound to the event loop it was first used on, and Streamlit starts a fresh loop
+for every :func:`run_async` call, so one client is kept per running loop and
+closed when that loop's work is done.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from utils import http_client
+from utils.error_handling import ConfigurationError
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _build_client() -> "httpx.AsyncClient":
+    """Create an async client using the shared pool configuration.
+
+    Returns:
+        httpx.AsyncClient: A new client with keep-alive connection pools.
+
+    Raises:
+        ConfigurationError: If httpx is not installed.
+    """
+    if httpx is None:
+        raise ConfigurationError(
+            "The async API client requires httpx", "Install it with: pip install httpx"
+        )
+    config = http_client._pool_config
+    limits = httpx.Limits(
+        max_connections=config["pool_connections"] * config["pool_maxsize"],
+        max_keepalive_connections=config["pool_maxsize"],
+    )
+    return httpx.AsyncClient(limits=limits, timeout=config["timeout"])
+
+
+def get_client() -> "httpx.AsyncClient":
+    """Get the async client for the running event loop, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient: Client shared by every coroutine on this loop.
+
+    Raises:
+        RuntimeError: If called outside a running event loop.
+        ConfigurationError: If httpx is not installed.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = _build_client()
+            _clients[loop] = client
+        return client
+
+
+async def request(method: str, url: str, **kwargs: Any) -> "httpx.Response":
+    """Send a request through the shared async client.
+
+    Args:
+        method (str): HTTP method, e.g. "GET" or "POST".
+        url (str): Request URL.
+        **kwargs: Passed through to ``httpx.AsyncClient.request``.
+
+    Returns:
+        httpx.Response: The response object with its body read.
+    """
+    return await get_client().request(method, url, **kwargs)
+
+
+async def get(url: str, **kwargs: Any) -> "httpx.Response":
+    """Send a GET request through the shared async client.
+
+    Args:
+        url (str): Request URL.
+        **kwargs: Passed through to :func:`request`.
+
+    Returns:
+        httpx.Response: The response object.
+    """
+    return await request("GET", url, **kwargs)
+
+
+async def post(url: str, **kwargs: Any) -> "httpx.Response":
+    """Send a POST request through the shared async client.
+
+    Args:
+        url (str): Request URL.
+        **kwargs: Passed through to :func:`request`.
+
+    Returns:
+        httpx.Response: The response object.
+    """
+    return await request("POST", url, **kwargs)
+
+
+async def stream(method: str, url: str, **kwargs: Any) -> "httpx.Response":
+    """Send a request without reading the response body.
+
+    The caller must read the body with ``aiter_bytes()`` and close the
+    response with ``aclose()``.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Request URL.
+        **kwargs: Passed through to ``httpx.AsyncClient.build_request``.
+
+    Returns:
+        httpx.Response: The open response.
+    """
+    client = get_client()
+    return await client.send(client.build_request(method, url, **kwargs), stream=True)
+
+
+async def aclose() -> None:
+    """Close the async client of the running event loop, if any."""
+    with _lock:
+        client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _run_and_close(coro: Coroutine[Any, Any, T]) -> T:
+    """Await a coroutine, then close the loop's async client.
+
+    Args:
+        coro (Coroutine): Coroutine to run.
+
+    Returns:
+        T: The coroutine's result.
+    """
+    try:
+        return await coro
+    finally:
+        await aclose()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Streamlit pages run in a plain thread, so this normally starts a new event
+    loop. If the calling thread already runs a loop, the coroutine is run on a
+    helper thread instead. That thread has no Streamlit script context, so the
+    coroutine must not read ``st.session_state`` or ``st.secrets``: resolve
+    API keys and settings before creating it and pass them in.
+
+    Args:
+        coro (Coroutine): Coroutine to run.
+
+    Returns:
+        T: The coroutine's result.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_run_and_close(coro))
+
+    result: dict[str, Any] = {}
+
+    def target() -> None:
+        try:
+            result["value"] = asyncio.run(_run_and_close(coro))
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
@@ -0,0 +1,69 @@
+"""Atomic file writes for ElevenTools.
+
+Files are written to a hidden ``.part`` file next to their destination and
+renamed into place only once the write has succeeded, so readers (the File
+Explorer, a resumed bulk job, another worker process) never see a partly
+written file under its final name.
+"""
+
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO, Any
+
+
+@contextmanager
+def atomic_write(
+    path: str,
+    mode: str = "wb",
+    encoding: str | None = None,
+    newline: str | None = None,
+) -> Iterator[IO[Any]]:
+    """Open a hidden temporary file that replaces ``path`` on success.
+
+    The file is created next to ``path`` with a ``.part`` suffix and renamed
+    into place only if the ``with`` block completes; on error it is removed.
+
+    Args:
+        path (str): Final path of the file.
+        mode (str): ``open`` mode, ``"wb"`` or ``"w"``.
+        encoding (Optional[str]): Text encoding for ``"w"`` mode.
+        newline (Optional[str]): Newline handling for ``"w"`` mode.
+
+    Yields:
+        IO: File object to write the content to; its ``name`` is the
+        temporary file's path.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".part", dir=directory
+    )
+    os.close(fd)
+    try:
+        with open(temp_path, mode, encoding=encoding, newline=newline) as f:
+            yield f
+        # mkstemp creates owner-only files; match a normal open(..., "w")
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path: str, data: Any) -> None:
+    """Write JSON to ``path`` through :func:`atomic_write`.
+
+    Args:
+        path (str): Destination file.
+        data (Any): JSON-serializable data.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    with atomic_write(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
@@ -0,0 +1,282 @@
+"""Content-addressed audio cache for ElevenTools.
+
+This module stores generated clips on disk keyed by a stable digest of
+everything that determines the audio (text, voice, model and voice settings),
+so identical requests are served from disk instead of calling the paid
+ElevenLabs API again. The cache is size-bounded with least-recently-used
+eviction.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+AUDIO_CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", ".cache", "audio")
+DEFAULT_MAX_CACHE_BYTES = 500 * 1024 * 1024  # 500MB
+
+
+def make_audio_cache_key(
+    text: str,
+    voice_id: str,
+    model_id: str,
+    voice_settings: dict[str, Any],
+    speed: float | None = None,
+    language_code: str | None = None,
+) -> str:
+    """Build a stable cache key for a text-to-speech request.
+
+    Args:
+        text (str): Text being converted to speech.
+        voice_id (str): ID of the voice.
+        model_id (str): ID of the model.
+        voice_settings (Dict[str, Any]): Stability, similarity boost, style and
+            speaker boost settings.
+        speed (Optional[float]): Speed multiplier, if any.
+        language_code (Optional[str]): Language code, if any.
+
+    Returns:
+        str: Hex SHA-256 digest identifying the request.
+    """
+    payload = {
+        "text": text,
+        "voice_id": voice_id,
+        "model_id": model_id,
+        "voice_settings": voice_settings,
+        "speed": speed,
+        "language_code": language_code,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """Disk-backed, size-bounded LRU cache of generated audio files.
+
+    Entries are stored as ``<cache_dir>/<key[:2]>/<key>.mp3``. Their sizes and
+    recency are kept in memory, so storing a clip only walks the cache when it
+    is created and evicts only once the running total exceeds ``max_bytes``.
+    Hits never touch the entry file: it may be hard-linked to a user's output,
+    and changing its modification time would change the output's too. Entries
+    found on disk at start are ordered by modification time, i.e. by when they
+    were stored; ones stored by other processes sharing the directory are
+    counted on the next start.
+
+    Attributes:
+        cache_dir (str): Directory where cached clips are stored.
+        max_bytes (int): Total size above which the oldest entries are evicted.
+    """
+
+    def __init__(
+        self, cache_dir: str | None = None, max_bytes: int = DEFAULT_MAX_CACHE_BYTES
+    ):
+        """Initialize the audio cache.
+
+        Args:
+            cache_dir (Optional[str]): Cache directory (default: .cache/audio).
+            max_bytes (int): Maximum total size in bytes (default: 500MB).
+        """
+        self.cache_dir = cache_dir or AUDIO_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bytes_saved = 0
+        # Entry sizes by key, least recently used first
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._scan()
+
+    def _scan(self) -> None:
+        """Index the clips already in the cache directory, oldest first."""
+        found = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".mp3"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, name[: -len(".mp3")], stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+        self._total_bytes = sum(self._entries.values())
+
+    def _touch(self, key: str, size: int) -> None:
+        """Record an entry as the most recently used; call with the lock held.
+
+        Args:
+            key (str): Cache key of the entry.
+            size (int): Entry size in bytes.
+        """
+        self._total_bytes += size - self._entries.pop(key, 0)
+        self._entries[key] = size
+
+    def _entry_path(self, key: str) -> str:
+        """Get the file path for a cache key.
+
+        Args:
+            key (str): Cache key from :func:`make_audio_cache_key`.
+
+        Returns:
+            str: Path of the cached clip for the key.
+        """
+        return os.path.join(self.cache_dir, key[:2], f"{key}.mp3")
+
+    def contains(self, key: str) -> bool:
+        """Check whether a clip is cached, without counting a lookup.
+
+        Args:
+            key (str): Cache key to look up.
+
+        Returns:
+            bool: True if the clip is in the cache.
+        """
+        return os.path.exists(self._entry_path(key))
+
+    def get(self, key: str, output_path: str) -> bool:
+        """Place a cached clip at ``output_path`` if one exists.
+
+        The clip is hard-linked when possible and copied otherwise (e.g. when
+        the cache and output directories are on different file systems).
+
+        Args:
+            key (str): Cache key to look up.
+            output_path (str): Where the clip should be placed.
+
+        Returns:
+            bool: True on a cache hit, False on a miss.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            size = os.path.getsize(entry_path)
+            place_file(entry_path, output_path)
+        except OSError:
+            with self._lock:
+                self._misses += 1
+            return False
+
+        with self._lock:
+            self._hits += 1
+            self._bytes_saved += size
+            self._touch(key, size)
+        logger.info("Audio cache hit for %s (%s bytes)", key[:12], size)
+        return True
+
+    def put(self, key: str, source_path: str) -> None:
+        """Store a generated clip in the cache.
+
+        Args:
+            key (str): Cache key for the clip.
+            source_path (str): Path of the generated clip.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            place_file(source_path, entry_path)
+            size = os.path.getsize(entry_path)
+        except OSError as e:
+            logger.warning("Could not store clip in audio cache: %s", e)
+            return
+        with self._lock:
+            self._touch(key, size)
+            over_limit = self._total_bytes > self.max_bytes
+        if over_limit:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used entries until under ``max_bytes``.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        victims = []
+        with self._lock:
+            while self._total_bytes > self.max_bytes and self._entries:
+                key, size = self._entries.popitem(last=False)
+                self._total_bytes -= size
+                victims.append(key)
+
+        removed = 0
+        for key in victims:
+            try:
+                os.remove(self._entry_path(key))
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached clip."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache effectiveness counters for this process.
+
+        Returns:
+            Dict[str, Any]: Dictionary with hits, misses, hit_ratio and
+            bytes_saved (bytes not downloaded thanks to cache hits).
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "bytes_saved": self._bytes_saved,
+            }
+
+
+def place_file(source_path: str, target_path: str) -> None:
+    """Atomically place a copy of ``source_path`` at ``target_path``.
+
+    Args:
+        source_path (str): Existing file.
+        target_path (str): Destination path; replaced if it exists.
+
+    Raises:
+        OSError: If the source is missing or the target cannot be written.
+    """
+    temp_path = f"{target_path}.{uuid.uuid4().hex}.part"
+    try:
+        try:
+            os.link(source_path, temp_path)
+        except OSError:
+            shutil.copyfile(source_path, temp_path)
+        os.replace(temp_path, target_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+_audio_cache: AudioCache | None = None
+_audio_cache_lock = threading.Lock()
+
+
+def get_audio_cache() -> AudioCache:
+    """Get the shared audio cache instance.
+
+    Returns:
+        AudioCache: Process-wide audio cache.
+    """
+    global _audio_cache
+    with _audio_cache_lock:
+        if _audio_cache is None:
+            _audio_cache = AudioCache()
+        return _audio_cache
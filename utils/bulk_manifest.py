@@ -0,0 +1,185 @@
+"""Checkpoint manifests for bulk generation jobs.
+
+Each bulk output directory gets a small JSON manifest recording which CSV rows
+have been generated, the request they were generated from and a SHA-256 hash
+of the resulting file. An interrupted job can then be resumed: rows whose
+request is unchanged and whose file is still intact are skipped instead of
+being paid for again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from utils.atomic_files import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".bulk_manifest.json"
+MANIFEST_VERSION = 1
+CHECKPOINT_INTERVAL = 2.0  # Seconds between manifest writes during a run
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+def hash_file(path: str) -> str:
+    """Compute the SHA-256 digest of a file.
+
+    Args:
+        path (str): File to hash.
+
+    Returns:
+        str: Hex digest of the file contents.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BulkManifest:
+    """Record of completed rows for one bulk output directory.
+
+    Rows are keyed by their CSV row index. Each entry stores the request key
+    (see :func:`utils.audio_cache.make_audio_cache_key`), the output file name,
+    its size and its SHA-256 hash. Writes are atomic and throttled to one every
+    ``CHECKPOINT_INTERVAL`` seconds; call :meth:`flush` when a run ends.
+
+    Attributes:
+        output_dir (str): Bulk output directory the manifest belongs to.
+        path (str): Path of the manifest file.
+    """
+
+    def __init__(self, output_dir: str):
+        """Load the manifest for a bulk output directory, if one exists.
+
+        Args:
+            output_dir (str): Bulk output directory.
+        """
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_FILENAME)
+        self._lock = threading.Lock()
+        self._rows = self._load()
+        self._dirty = False
+        self._last_save: float | None = None
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Read completed rows from disk.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Row entries keyed by row index, or an
+            empty dict if the manifest is missing, corrupt or outdated.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable bulk manifest %s: %s", self.path, e)
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        rows = data.get("rows")
+        return rows if isinstance(rows, dict) else {}
+
+    def completed_count(self) -> int:
+        """Get the number of rows recorded as completed.
+
+        Returns:
+            int: Number of completed rows in the manifest.
+        """
+        with self._lock:
+            return len(self._rows)
+
+    def is_complete(self, index: int, request_key: str, output_path: str) -> bool:
+        """Check whether a row can be skipped.
+
+        A row is complete if it was recorded for the same request and output
+        file, and the file on disk still has the recorded hash.
+
+        Args:
+            index (int): CSV row index.
+            request_key (str): Key identifying the text, voice, model and settings.
+            output_path (str): Path the row writes to.
+
+        Returns:
+            bool: True if the recorded output is still valid.
+        """
+        with self._lock:
+            entry = self._rows.get(str(index))
+        if not entry:
+            return False
+        if entry.get("request") != request_key:
+            return False
+        if entry.get("file") != os.path.basename(output_path):
+            return False
+        try:
+            if os.path.getsize(output_path) != entry.get("bytes"):
+                return False
+            return hash_file(output_path) == entry.get("sha256")
+        except OSError:
+            return False
+
+    def record(self, index: int, request_key: str, output_path: str) -> None:
+        """Record a completed row and checkpoint if the interval has passed.
+
+        Rows whose output file does not exist are not recorded.
+
+        Args:
+            index (int): CSV row index.
+            request_key (str): Key identifying the text, voice, model and settings.
+            output_path (str): Path the row was written to.
+        """
+        try:
+            entry = {
+                "request": request_key,
+                "file": os.path.basename(output_path),
+                "bytes": os.path.getsize(output_path),
+                "sha256": hash_file(output_path),
+                "completed_at": time.time(),
+            }
+        except OSError as e:
+            logger.warning("Not checkpointing row %s: %s", index, e)
+            return
+
+        with self._lock:
+            self._rows[str(index)] = entry
+            self._dirty = True
+            due = (
+                self._last_save is None
+                or time.monotonic() - self._last_save >= CHECKPOINT_INTERVAL
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes to disk."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"version": MANIFEST_VERSION, "rows": dict(self._rows)}
+            self._dirty = False
+            self._last_save = time.monotonic()
+        try:
+            atomic_write_json(self.path, data)
+        except OSError as e:
+            logger.warning("Could not write bulk manifest %s: %s", self.path, e)
+
+    def reset(self) -> None:
+        """Forget every completed row and delete the manifest file."""
+        with self._lock:
+            self._rows.clear()
+            self._dirty = False
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
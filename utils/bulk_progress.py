@@ -0,0 +1,129 @@
+"""Progress tracking for bulk generation runs.
+
+:func:`scripts.Elevenlabs_functions.bulk_generate_audio` feeds every finished
+row into a :class:`BulkProgress` and passes snapshots of it to its progress
+callback: rows done, failed and skipped, bytes written, throughput and an
+estimated time to completion. Snapshots are plain dictionaries so they can be
+stored in the job table and rendered by the Bulk Generation page.
+"""
+
+import threading
+import time
+from typing import Any
+
+# Counter for each BULK_STATUS_* value of scripts.Elevenlabs_functions
+_STATUS_COUNTERS = {
+    "ok": "rows_done",
+    "failed": "rows_failed",
+    "skipped": "rows_skipped",
+    "cancelled": "rows_cancelled",
+}
+
+
+class BulkProgress:
+    """Thread-safe counters for one bulk run.
+
+    Throughput only counts rows generated in this run, so rows skipped on
+    resume do not make the estimate look better than it is.
+
+    Attributes:
+        total (int): Number of rows in the run.
+    """
+
+    def __init__(self, total: int):
+        """Start tracking a run.
+
+        Args:
+            total (int): Number of rows in the run.
+        """
+        self.total = total
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._counts = {name: 0 for name in _STATUS_COUNTERS.values()}
+        self._bytes_written = 0
+
+    def add(self, result: dict[str, Any]) -> None:
+        """Count a finished row.
+
+        Args:
+            result (Dict[str, Any]): Row result with ``status`` and ``bytes``.
+        """
+        counter = _STATUS_COUNTERS.get(result["status"])
+        if counter is None:
+            return
+        with self._lock:
+            self._counts[counter] += 1
+            if counter == "rows_done":
+                self._bytes_written += int(result.get("bytes") or 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get the current progress.
+
+        Returns:
+            Dict[str, Any]: Dictionary with:
+            - total: Rows in the run
+            - rows_done, rows_failed, rows_skipped, rows_cancelled: Row counts
+            - rows_processed: Rows with any outcome so far
+            - bytes_written: Audio bytes written in this run
+            - elapsed: Seconds since the run started
+            - rows_per_second: Rows generated or failed per second
+            - eta_seconds: Estimated seconds left, or None before the first row
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            bytes_written = self._bytes_written
+        elapsed = time.monotonic() - self._started
+        processed = sum(counts.values())
+        attempted = counts["rows_done"] + counts["rows_failed"]
+        rate = attempted / elapsed if elapsed > 0 else 0.0
+        remaining = max(self.total - processed, 0)
+        eta = remaining / rate if rate > 0 else (0.0 if not remaining else None)
+        return {
+            "total": self.total,
+            **counts,
+            "rows_processed": processed,
+            "bytes_written": bytes_written,
+            "elapsed": elapsed,
+            "rows_per_second": rate,
+            "eta_seconds": eta,
+        }
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as ``m:ss`` or ``h:mm:ss``.
+
+    Args:
+        seconds (float): Duration in seconds.
+
+    Returns:
+        str: Formatted duration.
+    """
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+def format_bulk_progress(snapshot: dict[str, Any]) -> str:
+    """Describe a progress snapshot in one line.
+
+    Args:
+        snapshot (Dict[str, Any]): Snapshot from :meth:`BulkProgress.snapshot`.
+
+    Returns:
+        str: e.g. "12 of 40 rows, 1 failed, 2.5 rows/s, 1.2 MB written, ETA 0:11".
+    """
+    parts = [f"{snapshot['rows_processed']} of {snapshot['total']} rows"]
+    if snapshot.get("rows_failed"):
+        parts.append(f"{snapshot['rows_failed']} failed")
+    if snapshot.get("rows_skipped"):
+        parts.append(f"{snapshot['rows_skipped']} already done")
+    if snapshot.get("rows_per_second"):
+        parts.append(f"{snapshot['rows_per_second']:.1f} rows/s")
+    parts.append(f"{snapshot.get('bytes_written', 0) / (1024 * 1024):.1f} MB written")
+    if snapshot.get("eta_seconds") is not None and (
+        snapshot["rows_processed"] < snapshot["total"]
+    ):
+        parts.append(f"ETA {format_duration(snapshot['eta_seconds'])}")
+    return ", ".join(parts)
@@ -4,37 +4,92 @@ This module provides caching functionality with TTL (Time To Live) support for t
 """
 
 import functools
+import hashlib
 import json
+import logging
 import os
+import shutil
+import sys
+import threading
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import timedelta
 from typing import Any
 
 import streamlit as st
 
+from utils.atomic_files import atomic_write_json
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.json"
+INDEX_LOCK_FILENAME = "index.lock"
+
+# In-process tier limits for the cached decorator
+DEFAULT_MEMORY_MAX_ENTRIES = 256
+DEFAULT_MEMORY_MAX_BYTES = 16 * 1024 * 1024  # 16MB
+
+# Serializes read-modify-write of the index between Cache instances in a
+# process; the index lock file serializes it between processes
+_index_lock = threading.Lock()
+
+# Stats callables of every function decorated with cached(), by qualified name
+_cache_registry: dict[str, Callable[[], dict[str, Any]]] = {}
+
 
 class Cache:
     """Simple cache implementation with TTL support.
 
     This class provides a file-based caching system with automatic expiration of cached items.
-    Cache files are stored in a .cache directory relative to this module.
+    Cache files are stored in a .cache directory relative to this module, under a
+    stable SHA-256 digest of the key and sharded into subdirectories by the first
+    two hex characters, so entries are shared across restarts and worker processes.
+    A persistent index of write timestamps lets expired entries be found without
+    opening every cache file.
 
     Attributes:
         ttl (int): Time to live in seconds for cached items.
         cache_dir (str): Directory path where cache files are stored.
+        index_path (str): Path of the JSON index mapping digests to timestamps.
+            Updates to it hold a lock on ``index.lock`` beside it, so worker
+            processes sharing the directory do not overwrite each other's
+            entries.
     """
 
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(self, ttl_seconds: int = 3600, cache_dir: str | None = None):
         """Initialize cache with TTL.
 
         Args:
             ttl_seconds (int): Time to live in seconds (default: 1 hour).
+            cache_dir (Optional[str]): Cache directory (default: .cache next to the project root).
         """
         self.ttl = ttl_seconds
-        self.cache_dir = os.path.join(os.path.dirname(__file__), "..", ".cache")
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.dirname(__file__), "..", ".cache"
+        )
+        self.index_path = os.path.join(self.cache_dir, INDEX_FILENAME)
         os.makedirs(self.cache_dir, exist_ok=True)
 
+    @staticmethod
+    def _digest(key: str) -> str:
+        """Get the stable digest for a cache key.
+
+        Args:
+            key (str): Cache key to digest.
+
+        Returns:
+            str: Hex SHA-256 digest of the key.
+        """
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
     def _get_cache_path(self, key: str) -> str:
         """Get the file path for a cache key.
 
@@ -44,8 +99,95 @@ class Cache:
         Returns:
             str: Absolute path to the cache file for the given key.
         """
-        # Use a hash of the key to avoid file system issues
-        return os.path.join(self.cache_dir, f"{hash(key)}.json")
+        return self._get_digest_path(self._digest(key))
+
+    def _get_digest_path(self, digest: str) -> str:
+        """Get the sharded file path for a key digest.
+
+        Args:
+            digest (str): Hex digest of a cache key.
+
+        Returns:
+            str: Path to the cache file, e.g. ``.cache/ab/abcdef....json``.
+        """
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.json")
+
+    @contextmanager
+    def _locked_index(self) -> Iterator[None]:
+        """Hold the index lock across threads and processes.
+
+        Yields:
+            None: While the lock is held.
+        """
+        lock_path = os.path.join(self.cache_dir, INDEX_LOCK_FILENAME)
+        with _index_lock, open(lock_path, "a+b") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _load_index(self) -> dict[str, dict[str, float]]:
+        """Load the timestamp index, rebuilding it if missing or corrupted.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Mapping of digest to its ``timestamp``
+            and ``ttl``.
+        """
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+            if isinstance(index, dict):
+                return index
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.warning("Cache index is unreadable, rebuilding it")
+        return self._rebuild_index()
+
+    def _rebuild_index(self) -> dict[str, dict[str, float]]:
+        """Rebuild the index by scanning the shard directories.
+
+        Unreadable entries are removed while scanning.
+
+        Returns:
+            Dict[str, Dict[str, float]]: The rebuilt index.
+        """
+        index: dict[str, dict[str, float]] = {}
+        for shard in os.listdir(self.cache_dir):
+            shard_dir = os.path.join(self.cache_dir, shard)
+            if len(shard) != 2 or not os.path.isdir(shard_dir):
+                continue
+            for file in os.listdir(shard_dir):
+                if not file.endswith(".json"):
+                    continue
+                cache_path = os.path.join(shard_dir, file)
+                try:
+                    with open(cache_path) as f:
+                        data = json.load(f)
+                    index[file[: -len(".json")]] = {
+                        "timestamp": data["timestamp"],
+                        "ttl": data.get("ttl", self.ttl),
+                    }
+                except Exception:
+                    _remove_quietly(cache_path)
+        return index
+
+    def _save_index(self, index: dict[str, dict[str, float]]) -> None:
+        """Atomically write the timestamp index.
+
+        Args:
+            index (Dict[str, Dict[str, float]]): Index to persist.
+        """
+        atomic_write_json(self.index_path, index)
 
     def get(self, key: str) -> Any | None:
         """Get value from cache if not expired.
@@ -56,6 +198,19 @@ class Cache:
         Returns:
             Optional[Any]: The cached value if found and not expired, None otherwise.
         """
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> tuple[Any, float] | None:
+        """Get value and write timestamp from cache if not expired.
+
+        Args:
+            key (str): Cache key to retrieve.
+
+        Returns:
+            Optional[Tuple[Any, float]]: (value, timestamp) if found and not
+            expired, None otherwise.
+        """
         cache_path = self._get_cache_path(key)
         if not os.path.exists(cache_path):
             return None
@@ -69,32 +224,51 @@ class Cache:
                 os.remove(cache_path)
                 return None
 
-            return data["value"]
+            return data["value"], data["timestamp"]
         except Exception:
             return None
 
     def set(self, key: str, value: Any) -> None:
         """Set value in cache with current timestamp.
 
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partly written entry.
+
         Args:
             key (str): Cache key to set.
             value (Any): Value to cache.
         """
-        cache_path = self._get_cache_path(key)
-        data = {"timestamp": time.time(), "value": value}
+        digest = self._digest(key)
+        cache_path = self._get_digest_path(digest)
+        timestamp = time.time()
+        data = {"timestamp": timestamp, "ttl": self.ttl, "value": value}
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        atomic_write_json(cache_path, data)
 
-        with open(cache_path, "w") as f:
-            json.dump(data, f)
+        with self._locked_index():
+            index = self._load_index()
+            index[digest] = {"timestamp": timestamp, "ttl": self.ttl}
+            self._save_index(index)
 
     def clear(self) -> None:
         """Clear all cached data."""
-        for file in os.listdir(self.cache_dir):
-            if file.endswith(".json"):
-                os.remove(os.path.join(self.cache_dir, file))
+        with self._locked_index():
+            for entry in os.listdir(self.cache_dir):
+                entry_path = os.path.join(self.cache_dir, entry)
+                if len(entry) == 2 and os.path.isdir(entry_path):
+                    shutil.rmtree(entry_path, ignore_errors=True)
+                elif entry.endswith(".json"):
+                    _remove_quietly(entry_path)
 
     def cleanup_expired(self) -> int:
         """Remove expired cache files.
 
+        Expired entries are found from the index, so only the files being
+        removed are touched. Each entry expires according to the TTL it was
+        written with. Legacy top-level files from the old unstable key scheme
+        are removed as well.
+
         Returns:
             Number of expired files removed
         """
@@ -103,38 +277,198 @@ class Cache:
             return 0
 
         try:
-            for file in os.listdir(self.cache_dir):
-                if file.endswith(".json"):
-                    cache_path = os.path.join(self.cache_dir, file)
-                    try:
-                        with open(cache_path) as f:
-                            data = json.load(f)
-
-                        # Check if expired
-                        if time.time() - data["timestamp"] > self.ttl:
-                            os.remove(cache_path)
-                            removed_count += 1
-                    except Exception:
-                        # If file is corrupted or unreadable, remove it
-                        try:
-                            os.remove(cache_path)
+            with self._locked_index():
+                # Files named after the old per-process hash() keys are orphans
+                for file in os.listdir(self.cache_dir):
+                    if file.endswith(".json") and file != INDEX_FILENAME:
+                        if _remove_quietly(os.path.join(self.cache_dir, file)):
                             removed_count += 1
-                        except Exception:
-                            pass  # Ignore errors during cleanup
+
+                index = self._load_index()
+                now = time.time()
+                expired = [
+                    digest
+                    for digest, entry in index.items()
+                    if now - entry["timestamp"] > entry.get("ttl", self.ttl)
+                ]
+                for digest in expired:
+                    if _remove_quietly(self._get_digest_path(digest)):
+                        removed_count += 1
+                    del index[digest]
+                self._save_index(index)
         except Exception:
             pass  # Ignore errors during cleanup
 
         return removed_count
 
 
-def cached(ttl_seconds: int = 3600) -> Callable:
+def _remove_quietly(path: str) -> bool:
+    """Remove a file, ignoring errors.
+
+    Args:
+        path (str): File to remove.
+
+    Returns:
+        bool: True if the file was removed.
+    """
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+class MemoryCache:
+    """In-process LRU cache with TTL and size limits.
+
+    Used as the first tier in front of the disk :class:`Cache`. Values are kept
+    as the original Python objects, so hits cost a dictionary lookup rather than
+    a file read and JSON parse. Entries are evicted least recently used first
+    once either ``max_entries`` or ``max_bytes`` is exceeded.
+
+    Attributes:
+        ttl (int): Time to live in seconds for cached items.
+        max_entries (int): Maximum number of entries kept in memory.
+        max_bytes (int): Maximum approximate size of all entries in bytes.
+        evictions (int): Number of entries evicted to respect the limits.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        max_entries: int = DEFAULT_MEMORY_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MEMORY_MAX_BYTES,
+    ):
+        """Initialize the memory cache.
+
+        Args:
+            ttl_seconds (int): Time to live in seconds (default: 1 hour).
+            max_entries (int): Maximum number of entries (default: 256).
+            max_bytes (int): Maximum approximate total size in bytes (default: 16MB).
+        """
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """Get value from memory if present and not expired.
+
+        Args:
+            key (str): Cache key to retrieve.
+
+        Returns:
+            Optional[Any]: The cached value, or None on a miss.
+        """
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> tuple[Any, float] | None:
+        """Get value and timestamp from memory if present and not expired.
+
+        Args:
+            key (str): Cache key to retrieve.
+
+        Returns:
+            Optional[Tuple[Any, float]]: (value, timestamp), or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, timestamp, size = entry
+            if time.time() - timestamp > self.ttl:
+                del self._entries[key]
+                self._size -= size
+                return None
+            self._entries.move_to_end(key)
+            return value, timestamp
+
+    def set(
+        self, key: str, value: Any, size: int, timestamp: float | None = None
+    ) -> None:
+        """Store a value, evicting least recently used entries if needed.
+
+        Args:
+            key (str): Cache key to set.
+            value (Any): Value to cache.
+            size (int): Approximate size of the value in bytes.
+            timestamp (Optional[float]): When the value was produced (default: now).
+        """
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[2]
+            self._entries[key] = (
+                value,
+                timestamp if timestamp is not None else time.time(),
+                size,
+            )
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries from memory."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the size of a cacheable value from its JSON encoding.
+
+    Args:
+        value (Any): JSON-serializable value.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+    try:
+        return len(json.dumps(value))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+def cached(
+    ttl_seconds: int = 3600,
+    max_entries: int = DEFAULT_MEMORY_MAX_ENTRIES,
+    max_bytes: int = DEFAULT_MEMORY_MAX_BYTES,
+    stale_while_revalidate: bool = False,
+    max_stale_seconds: int | None = None,
+) -> Callable:
     """Decorator for caching function results.
 
     This decorator provides a simple way to cache function results with a TTL.
     The cache key is generated from the function name and its arguments.
+    Lookups go to an in-process LRU first and fall back to the disk cache,
+    which survives restarts; disk hits are promoted into memory.
+
+    With ``stale_while_revalidate``, an entry older than ``ttl_seconds`` is
+    still returned immediately while a background thread reloads it. Entries
+    older than ``ttl_seconds + max_stale_seconds`` are never served and the
+    caller waits for a fresh load instead.
+
+    The decorated function gains ``cache_stats()`` returning its hit, miss,
+    stale hit, eviction and load-time counters, and ``cache_clear()`` to drop
+    its in-memory entries.
 
     Args:
         ttl_seconds (int): Cache TTL in seconds (default: 1 hour).
+        max_entries (int): Maximum entries in the memory tier (default: 256).
+        max_bytes (int): Maximum approximate size of the memory tier in bytes
+            (default: 16MB).
+        stale_while_revalidate (bool): Serve expired entries while refreshing
+            them in the background (default: False).
+        max_stale_seconds (Optional[int]): How long past ``ttl_seconds`` an
+            entry may still be served (default: ``ttl_seconds``).
 
     Returns:
         Callable: A decorator function that adds caching to the decorated function.
@@ -145,48 +479,292 @@ def cached(ttl_seconds: int = 3600) -> Callable:
             # Function implementation
             return result
     """
-    cache = Cache(ttl_seconds)
+    retention = ttl_seconds
+    if stale_while_revalidate:
+        retention += max_stale_seconds if max_stale_seconds is not None else ttl_seconds
+    cache = Cache(retention)
 
     def decorator(func: Callable) -> Callable:
+        memory = MemoryCache(retention, max_entries, max_bytes)
+        revalidator = _Revalidator(func.__qualname__)
+        stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "load_time": 0.0,
+        }
+        stats_lock = threading.Lock()
+
+        def record(counter: str, amount: float = 1) -> None:
+            with stats_lock:
+                stats[counter] += amount
+
+        def load(key: str, args: tuple, kwargs: dict) -> Any:
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            record("load_time", time.perf_counter() - started)
+            cache.set(key, result)
+            memory.set(key, result, _estimate_size(result))
+            return result
+
+        def serve(key: str, entry: tuple[Any, float], args: tuple, kwargs: dict):
+            value, timestamp = entry
+            if time.time() - timestamp > ttl_seconds:
+                record("stale_hits")
+                revalidator.refresh(key, lambda: load(key, args, kwargs))
+            return value
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             # Create cache key from function name and arguments
             key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
 
-            # Try to get from cache
-            result = cache.get(key)
-            if result is not None:
-                return result
+            # Try the memory tier, then the disk tier
+            entry = memory.get_entry(key)
+            if entry is not None:
+                record("memory_hits")
+                return serve(key, entry, args, kwargs)
 
-            # Call function and cache result
-            result = func(*args, **kwargs)
-            cache.set(key, result)
-            return result
+            entry = cache.get_entry(key)
+            if entry is not None:
+                record("disk_hits")
+                value, timestamp = entry
+                memory.set(key, value, _estimate_size(value), timestamp=timestamp)
+                return serve(key, entry, args, kwargs)
 
+            # Call function and cache result
+            record("misses")
+            return load(key, args, kwargs)
+
+        def cache_stats() -> dict[str, Any]:
+            with stats_lock:
+                snapshot = dict(stats)
+            snapshot["hits"] = snapshot["memory_hits"] + snapshot["disk_hits"]
+            snapshot["evictions"] = memory.evictions
+            return snapshot
+
+        wrapper.cache_stats = cache_stats  # type: ignore[attr-defined]
+        wrapper.cache_clear = memory.clear  # type: ignore[attr-defined]
+        _cache_registry[func.__qualname__] = cache_stats
         return wrapper
 
     return decorator
 
 
-def st_cache(ttl_minutes: int = 60) -> Callable:
+def get_cache_stats() -> dict[str, dict[str, Any]]:
+    """Get statistics for every function decorated with :func:`cached`.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Mapping of function name to its counters:
+        hits, memory_hits, disk_hits, misses, evictions and load_time (total
+        seconds spent computing values on misses).
+    """
+    return {name: stats() for name, stats in _cache_registry.items()}
+
+
+class _InFlightCall:
+    """A call in progress that concurrent callers can wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight wait and receive the same result, or the same exception. Nothing
+    is remembered once the call finishes, so a failure is never cached and the
+    next call after it runs the function again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[str, _InFlightCall] = {}
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """Run ``func`` unless a call with the same key is already in flight.
+
+        Args:
+            key (str): Key identifying equivalent calls.
+            func (Callable[[], Any]): Zero-argument callable to execute.
+
+        Returns:
+            Any: The result of the (possibly shared) call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _InFlightCall()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+def single_flight(func: Callable) -> Callable:
+    """Decorator that coalesces concurrent identical calls to ``func``.
+
+    Concurrent callers with the same arguments share one in-flight execution,
+    which stops a burst of sessions from all hitting an upstream API at once
+    after a cache expiry. Place it below a caching decorator so only cache
+    misses are coalesced.
+
+    Args:
+        func (Callable): Function to wrap.
+
+    Returns:
+        Callable: The wrapped function.
+
+    Example:
+        @st_cache(ttl_minutes=60)
+        @single_flight
+        def fetch_models(api_key):
+            ...
+    """
+    flight = SingleFlight()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> Any:
+        key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
+        return flight.do(key, lambda: func(*args, **kwargs))
+
+    return wrapper
+
+
+class _Revalidator:
+    """Reload stale cache entries on background threads.
+
+    At most one refresh per key runs at a time; requests for a key that is
+    already being refreshed are ignored. A failed refresh is logged and the
+    stale value stays in place until it passes its hard staleness bound.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize with no refreshes pending.
+
+        Args:
+            name (str): Name of the cached function, used in log messages.
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._pending: set[str] = set()
+
+    def refresh(self, key: str, load: Callable[[], Any]) -> bool:
+        """Start a background reload of ``key`` unless one is already running.
+
+        Args:
+            key (str): Cache key being refreshed.
+            load (Callable[[], Any]): Callable that reloads and stores the value.
+
+        Returns:
+            bool: True if a new refresh was started.
+        """
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+
+        def run() -> None:
+            try:
+                load()
+            except Exception as e:
+                logger.warning(
+                    "Background refresh of %s failed, serving stale value: %s",
+                    self.name,
+                    e,
+                )
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+
+        threading.Thread(
+            target=run, name=f"revalidate-{self.name}", daemon=True
+        ).start()
+        return True
+
+
+def st_cache(
+    ttl_minutes: int = 60,
+    stale_while_revalidate: bool = False,
+    max_stale_minutes: int | None = None,
+) -> Callable:
     """Streamlit-specific caching decorator with TTL.
 
     This combines Streamlit's caching with our TTL functionality.
 
+    ``st.cache_data`` can only drop expired entries, so with
+    ``stale_while_revalidate`` results are kept in an in-process store
+    instead: an expired entry is returned at once while it is reloaded in the
+    background, up to ``max_stale_minutes`` past the TTL. Nothing is written
+    to disk, since arguments may include API keys. Call ``clear()`` on the
+    decorated function to drop its entries either way.
+
     Args:
         ttl_minutes: Cache TTL in minutes (default: 60 minutes)
+        stale_while_revalidate: Serve expired results while refreshing them
+            in the background (default: False)
+        max_stale_minutes: How long past the TTL a result may still be served
+            (default: ``ttl_minutes``)
 
     Returns:
         Decorated function
     """
 
     def decorator(func: Callable) -> Callable:
-        # Use Streamlit's cache
-        @st.cache_data(ttl=timedelta(minutes=ttl_minutes))
+        if not stale_while_revalidate:
+            # Use Streamlit's cache
+            @st.cache_data(ttl=timedelta(minutes=ttl_minutes))
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs) -> Any:
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        ttl_seconds = ttl_minutes * 60
+        max_stale = max_stale_minutes if max_stale_minutes is not None else ttl_minutes
+        store = MemoryCache(ttl_seconds + max_stale * 60)
+        revalidator = _Revalidator(func.__qualname__)
+
         @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
-            return func(*args, **kwargs)
+        def swr_wrapper(*args, **kwargs) -> Any:
+            key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
 
-        return wrapper
+            def load() -> Any:
+                result = func(*args, **kwargs)
+                store.set(key, result, _estimate_size(result))
+                return result
+
+            entry = store.get_entry(key)
+            if entry is None:
+                return load()
+            value, timestamp = entry
+            if time.time() - timestamp > ttl_seconds:
+                revalidator.refresh(key, load)
+            return value
+
+        swr_wrapper.clear = store.clear  # type: ignore[attr-defined]
+        return swr_wrapper
 
     return decorator
@@ -11,6 +11,8 @@ try:
 except ImportError:
     requests = None
 
+from utils import http_client
+
 
 class ElevenToolsError(Exception):
     """Base exception for ElevenTools."""
@@ -32,6 +34,26 @@ class APIError(ElevenToolsError):
     pass
 
 
+class TransientAPIError(APIError):
+    """Exception for API responses worth retrying later (HTTP 429 and 5xx).
+
+    Attributes:
+        status_code: HTTP status code of the response, if any
+        retry_after: Seconds the server asked us to wait, if it said
+    """
+
+    def __init__(
+        self,
+        message: str,
+        details: str | None = None,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ):
+        super().__init__(message, details)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
 class ValidationError(ElevenToolsError):
     """Exception for input validation errors."""
 
@@ -126,7 +148,7 @@ def test_api_key_actual(api_key: str, service_name: str) -> tuple[bool, str | No
             # Test by fetching models (lightweight endpoint)
             url = "https://api.elevenlabs.io/v1/models"
             headers = {"xi-api-key": api_key}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_client.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             return True, None
         elif service_name == "OpenRouter":
@@ -136,7 +158,7 @@ def test_api_key_actual(api_key: str, service_name: str) -> tuple[bool, str | No
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
             }
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_client.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             return True, None
         else:
@@ -183,7 +205,7 @@ class ProgressManager:
             step: Current step (0-100)
             message: Status message to display
         """
-        progress = min(step / self.total_steps, 1.0)
+        progress = min(step / self.total_steps, 1.0) if self.total_steps else 1.0
         self.progress_bar.progress(progress)
         self.status_text.text(f"{message} ({progress:.0%})")
 
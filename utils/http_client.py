@@ -0,0 +1,204 @@
+"""Shared HTTP client for ElevenTools.
+
+This module provides a process-wide ``requests.Session`` with per-host
+connection pools and keep-alive, used by every ElevenLabs and OpenRouter API
+call so repeated requests reuse TCP/TLS connections instead of opening a new
+one each time. Pool hit/miss counters are tracked per host.
+"""
+
+import threading
+from typing import Any
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+except ImportError:
+    requests = None
+
+# Pool defaults
+DEFAULT_POOL_CONNECTIONS = 10  # Number of hosts kept in the pool manager
+DEFAULT_POOL_MAXSIZE = 20  # Connections kept alive per host
+DEFAULT_TIMEOUT = 30  # Seconds, used when a call does not pass its own timeout
+
+_lock = threading.Lock()
+_session: "requests.Session | None" = None
+_pool_config: dict[str, Any] = {
+    "pool_connections": DEFAULT_POOL_CONNECTIONS,
+    "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+    "timeout": DEFAULT_TIMEOUT,
+}
+_pool_stats: dict[str, dict[str, int]] = {}
+
+
+def _record(host: str, counter: str) -> None:
+    """Increment a pool counter for a host.
+
+    Args:
+        host (str): Host name the counter belongs to.
+        counter (str): Either "requests" or "misses".
+    """
+    with _lock:
+        stats = _pool_stats.setdefault(host, {"requests": 0, "misses": 0})
+        stats[counter] += 1
+
+
+if requests is not None:
+
+    class _CountingHTTPConnectionPool(HTTPConnectionPool):
+        """HTTP connection pool that counts connection reuse."""
+
+        def _get_conn(self, timeout=None):
+            _record(self.host, "requests")
+            return super()._get_conn(timeout=timeout)
+
+        def _new_conn(self):
+            _record(self.host, "misses")
+            return super()._new_conn()
+
+    class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+        """HTTPS connection pool that counts connection reuse."""
+
+        def _get_conn(self, timeout=None):
+            _record(self.host, "requests")
+            return super()._get_conn(timeout=timeout)
+
+        def _new_conn(self):
+            _record(self.host, "misses")
+            return super()._new_conn()
+
+    class _PooledAdapter(HTTPAdapter):
+        """HTTP adapter whose pool manager uses the counting pool classes."""
+
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": _CountingHTTPConnectionPool,
+                "https": _CountingHTTPSConnectionPool,
+            }
+
+
+def _build_session() -> "requests.Session":
+    """Create a session with pooled adapters mounted for HTTP and HTTPS.
+
+    Returns:
+        requests.Session: A new session using the current pool configuration.
+    """
+    session = requests.Session()
+    adapter = _PooledAdapter(
+        pool_connections=_pool_config["pool_connections"],
+        pool_maxsize=_pool_config["pool_maxsize"],
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> "requests.Session":
+    """Get the shared session, creating it on first use.
+
+    Returns:
+        requests.Session: Process-wide session with keep-alive connection pools.
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def configure_pool(
+    pool_connections: int | None = None,
+    pool_maxsize: int | None = None,
+    timeout: float | None = None,
+) -> None:
+    """Update pool sizes and the default timeout.
+
+    The shared session is rebuilt lazily on the next request so new pool sizes
+    take effect; existing keep-alive connections are closed.
+
+    Args:
+        pool_connections (Optional[int]): Number of hosts to keep pools for.
+        pool_maxsize (Optional[int]): Maximum connections kept alive per host.
+        timeout (Optional[float]): Default request timeout in seconds.
+    """
+    global _session
+    with _lock:
+        if pool_connections is not None:
+            _pool_config["pool_connections"] = pool_connections
+        if pool_maxsize is not None:
+            _pool_config["pool_maxsize"] = pool_maxsize
+        if timeout is not None:
+            _pool_config["timeout"] = timeout
+        old_session, _session = _session, None
+    if old_session is not None:
+        old_session.close()
+
+
+def request(method: str, url: str, **kwargs: Any) -> "requests.Response":
+    """Send a request through the shared session.
+
+    Args:
+        method (str): HTTP method, e.g. "GET" or "POST".
+        url (str): Request URL.
+        **kwargs: Passed through to ``requests.Session.request``. ``timeout``
+            defaults to the configured pool timeout.
+
+    Returns:
+        requests.Response: The response object.
+    """
+    kwargs.setdefault("timeout", _pool_config["timeout"])
+    return get_session().request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs: Any) -> "requests.Response":
+    """Send a GET request through the shared session.
+
+    Args:
+        url (str): Request URL.
+        **kwargs: Passed through to :func:`request`.
+
+    Returns:
+        requests.Response: The response object.
+    """
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> "requests.Response":
+    """Send a POST request through the shared session.
+
+    Args:
+        url (str): Request URL.
+        **kwargs: Passed through to :func:`request`.
+
+    Returns:
+        requests.Response: The response object.
+    """
+    return request("POST", url, **kwargs)
+
+
+def get_pool_stats() -> dict[str, dict[str, int]]:
+    """Get connection pool hit/miss counters per host.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Mapping of host to a dict with:
+        - requests: Connections checked out of the pool
+        - misses: New connections that had to be opened
+        - hits: Requests served by an already open connection
+    """
+    with _lock:
+        return {
+            host: {
+                "requests": stats["requests"],
+                "misses": stats["misses"],
+                "hits": max(stats["requests"] - stats["misses"], 0),
+            }
+            for host, stats in _pool_stats.items()
+        }
+
+
+def reset_pool_stats() -> None:
+    """Reset all connection pool counters."""
+    with _lock:
+        _pool_stats.clear()
@@ -0,0 +1,443 @@
+"""Background job queue for long-running ElevenTools work.
+
+Bulk generation can take many minutes, longer than a Streamlit script run
+should block. This module runs such work on a process-wide thread pool shared
+by every browser session, so only a bounded number of jobs run at once on a
+server, and records each job in a small SQLite table. Pages submit a job and
+then poll the table, so a job keeps running across reruns and users can leave
+a page and come back to its progress and result.
+
+Each job gets an unguessable ``token`` besides its ID. Pages put the token,
+never the session ID, in the page URL, so a refreshed page can follow that
+one job without being able to reach the rest of the session's files.
+
+Several server processes may share the table. Each queue records itself as
+the owner of the jobs it runs and refreshes their heartbeat while they are
+active; jobs whose heartbeat has stopped, because their server process is
+gone, are marked ``interrupted`` by the next queue that notices. Bulk jobs
+can then be resumed from their checkpoint manifest.
+"""
+
+import json
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+JOB_DB_PATH = os.path.join(os.path.dirname(__file__), "..", ".cache", "jobs.db")
+MAX_CONCURRENT_JOBS = 2  # Jobs running at once across all sessions
+PROGRESS_INTERVAL = 1.0  # Seconds between progress writes to the job table
+JOB_HISTORY_LIMIT = 20  # Jobs listed per session
+HEARTBEAT_INTERVAL = 10.0  # Seconds between heartbeats of a queue's active jobs
+HEARTBEAT_TIMEOUT = 60.0  # Active jobs without a heartbeat this long are reclaimed
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+JOB_INTERRUPTED = "interrupted"
+ACTIVE_JOB_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    label TEXT NOT NULL,
+    job_key TEXT,
+    status TEXT NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    details TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    token TEXT,
+    owner TEXT,
+    heartbeat_at REAL
+)
+"""
+
+# Columns added after the first release, for tables created without them
+_ADDED_COLUMNS = (
+    ("details", "TEXT"),
+    ("token", "TEXT"),
+    ("owner", "TEXT"),
+    ("heartbeat_at", "REAL"),
+)
+
+ProgressCallback = Callable[[int, dict[str, Any] | None], None]
+JobFunction = Callable[[ProgressCallback], tuple[bool, str]]
+
+
+def _job_from_row(row: sqlite3.Row | None) -> dict[str, Any] | None:
+    """Convert a job table row to a dict with decoded progress details.
+
+    Args:
+        row (Optional[sqlite3.Row]): Row from the jobs table.
+
+    Returns:
+        Optional[Dict[str, Any]]: The job's columns, or None for no row.
+    """
+    if row is None:
+        return None
+    job = dict(row)
+    job["details"] = json.loads(job["details"]) if job["details"] else None
+    return job
+
+
+def _find_active(conn: sqlite3.Connection, job_key: str) -> dict[str, Any] | None:
+    """Get the newest queued or running job for a key on a connection.
+
+    Args:
+        conn (sqlite3.Connection): Open connection to the job table.
+        job_key (str): Key passed to :meth:`JobQueue.submit`.
+
+    Returns:
+        Optional[Dict[str, Any]]: The active job, or None.
+    """
+    row = conn.execute(
+        "SELECT * FROM jobs WHERE job_key = ? AND status IN (?, ?) "
+        "ORDER BY created_at DESC LIMIT 1",
+        (job_key, *ACTIVE_JOB_STATUSES),
+    ).fetchone()
+    return _job_from_row(row)
+
+
+def _reclaim_stale_jobs(conn: sqlite3.Connection) -> None:
+    """Mark active jobs whose owner stopped sending heartbeats as interrupted.
+
+    Jobs from before owners were recorded have no heartbeat and are reclaimed
+    too.
+
+    Args:
+        conn (sqlite3.Connection): Open connection to the job table.
+    """
+    now = time.time()
+    interrupted = conn.execute(
+        "UPDATE jobs SET status = ?, finished_at = ?, "
+        "message = 'The server stopped before the job finished.' "
+        "WHERE status IN (?, ?) AND (heartbeat_at IS NULL OR heartbeat_at < ?)",
+        (JOB_INTERRUPTED, now, *ACTIVE_JOB_STATUSES, now - HEARTBEAT_TIMEOUT),
+    ).rowcount
+    if interrupted:
+        logger.info("Marked %s abandoned jobs as interrupted", interrupted)
+
+
+class JobQueue:
+    """Bounded thread pool with a persistent job table.
+
+    A job is a callable taking a ``progress(done, details=None)`` callback and
+    returning ``(success, message)``, like
+    :func:`scripts.Elevenlabs_functions.bulk_generate_audio`. ``details`` is
+    any JSON-serializable progress information the page wants to show.
+
+    Attributes:
+        db_path (str): Path of the SQLite job table.
+        max_workers (int): Jobs allowed to run at once.
+        owner (str): ID recorded on the jobs this queue runs.
+    """
+
+    def __init__(
+        self, db_path: str | None = None, max_workers: int = MAX_CONCURRENT_JOBS
+    ):
+        """Open the job table and reclaim jobs whose server has stopped.
+
+        Args:
+            db_path (Optional[str]): Job table path (default: .cache/jobs.db).
+            max_workers (int): Jobs allowed to run at once (default: 2).
+        """
+        self.db_path = db_path or JOB_DB_PATH
+        self.max_workers = max(int(max_workers), 1)
+        self.owner = uuid.uuid4().hex
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="eleventools-job"
+        )
+        with self._connect() as conn:
+            conn.execute(_SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for name, column_type in _ADDED_COLUMNS:
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {column_type}")
+            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS jobs_token ON jobs (token)")
+            _reclaim_stale_jobs(conn)
+        self._stopped = threading.Event()
+        threading.Thread(
+            target=self._heartbeat, name="eleventools-job-heartbeat", daemon=True
+        ).start()
+
+    @contextmanager
+    def _connect(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Open a connection to the job table for one transaction.
+
+        Args:
+            immediate (bool): Take the database write lock when the transaction
+                starts, so reads in it cannot be raced by other threads or
+                processes writing the table (default: False).
+
+        Yields:
+            sqlite3.Connection: Connection returning rows as ``sqlite3.Row``;
+            committed and closed when the block exits.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                if immediate:
+                    conn.execute("BEGIN IMMEDIATE")
+                yield conn
+        finally:
+            conn.close()
+
+    def _heartbeat(self) -> None:
+        """Keep this queue's active jobs alive and reclaim abandoned ones.
+
+        Runs on a daemon thread until :meth:`shutdown`.
+        """
+        while not self._stopped.wait(HEARTBEAT_INTERVAL):
+            try:
+                with self._connect() as conn:
+                    conn.execute(
+                        "UPDATE jobs SET heartbeat_at = ? "
+                        "WHERE owner = ? AND status IN (?, ?)",
+                        (time.time(), self.owner, *ACTIVE_JOB_STATUSES),
+                    )
+                    _reclaim_stale_jobs(conn)
+            except sqlite3.Error as e:
+                logger.warning("Could not update the job heartbeat: %s", e)
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        """Write fields of a job row.
+
+        Args:
+            job_id (str): Job to update.
+            **fields: Column values to set.
+        """
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id)
+            )
+
+    def submit(
+        self,
+        session_id: str,
+        label: str,
+        func: JobFunction,
+        total: int = 0,
+        job_key: str | None = None,
+    ) -> str:
+        """Queue a job.
+
+        Args:
+            session_id (str): Session that owns the job.
+            label (str): Short description shown to the user.
+            func (JobFunction): Work to run; called with a
+                ``progress(done, details=None)`` callback and returning
+                ``(success, message)``.
+            total (int): Number of work items, for progress display (default: 0).
+            job_key (Optional[str]): Identifies the job's target, e.g. its output
+                directory. If a job with the same key is still active, its ID is
+                returned instead of queueing a duplicate.
+
+        Returns:
+            str: ID of the queued (or already active) job.
+        """
+        job_id = uuid.uuid4().hex
+        # Check and insert in one locked transaction, so two sessions (or
+        # server processes) submitting the same key cannot both queue it
+        with self._lock, self._connect(immediate=True) as conn:
+            if job_key is not None:
+                active = _find_active(conn, job_key)
+                if active is not None:
+                    return active["id"]
+            conn.execute(
+                "INSERT INTO jobs (id, session_id, label, job_key, status, total, "
+                "created_at, token, owner, heartbeat_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    session_id,
+                    label,
+                    job_key,
+                    JOB_QUEUED,
+                    total,
+                    time.time(),
+                    secrets.token_urlsafe(24),
+                    self.owner,
+                    time.time(),
+                ),
+            )
+        future = self._executor.submit(self._run, job_id, func)
+        with self._lock:
+            self._futures[job_id] = future
+        future.add_done_callback(lambda _: self._forget(job_id))
+        return job_id
+
+    def _forget(self, job_id: str) -> None:
+        """Drop the future of a finished job.
+
+        Args:
+            job_id (str): Finished job.
+        """
+        with self._lock:
+            self._futures.pop(job_id, None)
+
+    def _run(self, job_id: str, func: JobFunction) -> None:
+        """Run a job on a worker thread and record its outcome.
+
+        Args:
+            job_id (str): Job being run.
+            func (JobFunction): The job's work.
+        """
+        self._update(job_id, status=JOB_RUNNING, started_at=time.time())
+        last_write = 0.0
+        done = 0
+        latest_details = None
+
+        def progress(count: int, details: dict[str, Any] | None = None) -> None:
+            # Called for every row; only write to the table every interval
+            nonlocal last_write, done, latest_details
+            done = count
+            if details is not None:
+                latest_details = json.dumps(details)
+            now = time.monotonic()
+            if now - last_write >= PROGRESS_INTERVAL:
+                last_write = now
+                self._update(job_id, done=count, details=latest_details)
+
+        try:
+            success, message = func(progress)
+        except Exception as e:
+            logger.exception("Job %s failed", job_id)
+            success, message = False, str(e)
+        self._update(
+            job_id,
+            status=JOB_SUCCEEDED if success else JOB_FAILED,
+            done=done,
+            details=latest_details,
+            message=message,
+            finished_at=time.time(),
+        )
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet.
+
+        Args:
+            job_id (str): Job to cancel.
+
+        Returns:
+            bool: True if the job was cancelled, False if it is already running
+            or finished.
+        """
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is None or not future.cancel():
+            return False
+        self._update(job_id, status=JOB_CANCELLED, finished_at=time.time())
+        return True
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """Get a job row.
+
+        Args:
+            job_id (str): Job to look up.
+
+        Returns:
+            Optional[Dict[str, Any]]: The job's columns, with ``details``
+            decoded, or None if unknown.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _job_from_row(row)
+
+    def get_by_token(self, token: str) -> dict[str, Any] | None:
+        """Get a job row by its URL token.
+
+        Args:
+            token (str): The job's ``token`` column.
+
+        Returns:
+            Optional[Dict[str, Any]]: The job's columns, with ``details``
+            decoded, or None if no job has this token.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE token = ?", (token,)
+            ).fetchone()
+        return _job_from_row(row)
+
+    def find_active(self, job_key: str) -> dict[str, Any] | None:
+        """Get the queued or running job for a key, if any.
+
+        Args:
+            job_key (str): Key passed to :meth:`submit`.
+
+        Returns:
+            Optional[Dict[str, Any]]: The active job, or None.
+        """
+        with self._connect() as conn:
+            return _find_active(conn, job_key)
+
+    def list_jobs(
+        self, session_id: str, limit: int = JOB_HISTORY_LIMIT
+    ) -> list[dict[str, Any]]:
+        """List a session's jobs, newest first.
+
+        Args:
+            session_id (str): Session to list jobs for.
+            limit (int): Maximum number of jobs (default: 20).
+
+        Returns:
+            List[Dict[str, Any]]: Job rows.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE session_id = ? "
+                "ORDER BY created_at DESC LIMIT ?",
+                (session_id, limit),
+            ).fetchall()
+        return [_job_from_row(row) for row in rows]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and cancel queued ones.
+
+        Args:
+            wait (bool): Wait for running jobs to finish (default: True).
+        """
+        with self._lock:
+            pending = list(self._futures)
+        for job_id in pending:
+            self.cancel(job_id)
+        self._executor.shutdown(wait=wait)
+        self._stopped.set()
+
+
+_job_queue: JobQueue | None = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Get the shared job queue instance.
+
+    Returns:
+        JobQueue: Process-wide job queue used by every session.
+    """
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue()
+        return _job_queue
@@ -5,7 +5,6 @@ by different ElevenLabs models. Uses allow-list and pattern matching for
 flexible capability detection.
 """
 
-
 from utils.caching import st_cache
 
 # Allow-list of model IDs that explicitly support speed control
@@ -41,6 +40,30 @@ AUDIO_TAGS_SUPPORT_PATTERNS = [
     "_v3",  # v3 models support Audio Tags
 ]
 
+# Maximum characters per text-to-speech request
+# Based on the ElevenLabs models documentation
+MODEL_CHARACTER_LIMITS = {
+    "eleven_v3": 5000,
+    "eleven_multilingual_v2": 10000,
+    "eleven_flash_v2_5": 40000,
+    "eleven_turbo_v2_5": 40000,
+    "eleven_flash_v2": 30000,
+    "eleven_turbo_v2": 30000,
+    "eleven_monolingual_v1": 10000,
+    "eleven_multilingual_v1": 10000,
+}
+DEFAULT_CHARACTER_LIMIT = 5000  # Conservative limit for unknown models
+
+# Models that do not accept previous_text/next_text context for request
+# stitching (v3 models)
+REQUEST_STITCHING_UNSUPPORTED_PATTERNS = [
+    "_v3",
+]
+
+# Credits billed per character; Flash and Turbo models cost half a credit
+DISCOUNTED_CREDIT_PATTERNS = ["flash", "turbo"]
+DISCOUNTED_CREDITS_PER_CHARACTER = 0.5
+
 
 @st_cache(ttl_minutes=60)
 def supports_speed(model_id: str) -> bool:
@@ -155,3 +178,69 @@ def get_model_capabilities(model_id: str) -> dict[str, bool]:
         # "style": supports_style(model_id),
         # "advanced_settings": supports_advanced_settings(model_id),
     }
+
+
+def get_character_limit(model_id: str) -> int:
+    """Get the maximum number of characters a model accepts per request.
+
+    Args:
+        model_id (str): The model ID to check.
+
+    Returns:
+        int: Character limit, DEFAULT_CHARACTER_LIMIT for unknown models.
+
+    Examples:
+        >>> get_character_limit("eleven_multilingual_v2")
+        10000
+        >>> get_character_limit("eleven_flash_v2_5")
+        40000
+    """
+    return MODEL_CHARACTER_LIMITS.get(model_id, DEFAULT_CHARACTER_LIMIT)
+
+
+def get_credits_per_character(model_id: str) -> float:
+    """Get the credits a model bills per character of text.
+
+    Args:
+        model_id (str): The model ID to check.
+
+    Returns:
+        float: Credits per character (1.0, or 0.5 for Flash and Turbo models).
+
+    Examples:
+        >>> get_credits_per_character("eleven_multilingual_v2")
+        1.0
+        >>> get_credits_per_character("eleven_flash_v2_5")
+        0.5
+    """
+    model_id_lower = (model_id or "").lower()
+    if any(pattern in model_id_lower for pattern in DISCOUNTED_CREDIT_PATTERNS):
+        return DISCOUNTED_CREDITS_PER_CHARACTER
+    return 1.0
+
+
+def supports_request_stitching(model_id: str) -> bool:
+    """Check if a model accepts neighbouring text as context for a request.
+
+    Request stitching sends the text before and after a chunk as
+    ``previous_text``/``next_text`` so chunks generated separately keep a
+    continuous prosody.
+
+    Args:
+        model_id (str): The model ID to check.
+
+    Returns:
+        bool: True if the model supports request stitching, False otherwise.
+
+    Examples:
+        >>> supports_request_stitching("eleven_multilingual_v2")
+        True
+        >>> supports_request_stitching("eleven_v3")
+        False
+    """
+    if not model_id:
+        return False
+    model_id_lower = model_id.lower()
+    return not any(
+        pattern in model_id_lower for pattern in REQUEST_STITCHING_UNSUPPORTED_PATTERNS
+    )
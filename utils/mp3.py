@@ -0,0 +1,423 @@
+"""MP3 helpers for indexing, joining and cutting generated clips.
+
+MP3 is a sequence of frames, each starting with a 4-byte header that gives
+its size and the number of samples it holds. :func:`index_mp3` walks those
+headers without decoding any audio, which is enough for a clip's duration
+and bitrate and for joining or cutting clips at frame boundaries with no
+re-encoding. Joined clips drop the ID3 tags and the Xing/Info header frame
+of all but the first clip, or players would find tags in the middle of the
+stream and report the first clip's length.
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO
+
+ID3V2_HEADER_SIZE = 10
+ID3V1_TAG_SIZE = 128
+FRAME_HEADER_SIZE = 4
+# read_mp3_info reads this much audio; longer files are measured from it
+MP3_INFO_SCAN_BYTES = 64 * 1024
+
+# MPEG version bits to version; 1 is reserved
+_MPEG_VERSIONS = {0: "2.5", 2: "2", 3: "1"}
+
+# Layer bits to layer; 0 is reserved
+_LAYERS = {1: 3, 2: 2, 3: 1}
+
+# Bitrates in kbps by (MPEG-1 or not, layer), for bitrate indexes 1-14
+_BITRATES = {
+    (True, 1): (32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Sample rates in Hz by version, for sample rate indexes 0-2
+_SAMPLE_RATES = {
+    "1": (44100, 48000, 32000),
+    "2": (22050, 24000, 16000),
+    "2.5": (11025, 12000, 8000),
+}
+
+# Encoder info frames (Xing/Info from LAME, VBRI from Fraunhofer) carry no
+# audio; they sit in the first frame, shortly after its header
+_INFO_FRAME_TAGS = (b"Xing", b"Info", b"VBRI")
+_INFO_FRAME_SEARCH_BYTES = 48
+
+
+def parse_frame_header(header: bytes) -> dict[str, Any] | None:
+    """Parse a 4-byte MPEG audio frame header.
+
+    Args:
+        header (bytes): At least the 4 header bytes.
+
+    Returns:
+        Optional[Dict[str, Any]]: Dictionary with:
+        - version: MPEG version ("1", "2" or "2.5")
+        - layer: Layer (1, 2 or 3)
+        - bitrate: Bitrate in kbps
+        - sample_rate: Sample rate in Hz
+        - samples: Samples per channel in the frame
+        - channels: 1 for mono, 2 otherwise
+        - frame_size: Bytes in the frame, header included
+        None if the bytes are not a valid header (free-format frames included).
+    """
+    if len(header) < FRAME_HEADER_SIZE or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = _MPEG_VERSIONS.get((header[1] >> 3) & 0x03)
+    layer = _LAYERS.get((header[1] >> 1) & 0x03)
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    if (
+        version is None
+        or layer is None
+        or bitrate_index in (0, 15)
+        or sample_rate_index == 3
+    ):
+        return None
+
+    bitrate = _BITRATES[(version == "1", layer)][bitrate_index - 1]
+    sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+    padding = (header[2] >> 1) & 0x01
+    if layer == 1:
+        samples = 384
+        frame_size = (12 * bitrate * 1000 // sample_rate + padding) * 4
+    else:
+        samples = 1152 if layer == 2 or version == "1" else 576
+        frame_size = samples // 8 * bitrate * 1000 // sample_rate + padding
+    return {
+        "version": version,
+        "layer": layer,
+        "bitrate": bitrate,
+        "sample_rate": sample_rate,
+        "samples": samples,
+        "channels": 1 if header[3] >> 6 == 3 else 2,
+        "frame_size": frame_size,
+    }
+
+
+def id3v2_size(data: bytes) -> int:
+    """Get the size of an ID3v2 tag at the start of MP3 data.
+
+    Args:
+        data (bytes): Start of the MP3 data (at least 10 bytes for a tag).
+
+    Returns:
+        int: Bytes taken by the tag, including header and footer; 0 if there
+        is no tag.
+    """
+    if len(data) < ID3V2_HEADER_SIZE or data[:3] != b"ID3":
+        return 0
+    # The tag size is a 28-bit "syncsafe" integer: 7 bits per byte
+    size = 0
+    for byte in data[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    has_footer = bool(data[5] & 0x10)
+    return ID3V2_HEADER_SIZE + size + (ID3V2_HEADER_SIZE if has_footer else 0)
+
+
+def _audio_end(data: bytes, start: int) -> int:
+    """Get the end of the audio in MP3 data, before a trailing ID3v1 tag."""
+    end = len(data)
+    if (
+        end - start >= ID3V1_TAG_SIZE
+        and data[end - ID3V1_TAG_SIZE : end - 125] == b"TAG"
+    ):
+        end -= ID3V1_TAG_SIZE
+    return end
+
+
+def strip_id3(data: bytes, keep_id3v2: bool = False) -> bytes:
+    """Remove ID3 tags from MP3 data, leaving only audio frames.
+
+    Args:
+        data (bytes): Complete MP3 file contents.
+        keep_id3v2 (bool): Keep a leading ID3v2 tag (default: False).
+
+    Returns:
+        bytes: The MP3 data without a trailing ID3v1 tag and, unless
+        ``keep_id3v2`` is set, without a leading ID3v2 tag.
+    """
+    start = 0 if keep_id3v2 else id3v2_size(data)
+    return data[start : _audio_end(data, start)]
+
+
+def _next_sync(data: bytes, offset: int, end: int) -> int:
+    """Find the next byte that could start a frame header after ``offset``."""
+    found = data.find(b"\xff", offset + 1, end)
+    return found if found >= 0 else end
+
+
+def _is_info_frame(data: bytes, offset: int, size: int) -> bool:
+    """Check whether a frame is an encoder info frame rather than audio."""
+    body = data[
+        offset + FRAME_HEADER_SIZE : offset + min(size, _INFO_FRAME_SEARCH_BYTES)
+    ]
+    return any(tag in body for tag in _INFO_FRAME_TAGS)
+
+
+def index_mp3(data: bytes) -> dict[str, Any]:
+    """Index the audio frames of MP3 data without decoding them.
+
+    The ID3v2 tag at the start and an ID3v1 tag at the end are skipped.
+    Bytes that are not frames are skipped too, resyncing on the next header
+    that is followed by another valid header. A frame cut off by the end of
+    the data is left out.
+
+    Args:
+        data (bytes): Complete MP3 file contents.
+
+    Returns:
+        Dict[str, Any]: Dictionary with:
+        - id3v2_size: Bytes taken by a leading ID3v2 tag (0 if none)
+        - frames: (offset, size) of each audio frame, in order
+        - info_frame: (offset, size) of an encoder info frame, or None
+        - sample_rate, channels: From the first frame (0 if no frames)
+        - duration: Length of the audio in seconds
+        - bitrate: Average bitrate of the audio frames in kbps
+        - frame_duration: Seconds per frame (0.0 if no frames)
+    """
+    start = id3v2_size(data)
+    end = _audio_end(data, start)
+    frames: list[tuple[int, int]] = []
+    info_frame = None
+    first = None
+    offset = start
+    locked = False
+    while offset + FRAME_HEADER_SIZE <= end:
+        header = parse_frame_header(data[offset : offset + FRAME_HEADER_SIZE])
+        if header is None or (locked and header["sample_rate"] != first["sample_rate"]):
+            locked = False
+            offset = _next_sync(data, offset, end)
+            continue
+        size = header["frame_size"]
+        if not locked:
+            # A lone sync pattern in other data is not enough: the next
+            # frame has to start right where this one says it ends
+            following = data[offset + size : offset + size + FRAME_HEADER_SIZE]
+            if offset + size > end or (
+                offset + size < end and parse_frame_header(following) is None
+            ):
+                offset = _next_sync(data, offset, end)
+                continue
+            locked = True
+        elif offset + size > end:
+            # The last frame was cut off
+            break
+        if first is None:
+            first = header
+            if _is_info_frame(data, offset, size):
+                info_frame = (offset, size)
+                offset += size
+                continue
+        frames.append((offset, size))
+        offset += size
+
+    frame_duration = first["samples"] / first["sample_rate"] if first else 0.0
+    duration = len(frames) * frame_duration
+    audio_bytes = sum(size for _, size in frames)
+    return {
+        "id3v2_size": start,
+        "frames": frames,
+        "info_frame": info_frame,
+        "sample_rate": first["sample_rate"] if first else 0,
+        "channels": first["channels"] if first else 0,
+        "duration": duration,
+        "bitrate": round(audio_bytes * 8 / duration / 1000) if duration else 0,
+        "frame_duration": frame_duration,
+    }
+
+
+def _info_frame_count(frame: bytes) -> int | None:
+    """Get the audio frame count stored in an encoder info frame, if any."""
+    for tag in (b"Xing", b"Info"):
+        at = frame.find(tag, FRAME_HEADER_SIZE, _INFO_FRAME_SEARCH_BYTES)
+        if at >= 0:
+            # 4 flag bytes follow the tag; bit 0 means a frame count follows
+            fields = frame[at + 4 : at + 12]
+            if len(fields) == 8 and fields[3] & 0x01:
+                return int.from_bytes(fields[4:8], "big")
+            return None
+    at = frame.find(b"VBRI", FRAME_HEADER_SIZE, _INFO_FRAME_SEARCH_BYTES)
+    if at >= 0 and len(frame) >= at + 18:
+        # Version, delay and quality (2 bytes each) and the byte count come first
+        return int.from_bytes(frame[at + 14 : at + 18], "big")
+    return None
+
+
+def read_mp3_info(path: str) -> dict[str, Any]:
+    """Get the duration and bitrate of an MP3 file.
+
+    Only the tags and the first ``MP3_INFO_SCAN_BYTES`` of audio are read.
+    Files that fit in that window are indexed frame by frame. For longer
+    files the frame count comes from the encoder info frame if it has one,
+    and is otherwise estimated from the audio size and the average size of
+    the frames read, which is exact to a frame for constant-bitrate files
+    such as ElevenLabs output.
+
+    Args:
+        path (str): Path to the MP3 file.
+
+    Returns:
+        Dict[str, Any]: Dictionary with:
+        - duration: Length of the audio in seconds
+        - bitrate: Average bitrate in kbps
+        - sample_rate, channels: From the first frame
+        - frames: Number of audio frames
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        end = os.fstat(f.fileno()).st_size
+        start = id3v2_size(f.read(ID3V2_HEADER_SIZE))
+        if end - start >= ID3V1_TAG_SIZE:
+            f.seek(end - ID3V1_TAG_SIZE)
+            if f.read(3) == b"TAG":
+                end -= ID3V1_TAG_SIZE
+        f.seek(start)
+        head = f.read(min(end - start, MP3_INFO_SCAN_BYTES))
+
+    index = index_mp3(head)
+    frames = index["frames"]
+    if frames and start + len(head) < end:
+        info_frame = index["info_frame"]
+        count = None
+        if info_frame:
+            offset, size = info_frame
+            count = _info_frame_count(head[offset : offset + size])
+        if count is None:
+            first_offset = frames[0][0]
+            average_size = sum(size for _, size in frames) / len(frames)
+            count = round((end - start - first_offset) / average_size)
+        duration = count * index["frame_duration"]
+        audio_bytes = end - start - frames[0][0]
+        bitrate = round(audio_bytes * 8 / duration / 1000) if duration else 0
+    else:
+        count = len(frames)
+        duration = index["duration"]
+        bitrate = index["bitrate"]
+    return {
+        "duration": duration,
+        "bitrate": bitrate,
+        "sample_rate": index["sample_rate"],
+        "channels": index["channels"],
+        "frames": count,
+    }
+
+
+def _frame_spans(frames: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge adjacent frames into (start, end) byte ranges."""
+    spans: list[tuple[int, int]] = []
+    for offset, size in frames:
+        if spans and spans[-1][1] == offset:
+            spans[-1] = (spans[-1][0], offset + size)
+        else:
+            spans.append((offset, offset + size))
+    return spans
+
+
+def _write_frames(data: bytes, frames: list[tuple[int, int]], out: BinaryIO) -> int:
+    """Write frames of MP3 data to a file object, returning bytes written."""
+    view = memoryview(data)
+    written = 0
+    for span_start, span_end in _frame_spans(frames):
+        out.write(view[span_start:span_end])
+        written += span_end - span_start
+    return written
+
+
+def concat_mp3_files(paths: list[str], out: BinaryIO) -> int:
+    """Join MP3 files into one stream at frame boundaries.
+
+    The first file keeps its leading ID3v2 tag. All other tags, encoder info
+    frames and bytes between frames are dropped. Data with no recognisable
+    frames is copied as it is, less its tags.
+
+    Args:
+        paths (List[str]): MP3 files in playback order.
+        out (BinaryIO): File object the joined MP3 is written to.
+
+    Returns:
+        int: Number of bytes written.
+    """
+    written = 0
+    for number, path in enumerate(paths):
+        with open(path, "rb") as f:
+            data = f.read()
+        index = index_mp3(data)
+        if not index["frames"]:
+            stripped = strip_id3(data, keep_id3v2=number == 0)
+            out.write(stripped)
+            written += len(stripped)
+            continue
+        if number == 0 and index["id3v2_size"]:
+            out.write(data[: index["id3v2_size"]])
+            written += index["id3v2_size"]
+        written += _write_frames(data, index["frames"], out)
+    return written
+
+
+def slice_mp3(data: bytes, start: float = 0.0, end: float | None = None) -> bytes:
+    """Cut MP3 data to the frames between two points in time.
+
+    A frame is kept if it starts at or after ``start`` and before ``end``, so
+    the cut is accurate to one frame (about 26 ms at 44.1 kHz). The leading
+    ID3v2 tag is kept; an encoder info frame is dropped, as its length no
+    longer matches. Layer III frames can borrow bits from the frame before
+    them, so a decoder may skip the first frame of a cut.
+
+    Args:
+        data (bytes): Complete MP3 file contents.
+        start (float): Start in seconds (default: 0.0).
+        end (Optional[float]): End in seconds; the end of the audio if None.
+
+    Returns:
+        bytes: The cut MP3 data.
+    """
+    index = index_mp3(data)
+    frame_duration = index["frame_duration"]
+    frames = [
+        frame
+        for number, frame in enumerate(index["frames"])
+        if number * frame_duration >= start
+        and (end is None or number * frame_duration < end)
+    ]
+    out = bytearray(data[: index["id3v2_size"]])
+    for span_start, span_end in _frame_spans(frames):
+        out += data[span_start:span_end]
+    return bytes(out)
+
+
+def skip_id3v2_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Drop a leading ID3v2 tag from MP3 data arriving in pieces.
+
+    Only the bytes up to the end of the tag are held back; everything after
+    it is passed on as soon as it arrives.
+
+    Args:
+        chunks (Iterable[bytes]): MP3 data in order, e.g. a streamed response.
+
+    Yields:
+        bytes: The data without its leading ID3v2 tag.
+    """
+    iterator = iter(chunks)
+    head = b""
+    for chunk in iterator:
+        head += chunk
+        if len(head) < ID3V2_HEADER_SIZE and b"ID3".startswith(head[:3]):
+            # Too short to tell whether a tag starts here
+            continue
+        tag_size = id3v2_size(head)
+        if len(head) < tag_size:
+            continue
+        if head[tag_size:]:
+            yield head[tag_size:]
+        break
+    else:
+        # Stream ended inside the header or tag: nothing but tag data
+        return
+    yield from iterator
@@ -0,0 +1,281 @@
+"""Rate-limit-aware request scheduling for ElevenTools.
+
+ElevenLabs limits how many requests a subscription tier may run at once and
+answers with HTTP 429 when the limit is exceeded. This module provides a
+scheduler that sits in front of API calls in bulk runs: a token bucket caps the
+request rate, and the number of requests in flight adapts to what the server
+accepts, halving on 429/5xx responses and growing again after a run of
+successes. Calls rejected with 429 wait for ``Retry-After`` (or an exponential
+backoff) and are then run again instead of failing the job. A 5xx also slows
+everyone down, but the call is not run again: the server may already have
+generated and billed the clip, so the error is raised and the row is left for
+a resumed run.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from utils.error_handling import TransientAPIError
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses that mean "try again later" rather than "this request is wrong"
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Statuses that mean the server did not process the request at all, so even
+# paid, non-idempotent requests may be sent again
+REJECTED_STATUS_CODES = (429,)
+
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+DEFAULT_MAX_THROTTLE_RETRIES = 5
+THROTTLE_BACKOFF_BASE = 1.0  # Seconds, doubled per consecutive throttle
+THROTTLE_BACKOFF_MAX = 60.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header value.
+
+    Args:
+        value (Optional[str]): Header value, either delay seconds or an HTTP date.
+
+    Returns:
+        Optional[float]: Seconds to wait (never negative), or None if the value
+        is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def transient_error_from_response(
+    response: Any, message: str
+) -> TransientAPIError | None:
+    """Build a :class:`TransientAPIError` for a throttled or overloaded response.
+
+    Args:
+        response (requests.Response): Response to inspect.
+        message (str): Error message to use.
+
+    Returns:
+        Optional[TransientAPIError]: The error if the status is retryable,
+        otherwise None.
+    """
+    status_code = getattr(response, "status_code", None)
+    if status_code not in RETRYABLE_STATUS_CODES:
+        return None
+    return TransientAPIError(
+        message,
+        f"HTTP {status_code}",
+        status_code=status_code,
+        retry_after=parse_retry_after(response.headers.get("Retry-After")),
+    )
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the average request rate.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum tokens held, i.e. the allowed burst size.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initialize a full bucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (Optional[float]): Burst size (default: one second's worth).
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveScheduler:
+    """Run API calls with a rate limit and an adaptive concurrency limit.
+
+    Concurrency starts at ``max_concurrency``. A throttled call (a
+    :class:`TransientAPIError`) halves the limit and pauses every caller for the
+    server's ``Retry-After`` or an exponential backoff; after ``limit``
+    consecutive successes the limit grows by one again (AIMD). Only calls the
+    server rejected without processing them (``retry_statuses``, 429 by
+    default) are run again; any other transient error is raised at once, as
+    the paid request may already have been carried out.
+
+    Attributes:
+        max_concurrency (int): Upper bound for calls in flight.
+        min_concurrency (int): Lower bound for calls in flight.
+        max_retries (int): Throttled attempts per call before giving up.
+        retry_statuses (Tuple[int, ...]): Statuses whose calls are run again.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        min_concurrency: int = 1,
+        max_retries: int = DEFAULT_MAX_THROTTLE_RETRIES,
+        retry_statuses: tuple[int, ...] = REJECTED_STATUS_CODES,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency (int): Upper bound for calls in flight.
+            requests_per_second (float): Average request rate (default: 5).
+            min_concurrency (int): Lower bound for calls in flight (default: 1).
+            max_retries (int): Throttled attempts per call before the error is
+                raised (default: 5).
+            retry_statuses (Tuple[int, ...]): Statuses whose calls are run
+                again (default: 429 only).
+        """
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self.min_concurrency = max(min(int(min_concurrency), self.max_concurrency), 1)
+        self.max_retries = max_retries
+        self.retry_statuses = tuple(retry_statuses)
+        self._bucket = TokenBucket(requests_per_second, capacity=self.max_concurrency)
+        self._cond = threading.Condition()
+        self._limit = self.max_concurrency
+        self._active = 0
+        self._successes = 0
+        self._consecutive_throttles = 0
+        self._paused_until = 0.0
+        self._stats = {"calls": 0, "throttled": 0, "retries": 0}
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        with self._cond:
+            return self._limit
+
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call ``func`` once a slot and a token are free, retrying rejected calls.
+
+        Args:
+            func (Callable[..., Any]): API call to run.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            Any: Whatever ``func`` returns.
+
+        Raises:
+            TransientAPIError: If the call failed with a status outside
+                ``retry_statuses``, or is still throttled after
+                ``max_retries`` attempts.
+            Exception: Any other error raised by ``func``.
+        """
+        attempt = 0
+        while True:
+            self._acquire_slot()
+            self._bucket.acquire()
+            try:
+                result = func(*args, **kwargs)
+            except TransientAPIError as e:
+                attempt += 1
+                self._on_throttle(e)
+                if e.status_code not in self.retry_statuses:
+                    raise
+                if attempt > self.max_retries:
+                    raise
+                with self._cond:
+                    self._stats["retries"] += 1
+                continue
+            finally:
+                self._release_slot()
+            self._on_success()
+            return result
+
+    def get_stats(self) -> dict[str, int]:
+        """Get scheduler counters.
+
+        Returns:
+            Dict[str, int]: calls (successful), throttled (429/5xx responses),
+            retries (throttled calls run again) and limit (current concurrency).
+        """
+        with self._cond:
+            return {**self._stats, "limit": self._limit}
+
+    def _acquire_slot(self) -> None:
+        """Wait until the scheduler is not paused and below its limit."""
+        with self._cond:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0 and self._active < self._limit:
+                    self._active += 1
+                    return
+                self._cond.wait(timeout=wait if wait > 0 else None)
+
+    def _release_slot(self) -> None:
+        """Return a slot and wake waiting callers."""
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def _on_success(self) -> None:
+        """Count a success and raise the limit after a full window of them."""
+        with self._cond:
+            self._stats["calls"] += 1
+            self._consecutive_throttles = 0
+            self._successes += 1
+            if self._successes >= self._limit and self._limit < self.max_concurrency:
+                self._limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def _on_throttle(self, error: TransientAPIError) -> None:
+        """Halve the limit and pause all callers after a throttled call.
+
+        Args:
+            error (TransientAPIError): The throttling error.
+        """
+        with self._cond:
+            self._stats["throttled"] += 1
+            self._consecutive_throttles += 1
+            self._successes = 0
+            self._limit = max(self._limit // 2, self.min_concurrency)
+            delay = error.retry_after
+            if delay is None:
+                delay = min(
+                    THROTTLE_BACKOFF_BASE * 2 ** (self._consecutive_throttles - 1),
+                    THROTTLE_BACKOFF_MAX,
+                )
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            logger.warning(
+                "API throttled (HTTP %s); pausing %.1fs, concurrency now %s",
+                error.status_code,
+                delay,
+                self._limit,
+            )
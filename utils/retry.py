@@ -0,0 +1,384 @@
+"""Shared retry policy for ElevenLabs and OpenRouter API calls.
+
+Transient failures (dropped connections, timeouts, 429 and 5xx responses) are
+retried with full-jitter exponential backoff, bounded by a maximum number of
+attempts and a total deadline. Retries are idempotency-aware: paid, non-
+idempotent requests such as speech generation are only sent again when the
+previous attempt provably never reached the server (the connection could not
+be opened) or the server explicitly rejected it, so a retry can never produce
+a second billed generation. Per-operation counters are kept for diagnostics.
+The same policy covers ``requests`` calls and, through :meth:`RetryPolicy.send_async`,
+``httpx`` calls made by the asyncio client.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+try:
+    import requests
+    from urllib3.exceptions import NewConnectionError
+except ImportError:
+    requests = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from utils.rate_limiter import (
+    REJECTED_STATUS_CODES,
+    RETRYABLE_STATUS_CODES,
+    parse_retry_after,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY = 0.5  # Seconds, doubled per attempt before jitter
+DEFAULT_MAX_DELAY = 8.0
+DEFAULT_DEADLINE = 60.0  # Seconds across all attempts, including waits
+
+_stats_lock = threading.Lock()
+_retry_stats: dict[str, dict[str, int]] = {}
+
+
+def _record(operation: str, counter: str) -> None:
+    """Increment a retry counter for an operation.
+
+    Args:
+        operation (str): Name of the API operation.
+        counter (str): One of "attempts", "retries" or "gave_up".
+    """
+    with _stats_lock:
+        stats = _retry_stats.setdefault(
+            operation, {"attempts": 0, "retries": 0, "gave_up": 0}
+        )
+        stats[counter] += 1
+
+
+def _request_not_sent(error: Exception) -> bool:
+    """Check whether a request failed before reaching the server.
+
+    Args:
+        error (Exception): Exception raised by ``requests``.
+
+    Returns:
+        bool: True if the connection could not be opened at all.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        return isinstance(getattr(error.args[0], "reason", None), NewConnectionError)
+    return False
+
+
+def is_retryable_error(error: Exception, idempotent: bool) -> bool:
+    """Decide whether a failed request may be sent again.
+
+    Args:
+        error (Exception): Exception raised while sending the request.
+        idempotent (bool): Whether repeating the request is harmless.
+
+    Returns:
+        bool: True if the request should be retried.
+    """
+    if httpx is not None and isinstance(error, httpx.TransportError):
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return True
+        return idempotent and isinstance(
+            error, (httpx.ReadTimeout, httpx.ReadError, httpx.RemoteProtocolError)
+        )
+    if _request_not_sent(error):
+        return True
+    return idempotent and isinstance(
+        error,
+        (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ),
+    )
+
+
+class RetryPolicy:
+    """Retry transient request failures with jittered exponential backoff.
+
+    Attributes:
+        max_attempts (int): Maximum attempts per call, including the first.
+        base_delay (float): Backoff ceiling for the first retry in seconds.
+        max_delay (float): Upper bound for a single backoff in seconds.
+        deadline (float): Maximum seconds a call may spend across all attempts.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        deadline: float = DEFAULT_DEADLINE,
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_attempts (int): Maximum attempts per call (default: 3).
+            base_delay (float): First backoff ceiling in seconds (default: 0.5).
+            max_delay (float): Longest single backoff in seconds (default: 8).
+            deadline (float): Total time budget in seconds (default: 60).
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    def send(
+        self,
+        operation: str,
+        request: Callable[[], Any],
+        idempotent: bool,
+        retry_statuses: Iterable[int] | None = None,
+    ) -> Any:
+        """Send a request, retrying transient failures.
+
+        Responses with a status in ``retry_statuses`` are closed and retried
+        while attempts and time remain; the last response is returned as is so
+        the caller's usual status handling applies.
+
+        Args:
+            operation (str): Name of the API operation, used for counters and logs.
+            request (Callable[[], requests.Response]): Sends the request once.
+            idempotent (bool): Whether repeating the request is harmless. Non-
+                idempotent requests are only retried when they never reached
+                the server or were rejected with HTTP 429.
+            retry_statuses (Optional[Iterable[int]]): Statuses to retry. Defaults
+                to 429 and 5xx for idempotent requests and 429 otherwise.
+
+        Returns:
+            requests.Response: The final response.
+
+        Raises:
+            requests.exceptions.RequestException: If the request cannot be sent
+                and the failure is not retryable or retries are exhausted.
+        """
+        if retry_statuses is None:
+            retry_statuses = (
+                RETRYABLE_STATUS_CODES if idempotent else REJECTED_STATUS_CODES
+            )
+        retry_statuses = tuple(retry_statuses)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            _record(operation, "attempts")
+            try:
+                response = request()
+            except requests.exceptions.RequestException as e:
+                if not is_retryable_error(e, idempotent):
+                    raise
+                if not self._wait(operation, attempt, started, None, str(e)):
+                    raise
+                continue
+
+            if response.status_code in retry_statuses:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                reason = f"HTTP {response.status_code}"
+                if self._wait(operation, attempt, started, retry_after, reason):
+                    response.close()
+                    continue
+            return response
+
+    async def send_async(
+        self,
+        operation: str,
+        request: Callable[[], Awaitable[Any]],
+        idempotent: bool,
+        retry_statuses: Iterable[int] | None = None,
+    ) -> Any:
+        """Send an ``httpx`` request from a coroutine, retrying transient failures.
+
+        Behaves like :meth:`send`, but awaits ``request`` and sleeps with
+        ``asyncio.sleep`` so other tasks keep running during the backoff.
+
+        Args:
+            operation (str): Name of the API operation, used for counters and logs.
+            request (Callable[[], Awaitable[httpx.Response]]): Sends the request once.
+            idempotent (bool): Whether repeating the request is harmless.
+            retry_statuses (Optional[Iterable[int]]): Statuses to retry; see
+                :meth:`send`.
+
+        Returns:
+            httpx.Response: The final response.
+
+        Raises:
+            httpx.TransportError: If the request cannot be sent and the failure
+                is not retryable or retries are exhausted.
+        """
+        if retry_statuses is None:
+            retry_statuses = (
+                RETRYABLE_STATUS_CODES if idempotent else REJECTED_STATUS_CODES
+            )
+        retry_statuses = tuple(retry_statuses)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            _record(operation, "attempts")
+            try:
+                response = await request()
+            except httpx.TransportError as e:
+                if not is_retryable_error(e, idempotent):
+                    raise
+                delay = self._next_delay(operation, attempt, started, None, str(e))
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code in retry_statuses:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                reason = f"HTTP {response.status_code}"
+                delay = self._next_delay(
+                    operation, attempt, started, retry_after, reason
+                )
+                if delay is not None:
+                    await response.aclose()
+                    await asyncio.sleep(delay)
+                    continue
+            return response
+
+    def _wait(
+        self,
+        operation: str,
+        attempt: int,
+        started: float,
+        retry_after: float | None,
+        reason: str,
+    ) -> bool:
+        """Sleep before the next attempt if the policy allows one.
+
+        Args:
+            operation (str): Name of the API operation.
+            attempt (int): Number of the attempt that just failed.
+            started (float): ``time.monotonic()`` when the call began.
+            retry_after (Optional[float]): Server-requested delay, if any.
+            reason (str): Failure description for the log.
+
+        Returns:
+            bool: True if the caller should retry, False to give up.
+        """
+        delay = self._next_delay(operation, attempt, started, retry_after, reason)
+        if delay is None:
+            return False
+        time.sleep(delay)
+        return True
+
+    def _next_delay(
+        self,
+        operation: str,
+        attempt: int,
+        started: float,
+        retry_after: float | None,
+        reason: str,
+    ) -> float | None:
+        """Decide how long to back off before the next attempt.
+
+        Args:
+            operation (str): Name of the API operation.
+            attempt (int): Number of the attempt that just failed.
+            started (float): ``time.monotonic()`` when the call began.
+            retry_after (Optional[float]): Server-requested delay, if any.
+            reason (str): Failure description for the log.
+
+        Returns:
+            Optional[float]: Seconds to wait, or None to give up.
+        """
+        delay = random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        elapsed = time.monotonic() - started
+        if attempt >= self.max_attempts or elapsed + delay > self.deadline:
+            _record(operation, "gave_up")
+            return None
+
+        _record(operation, "retries")
+        logger.warning(
+            "%s failed (%s), retrying in %.2fs (attempt %s of %s)",
+            operation,
+            reason,
+            delay,
+            attempt + 1,
+            self.max_attempts,
+        )
+        return delay
+
+
+default_retry_policy = RetryPolicy()
+
+
+def send_with_retry(
+    operation: str,
+    request: Callable[[], Any],
+    idempotent: bool,
+    retry_statuses: Iterable[int] | None = None,
+) -> Any:
+    """Send a request using the shared default policy.
+
+    Args:
+        operation (str): Name of the API operation.
+        request (Callable[[], requests.Response]): Sends the request once.
+        idempotent (bool): Whether repeating the request is harmless.
+        retry_statuses (Optional[Iterable[int]]): Statuses to retry; see
+            :meth:`RetryPolicy.send`.
+
+    Returns:
+        requests.Response: The final response.
+    """
+    return default_retry_policy.send(operation, request, idempotent, retry_statuses)
+
+
+async def send_with_retry_async(
+    operation: str,
+    request: Callable[[], Awaitable[Any]],
+    idempotent: bool,
+    retry_statuses: Iterable[int] | None = None,
+) -> Any:
+    """Send an ``httpx`` request from a coroutine using the shared default policy.
+
+    Args:
+        operation (str): Name of the API operation.
+        request (Callable[[], Awaitable[httpx.Response]]): Sends the request once.
+        idempotent (bool): Whether repeating the request is harmless.
+        retry_statuses (Optional[Iterable[int]]): Statuses to retry; see
+            :meth:`RetryPolicy.send`.
+
+    Returns:
+        httpx.Response: The final response.
+    """
+    return await default_retry_policy.send_async(
+        operation, request, idempotent, retry_statuses
+    )
+
+
+def get_retry_stats() -> dict[str, dict[str, int]]:
+    """Get retry counters per operation.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Mapping of operation name to a dict with:
+        - attempts: Requests sent, including retries
+        - retries: Attempts that were retried after a transient failure
+        - gave_up: Calls that still failed when retries ran out
+    """
+    with _stats_lock:
+        return {name: dict(stats) for name, stats in _retry_stats.items()}
+
+
+def reset_retry_stats() -> None:
+    """Reset all retry counters."""
+    with _stats_lock:
+        _retry_stats.clear()
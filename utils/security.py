@@ -11,6 +11,10 @@ import re
 # Security limits
 MAX_CSV_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_DF_ROWS = 1000
+# Bulk CSVs are parsed in chunks (scripts/bulk_preprocessing.py), so they may
+# be larger than other uploads
+MAX_BULK_CSV_SIZE = 50 * 1024 * 1024  # 50MB
+MAX_BULK_ROWS = 10000
 MAX_TEXT_LENGTH = 10000
 MAX_FILENAME_LENGTH = 100
 
@@ -0,0 +1,109 @@
+"""Sentence-boundary text chunking for long text-to-speech requests.
+
+Long scripts are split into chunks that are generated as separate requests
+and stitched back together (see :func:`scripts.Elevenlabs_functions.generate_audio`).
+Chunks end at sentence boundaries where possible, then at clause boundaries,
+then between words; a single word longer than a chunk is cut. Joining the
+chunks with single spaces gives back the text up to whitespace.
+"""
+
+import re
+
+from utils.model_capabilities import get_character_limit
+
+# Texts longer than this are generated in chunks of at most this many
+# characters; short requests finish well inside the request timeout
+DEFAULT_CHUNK_CHARS = 1500
+
+# Characters of neighbouring chunks sent as context for request stitching
+STITCHING_CONTEXT_CHARS = 300
+
+# Boundaries tried in order: sentence ends (with closing quotes or brackets),
+# clause punctuation, then any whitespace
+_BOUNDARIES = (
+    re.compile(r"(?<=[.!?…])[\"'”’)\]]*\s+"),
+    re.compile(r"(?<=[,;:])\s+"),
+    re.compile(r"\s+"),
+)
+
+
+def get_chunk_size(model_id: str, max_chars: int = DEFAULT_CHUNK_CHARS) -> int:
+    """Get the chunk size for a model's text-to-speech requests.
+
+    Args:
+        model_id (str): The model ID.
+        max_chars (int): Preferred chunk size (default: 1500).
+
+    Returns:
+        int: ``max_chars``, or the model's character limit if that is lower.
+    """
+    return min(max_chars, get_character_limit(model_id))
+
+
+def _split_at(text: str, boundary: re.Pattern) -> list[str]:
+    """Split text after every match of a boundary, keeping the separators.
+
+    Args:
+        text (str): Text to split.
+        boundary (re.Pattern): Separator pattern.
+
+    Returns:
+        List[str]: Segments whose concatenation is ``text``.
+    """
+    segments = []
+    start = 0
+    for match in boundary.finditer(text):
+        if match.end() > start:
+            segments.append(text[start : match.end()])
+            start = match.end()
+    if start < len(text):
+        segments.append(text[start:])
+    return segments
+
+
+def _pieces(text: str, max_chars: int, level: int = 0) -> list[str]:
+    """Break text into pieces of at most ``max_chars`` at the coarsest boundary.
+
+    Args:
+        text (str): Text to break up.
+        max_chars (int): Maximum piece length, not counting trailing whitespace.
+        level (int): Index into the boundaries to try first.
+
+    Returns:
+        List[str]: Pieces whose concatenation is ``text``.
+    """
+    if len(text.rstrip()) <= max_chars:
+        return [text]
+    if level == len(_BOUNDARIES):
+        return [text[i : i + max_chars] for i in range(0, len(text), max_chars)]
+    pieces = []
+    for segment in _split_at(text, _BOUNDARIES[level]):
+        pieces.extend(_pieces(segment, max_chars, level + 1))
+    return pieces
+
+
+def split_text(text: str, max_chars: int = DEFAULT_CHUNK_CHARS) -> list[str]:
+    """Split text into chunks of at most ``max_chars`` characters.
+
+    Args:
+        text (str): Text to split.
+        max_chars (int): Maximum characters per chunk (default: 1500).
+
+    Returns:
+        List[str]: Stripped, non-empty chunks in order; a single chunk if the
+        text is short enough.
+    """
+    text = text.strip()
+    if len(text) <= max_chars:
+        return [text] if text else []
+
+    chunks = []
+    current = ""
+    for piece in _pieces(text, max_chars):
+        if current and len((current + piece).strip()) > max_chars:
+            chunks.append(current.strip())
+            current = piece
+        else:
+            current += piece
+    chunks.append(current.strip())
+    return [chunk for chunk in chunks if chunk]